@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy
+from shapely.geometry import LineString, MultiPolygon, Polygon, shape
+
+INPUT_DATA_DIRECTORY = Path(__file__).parents[1] / "tests" / "data" / "input"
+
+# Inputs that the algorithm (correctly) refuses to fix.
+INVALID = {"issues-182"}
+
+
+def read_geojson(name: str) -> dict[str, Any]:
+    with open((INPUT_DATA_DIRECTORY / name).with_suffix(".json")) as f:
+        data: dict[str, Any] = json.load(f)
+    return data
+
+
+def names(*types: str) -> list[str]:
+    """Returns the names of the input files with the given geometry types."""
+    return [
+        path.stem
+        for path in sorted(INPUT_DATA_DIRECTORY.glob("*.json"))
+        if path.stem not in INVALID and read_geojson(path.stem)["type"] in types
+    ]
+
+
+def feature_collection(names: list[str], repeat: int = 1) -> dict[str, Any]:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": read_geojson(name), "properties": {}}
+            for name in names * repeat
+        ],
+    }
+
+
+def shapes(names: list[str]) -> numpy.ndarray:
+    """Returns an array of the input shapes, as shapely geometries."""
+    return numpy.array([shape(read_geojson(name)) for name in names])
+
+
+def wobbly_ring(
+    vertices: int, lon: float = 180, lat: float = 0, radius: float = 20
+) -> numpy.ndarray:
+    """Returns a counterclockwise ring with lots of (deterministic) wobbles.
+
+    With the default `lon`, it crosses the antimeridian twice.
+    """
+    angles = numpy.linspace(0, 2 * numpy.pi, vertices, endpoint=False)
+    radii = radius * (1 + 0.1 * numpy.sin(97 * angles))
+    lons = (lon + radii * numpy.cos(angles) + 180) % 360 - 180
+    lats = lat + radii * numpy.sin(angles)
+    return numpy.column_stack((lons, lats))
+
+
+def wobbly_polygon(vertices: int) -> Polygon:
+    return Polygon(wobbly_ring(vertices))
+
+
+def polygon_with_holes(holes: int) -> Polygon:
+    """Returns a polygon split by the antimeridian, with a grid of small
+    holes (none of which cross the antimeridian) on both sides."""
+    side = int(numpy.ceil(numpy.sqrt(holes)))
+    centers = [
+        (lon, lat)
+        for lon in numpy.linspace(150, 210, side + 1)[:-1] + 30 / side
+        for lat in numpy.linspace(-30, 30, side + 1)[:-1] + 30 / side
+        if abs(lon - 180) > 60 / side
+    ][:holes]
+    radius = 10 / side
+    return Polygon(
+        [(150, -30), (-150, -30), (-150, 30), (150, 30)],
+        [wobbly_ring(8, lon=lon, lat=lat, radius=radius)[::-1] for lon, lat in centers],
+    )
+
+
+def multi_polygon(polygons: int) -> MultiPolygon:
+    """Returns a multi-polygon of small, disjoint polygons that each cross
+    the antimeridian."""
+    latitudes = numpy.linspace(-80, 80, polygons)
+    radius = min(1, 0.4 * (latitudes[1] - latitudes[0])) if polygons > 1 else 1
+    return MultiPolygon(
+        [Polygon(wobbly_ring(16, lat=lat, radius=radius)) for lat in latitudes]
+    )
+
+
+def wobbly_line_string(vertices: int) -> LineString:
+    return LineString(wobbly_ring(vertices))
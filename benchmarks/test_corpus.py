@@ -0,0 +1,142 @@
+"""Benchmarks for every public function over the test input corpus."""
+
+import copy
+from pathlib import Path
+
+import pytest
+import shapely.geometry
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import antimeridian
+
+from .conftest import feature_collection, names, read_geojson, shapes
+
+pytestmark = pytest.mark.filterwarnings("ignore::antimeridian.FixWindingWarning")
+
+POLYGONS = names("Polygon")
+MULTI_POLYGONS = names("MultiPolygon")
+LINE_STRINGS = names("LineString")
+MULTI_LINE_STRINGS = names("MultiLineString")
+ALL = POLYGONS + MULTI_POLYGONS + LINE_STRINGS + MULTI_LINE_STRINGS
+
+
+@pytest.mark.parametrize("name", POLYGONS)
+def test_fix_polygon(benchmark: BenchmarkFixture, name: str) -> None:
+    polygon = shapely.geometry.shape(read_geojson(name))
+    benchmark(antimeridian.fix_polygon, polygon)
+
+
+@pytest.mark.parametrize("name", MULTI_POLYGONS)
+def test_fix_multi_polygon(benchmark: BenchmarkFixture, name: str) -> None:
+    multi_polygon = shapely.geometry.shape(read_geojson(name))
+    benchmark(antimeridian.fix_multi_polygon, multi_polygon)
+
+
+@pytest.mark.parametrize("name", LINE_STRINGS)
+def test_fix_line_string(benchmark: BenchmarkFixture, name: str) -> None:
+    line_string = shapely.geometry.shape(read_geojson(name))
+    benchmark(antimeridian.fix_line_string, line_string, great_circle=True)
+
+
+@pytest.mark.parametrize("name", MULTI_LINE_STRINGS)
+def test_fix_multi_line_string(benchmark: BenchmarkFixture, name: str) -> None:
+    multi_line_string = shapely.geometry.shape(read_geojson(name))
+    benchmark(antimeridian.fix_multi_line_string, multi_line_string, great_circle=True)
+
+
+@pytest.mark.parametrize("name", ALL)
+def test_fix_geometry(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.fix_geometry, shapely.geometry.shape(read_geojson(name)))
+
+
+@pytest.mark.parametrize("name", ALL)
+def test_fix_shape(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.fix_shape, read_geojson(name))
+
+
+@pytest.mark.parametrize("name", POLYGONS + MULTI_POLYGONS)
+def test_segment_shape(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.segment_shape, read_geojson(name), great_circle=True)
+
+
+@pytest.mark.parametrize("name", POLYGONS + MULTI_POLYGONS)
+def test_bbox(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.bbox, read_geojson(name))
+
+
+@pytest.mark.parametrize("name", POLYGONS + MULTI_POLYGONS)
+def test_fixed_bbox(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.fixed_bbox, read_geojson(name))
+
+
+@pytest.mark.parametrize("name", POLYGONS + MULTI_POLYGONS)
+def test_centroid(benchmark: BenchmarkFixture, name: str) -> None:
+    benchmark(antimeridian.centroid, read_geojson(name))
+
+
+def test_fix_geojson(benchmark: BenchmarkFixture) -> None:
+    # fix_geojson mutates its input, so each round gets a fresh copy.
+    data = feature_collection(ALL)
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        antimeridian.fix_geojson,
+        setup=lambda: ((copy.deepcopy(data),), {}),
+        rounds=20,
+    )
+
+
+def test_segment_geojson(benchmark: BenchmarkFixture) -> None:
+    data = feature_collection(POLYGONS + MULTI_POLYGONS)
+    benchmark(antimeridian.segment_geojson, data, great_circle=True)
+
+
+def test_fix_geometries(benchmark: BenchmarkFixture) -> None:
+    benchmark(antimeridian.fix_geometries, shapes(ALL))
+
+
+def test_fix_wkb(benchmark: BenchmarkFixture) -> None:
+    benchmark(antimeridian.fix_wkb, shapely.to_wkb(shapes(ALL)))
+
+
+@pytest.mark.parametrize(
+    "geometry_names",
+    [POLYGONS + MULTI_POLYGONS, LINE_STRINGS + MULTI_LINE_STRINGS],
+    ids=["polygons", "line-strings"],
+)
+def test_fix_geoarrow(benchmark: BenchmarkFixture, geometry_names: list[str]) -> None:
+    benchmark(
+        antimeridian.fix_geoarrow, *shapely.to_ragged_array(shapes(geometry_names))
+    )
+
+
+def test_bboxes(benchmark: BenchmarkFixture) -> None:
+    benchmark(antimeridian.bboxes, shapes(POLYGONS + MULTI_POLYGONS))
+
+
+def test_bbox_geoarrow(benchmark: BenchmarkFixture) -> None:
+    ragged = shapely.to_ragged_array(shapes(POLYGONS + MULTI_POLYGONS))
+    benchmark(antimeridian.bbox_geoarrow, *ragged)
+
+
+@pytest.mark.parametrize("spherical", [False, True])
+def test_centroids(benchmark: BenchmarkFixture, spherical: bool) -> None:
+    benchmark(antimeridian.centroids, shapes(POLYGONS + MULTI_POLYGONS), spherical)
+
+
+def test_centroid_geoarrow(benchmark: BenchmarkFixture) -> None:
+    ragged = shapely.to_ragged_array(shapes(POLYGONS + MULTI_POLYGONS))
+    benchmark(antimeridian.centroid_geoarrow, *ragged)
+
+
+def test_fix_cache(benchmark: BenchmarkFixture) -> None:
+    # Warm, so this times lookups rather than fixing.
+    data = feature_collection(ALL)
+    cache = antimeridian.FixCache()
+    cache.fix_geojson(data, inplace=False)
+    benchmark(cache.fix_geojson, data, inplace=False)
+
+
+def test_disk_cache(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    data = feature_collection(ALL)
+    with antimeridian.DiskCache(tmp_path) as cache:
+        cache.fix_geojson(data, inplace=False)
+        benchmark(cache.fix_geojson, data, inplace=False)
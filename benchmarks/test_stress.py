@@ -0,0 +1,91 @@
+"""Benchmarks on large synthetic inputs."""
+
+import copy
+
+import numpy
+import pytest
+import shapely.geometry
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import antimeridian
+
+from .conftest import (
+    feature_collection,
+    multi_polygon,
+    names,
+    polygon_with_holes,
+    wobbly_line_string,
+    wobbly_polygon,
+)
+
+pytestmark = pytest.mark.filterwarnings("ignore::antimeridian.FixWindingWarning")
+
+VERTICES = [10_000, 100_000, 1_000_000]
+
+
+def run(benchmark: BenchmarkFixture, function: object, *args: object) -> None:
+    """Runs a slow function a few times, rather than calibrating."""
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        function, args=args, rounds=3, iterations=1
+    )
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_fix_polygon(benchmark: BenchmarkFixture, vertices: int) -> None:
+    run(benchmark, antimeridian.fix_polygon, wobbly_polygon(vertices))
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_fix_shape(benchmark: BenchmarkFixture, vertices: int) -> None:
+    shape = shapely.geometry.mapping(wobbly_polygon(vertices))
+    run(benchmark, antimeridian.fix_shape, shape)
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_fix_line_string(benchmark: BenchmarkFixture, vertices: int) -> None:
+    run(benchmark, antimeridian.fix_line_string, wobbly_line_string(vertices), True)
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_segment_shape(benchmark: BenchmarkFixture, vertices: int) -> None:
+    run(benchmark, antimeridian.segment_shape, wobbly_polygon(vertices), True)
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_bbox(benchmark: BenchmarkFixture, vertices: int) -> None:
+    run(benchmark, antimeridian.bbox, wobbly_polygon(vertices))
+
+
+@pytest.mark.parametrize("vertices", VERTICES)
+def test_centroid(benchmark: BenchmarkFixture, vertices: int) -> None:
+    run(benchmark, antimeridian.centroid, wobbly_polygon(vertices))
+
+
+@pytest.mark.parametrize("holes", [100, 1_000])
+def test_fix_polygon_with_holes(benchmark: BenchmarkFixture, holes: int) -> None:
+    run(benchmark, antimeridian.fix_polygon, polygon_with_holes(holes))
+
+
+@pytest.mark.parametrize("polygons", [100, 1_000])
+def test_fix_multi_polygon(benchmark: BenchmarkFixture, polygons: int) -> None:
+    run(benchmark, antimeridian.fix_multi_polygon, multi_polygon(polygons))
+
+
+@pytest.mark.parametrize("repeat", [100, 1_000])
+def test_fix_geojson_feature_collection(
+    benchmark: BenchmarkFixture, repeat: int
+) -> None:
+    data = feature_collection(names("Polygon", "MultiPolygon"), repeat)
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        antimeridian.fix_geojson,
+        setup=lambda: ((copy.deepcopy(data),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_fix_geometries(benchmark: BenchmarkFixture, count: int) -> None:
+    geometries = numpy.array(
+        [wobbly_polygon(100), wobbly_line_string(100)] * (count // 2)
+    )
+    run(benchmark, antimeridian.fix_geometries, geometries)
@@ -0,0 +1,44 @@
+"""Time fix_geometries on a thread pool with 1, 2, 4, and 8 threads.
+
+E.g.:
+
+    python scripts/benchmark_threads.py --count 2000 --vertices 1000
+"""
+
+import argparse
+import time
+
+import numpy
+import shapely
+
+import antimeridian
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--count", type=int, default=2000, help="number of polygons")
+parser.add_argument("--vertices", type=int, default=1000, help="vertices per polygon")
+parser.add_argument("--repeat", type=int, default=3, help="best of this many runs")
+args = parser.parse_args()
+
+# Wobbly rings centered on the antimeridian, so every polygon gets split.
+generator = numpy.random.default_rng(42)
+angles = numpy.linspace(0, 2 * numpy.pi, args.vertices, endpoint=False)
+polygons = []
+for _ in range(args.count):
+    center = generator.uniform(-60, 60)
+    radius = generator.uniform(5, 20) * (1 + 0.1 * numpy.sin(7 * angles))
+    lon = 180 + radius * numpy.cos(angles)
+    lat = center + radius * numpy.sin(angles)
+    polygons.append(shapely.Polygon(numpy.column_stack(((lon + 180) % 360 - 180, lat))))
+geometries = numpy.array(polygons, dtype=object)
+
+print(f"{args.count} polygons with {args.vertices} vertices each")
+print("threads  seconds  speedup")
+baseline = None
+for workers in (1, 2, 4, 8):
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        antimeridian.fix_geometries(geometries, workers=workers, executor="thread")
+        best = min(best, time.perf_counter() - start)
+    baseline = baseline or best
+    print(f"{workers:>7}  {best:>7.3f}  {baseline / best:>6.2f}x")
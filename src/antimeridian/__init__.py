@@ -1,31 +1,55 @@
 """Fix antimeridian crossings in GeoJSON objects and shapely geometries."""
 
+from ._cache import CacheStats, DiskCache, FixCache
 from ._implementation import (
+    FixStats,
     FixWindingWarning,
     GeoInterface,
     bbox,
+    bbox_geoarrow,
+    bboxes,
     centroid,
+    centroid_geoarrow,
+    centroids,
+    fix_geoarrow,
     fix_geojson,
+    fix_geometries,
+    fix_geometry,
     fix_line_string,
     fix_multi_line_string,
     fix_multi_polygon,
     fix_polygon,
     fix_shape,
+    fix_wkb,
+    fixed_bbox,
     segment_geojson,
     segment_shape,
 )
 
 __all__ = [
+    "CacheStats",
+    "DiskCache",
+    "FixCache",
+    "FixStats",
     "FixWindingWarning",
     "GeoInterface",
     "bbox",
+    "bbox_geoarrow",
+    "bboxes",
     "centroid",
+    "centroid_geoarrow",
+    "centroids",
+    "fix_geoarrow",
     "fix_geojson",
+    "fix_geometries",
+    "fix_geometry",
     "fix_line_string",
     "fix_multi_line_string",
     "fix_multi_polygon",
     "fix_polygon",
     "fix_shape",
+    "fix_wkb",
+    "fixed_bbox",
     "segment_geojson",
     "segment_shape",
 ]
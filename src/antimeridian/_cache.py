@@ -0,0 +1,534 @@
+"""A content-addressed cache of fix results, for shapes that come up again and
+again."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy
+import shapely
+import shapely.geometry
+from shapely.geometry import Point
+
+from ._implementation import (
+    FixStats,
+    GeoInterface,
+    Output,
+    bbox,
+    centroid,
+    check_output,
+    fix_shape,
+    with_geometry,
+)
+
+SAME = object()
+"""Stands in for an unchanged GeoJSON result, which is the input itself."""
+
+
+@dataclass
+class CacheStats:
+    """A snapshot of how a [antimeridian.FixCache][] has been used."""
+
+    hits: int = 0
+    """Calls answered from the cache."""
+
+    misses: int = 0
+    """Calls that had to run the algorithm."""
+
+    size: int = 0
+    """The number of results in the cache."""
+
+    maxsize: int = 0
+    """The most results the cache will hold."""
+
+
+class FixCache:
+    """A bounded, thread-safe cache of the results of
+    [antimeridian.fix_shape][], [antimeridian.fix_geojson][],
+    [antimeridian.bbox][] and [antimeridian.centroid][].
+
+    Results are keyed by a BLAKE2 hash of the shape's type and float64
+    coordinate bytes, plus the function and its options, so an equal shape
+    hits the cache whatever object it comes in. When the cache is full, the
+    least recently used result is evicted.
+
+    Returned dictionaries and lists are copies, so callers can change them
+    without changing the cache. Their coordinates are tuples, which can't be
+    changed. Shapes that don't need fixing are returned as-is, just as
+    [antimeridian.fix_shape][] returns them. Shapes without coordinates,
+    e.g. GeometryCollections, are never cached.
+
+    Warnings, such as [antimeridian.FixWindingWarning][], are only raised when
+    a result is calculated, not when it comes from the cache.
+
+    Example:
+        ```python
+        cache = antimeridian.FixCache(maxsize=10_000)
+        for item in items:
+            item["geometry"] = cache.fix_shape(item["geometry"])
+        print(cache.stats)
+        ```
+
+    Args:
+        maxsize: The most results to hold.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative: {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """How many calls hit and missed the cache, and how full it is."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Empties the cache, and resets its stats."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def fix_shape(
+        self,
+        shape: dict[str, Any] | GeoInterface,
+        *,
+        force_north_pole: bool = False,
+        force_south_pole: bool = False,
+        fix_winding: bool | None = None,
+        great_circle: bool = True,
+        reverse: bool = False,
+        stats: FixStats | None = None,
+        output: Output = "geojson",
+    ) -> Any:
+        """[antimeridian.fix_shape][], through the cache."""
+        check_output(output)
+        geojson = shape if isinstance(shape, dict) else shape.__geo_interface__
+        key = shape_key(
+            geojson,
+            "fix_shape",
+            force_north_pole,
+            force_south_pole,
+            fix_winding,
+            great_circle,
+            reverse,
+            output,
+        )
+        entry = self._get(key)
+        if entry is None:
+            local_stats = FixStats()
+            result = fix_shape(
+                shape,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+                reverse=reverse,
+                stats=local_stats,
+                output=output,
+            )
+            is_same = output == "geojson" and result is shape
+            entry = (bool(local_stats.unchanged), SAME if is_same else result)
+            self._put(key, entry)
+        is_unchanged, result = entry
+        if stats is not None:
+            if is_unchanged:
+                stats.unchanged += 1
+            else:
+                stats.fixed += 1
+        if result is SAME:
+            return geojson
+        elif isinstance(result, dict):
+            return dict(result)
+        else:
+            return result
+
+    def fix_geojson(
+        self,
+        geojson: dict[str, Any],
+        *,
+        force_north_pole: bool = False,
+        force_south_pole: bool = False,
+        fix_winding: bool | None = None,
+        great_circle: bool = True,
+        reverse: bool = False,
+        stats: FixStats | None = None,
+        output: Output = "geojson",
+        inplace: bool = True,
+    ) -> Any:
+        """[antimeridian.fix_geojson][], through the cache.
+
+        Each geometry is looked up on its own, so a FeatureCollection only
+        runs the algorithm for the geometries that aren't in the cache.
+        Features are always fixed one at a time.
+        """
+        options: dict[str, Any] = dict(
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
+            reverse=reverse,
+            stats=stats,
+            output=output,
+        )
+        type_ = geojson.get("type", None)
+        if type_ is None:
+            raise ValueError("no 'type' field found in GeoJSON")
+        elif type_ == "Feature":
+            geometry = geojson.get("geometry", None)
+            if geometry is None:
+                raise ValueError("no 'geometry' field found in GeoJSON Feature")
+            return with_geometry(geojson, self.fix_shape(geometry, **options), inplace)
+        elif type_ == "FeatureCollection":
+            features = geojson.get("features", None)
+            if features is None:
+                raise ValueError(
+                    "no 'features' field found in GeoJSON FeatureCollection"
+                )
+            if not inplace:
+                features = list(features)
+            for i, feature in enumerate(features):
+                features[i] = self.fix_geojson(feature, inplace=inplace, **options)
+            if not inplace:
+                return {**geojson, "features": features}
+            geojson["features"] = features
+            return geojson
+        else:
+            return self.fix_shape(geojson, **options)
+
+    def bbox(
+        self,
+        shape: dict[str, Any] | GeoInterface,
+        force_over_antimeridian: bool = False,
+    ) -> list[float]:
+        """[antimeridian.bbox][], through the cache."""
+        geojson = shape if isinstance(shape, dict) else shape.__geo_interface__
+        key = shape_key(geojson, "bbox", force_over_antimeridian)
+        result = self._get(key)
+        if result is None:
+            result = bbox(shape, force_over_antimeridian)
+            self._put(key, result)
+        return list(result)
+
+    def centroid(self, shape: dict[str, Any] | GeoInterface) -> Point:
+        """[antimeridian.centroid][], through the cache."""
+        geojson = shape if isinstance(shape, dict) else shape.__geo_interface__
+        key = shape_key(geojson, "centroid")
+        result = self._get(key)
+        if result is None:
+            result = centroid(shape)
+            self._put(key, result)
+        return result
+
+    def _get(self, key: bytes | None) -> Any:
+        """Returns a cached result, or `None`, and counts the hit or miss."""
+        with self._lock:
+            if key is not None and key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+            return None
+
+    def _put(self, key: bytes | None, value: Any) -> None:
+        if key is None or not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class DiskCache(FixCache):
+    """A [antimeridian.FixCache][] kept in a SQLite database on disk, so
+    results outlive the process.
+
+    Repeat runs over the same shapes (e.g. nightly reprocessing of a catalog)
+    skip the algorithm for every shape they've seen before. The database is
+    `antimeridian-cache.sqlite3` in `directory`. When it holds more than
+    `max_bytes` of keys and results, the least recently used results are
+    evicted to make room for new ones. Results written by another version of
+    antimeridian are dropped when the cache is opened.
+
+    Unlike [antimeridian.FixCache][], `maxsize` and the `size` of its
+    [antimeridian.CacheStats][] are in bytes, and hits and misses are counted
+    across every run that has used the cache. Results are stored as
+    well-known binary or JSON, and read back in the same form as a miss
+    returns them. Writes are committed in batches, and when the cache is closed, so
+    use it as a context manager or call [close][antimeridian.DiskCache.close].
+
+    Example:
+        ```python
+        with antimeridian.DiskCache("~/.cache/antimeridian") as cache:
+            fixed = cache.fix_geojson(feature_collection)
+        ```
+
+    Args:
+        directory: The directory to keep the database in. It is created if
+            it doesn't exist.
+        max_bytes: The most bytes of keys and results to keep.
+    """
+
+    FILE_NAME = "antimeridian-cache.sqlite3"
+
+    COMMIT_EVERY = 1000
+    """How many writes to batch up before committing them."""
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 1 << 30):
+        super().__init__(max_bytes)
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILE_NAME)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key BLOB PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        meta = dict(self._connection.execute("SELECT name, value FROM meta"))
+        if meta.get("version") != package_version():
+            self._connection.execute("DELETE FROM entries")
+            meta = {}
+        self._hits = int(meta.get("hits", 0))
+        self._misses = int(meta.get("misses", 0))
+        self._writes = 0
+        self._closed = False
+        (self._nbytes,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        with self._lock:
+            self._commit()
+
+    def __enter__(self) -> DiskCache:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+            return int(count)
+
+    @property
+    def stats(self) -> CacheStats:
+        """How many calls hit and missed the cache, and how many bytes it
+        holds."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=self._nbytes,
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Empties the cache, shrinks its database, and resets its stats."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._hits = 0
+            self._misses = 0
+            self._nbytes = 0
+            self._commit()
+            self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        """Commits any pending writes and closes the database.
+
+        Closing an already closed cache does nothing.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._connection.close()
+            self._closed = True
+
+    def _get(self, key: bytes | None) -> Any:
+        with self._lock:
+            row = None
+            if key is not None:
+                row = self._connection.execute(
+                    "SELECT value FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._connection.execute(
+                "UPDATE entries SET used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._wrote()
+            return decode(row[0])
+
+    def _put(self, key: bytes | None, value: Any) -> None:
+        if key is None or not self.maxsize:
+            return
+        data = encode(value)
+        size = len(key) + len(data)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._nbytes -= row[0]
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, data, size, time.time()),
+            )
+            self._nbytes += size
+            self._evict()
+            self._wrote()
+
+    def _evict(self) -> None:
+        """Deletes the least recently used results until the cache fits."""
+        if self._nbytes <= self.maxsize:
+            return
+        keys = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY used"
+        ):
+            keys.append((key,))
+            self._nbytes -= size
+            if self._nbytes <= self.maxsize:
+                break
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+    def _wrote(self) -> None:
+        self._writes += 1
+        if self._writes >= self.COMMIT_EVERY:
+            self._commit()
+
+    def _commit(self) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [
+                ("version", package_version()),
+                ("hits", str(self._hits)),
+                ("misses", str(self._misses)),
+            ],
+        )
+        self._connection.commit()
+        self._writes = 0
+
+
+def package_version() -> str:
+    # Imported here, as it's slow to import and only a DiskCache needs it.
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("antimeridian")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def encode(value: Any) -> bytes:
+    """Serializes a cached result, tagging it with its type.
+
+    Results are never pickled, so a cache file can't run code when it's read.
+    """
+    if isinstance(value, tuple):
+        is_unchanged, result = value
+        return (b"U" if is_unchanged else b"F") + encode(result)
+    elif value is SAME:
+        return b"S"
+    elif isinstance(value, shapely.Geometry):
+        return b"G" + bytes(shapely.to_wkb(value))
+    elif isinstance(value, dict) and "coordinates" in value:
+        # GeoJSON geometries come from shapely.geometry.mapping, so they're
+        # rebuilt the same way, with the same tuples and lists.
+        return b"M" + bytes(shapely.to_wkb(shapely.geometry.shape(value)))
+    elif isinstance(value, bytes):
+        return b"B" + value
+    else:
+        return b"J" + json.dumps(value).encode()
+
+
+def decode(data: bytes) -> Any:
+    tag, payload = data[:1], data[1:]
+    if tag in (b"U", b"F"):
+        return (tag == b"U", decode(payload))
+    elif tag == b"S":
+        return SAME
+    elif tag == b"G":
+        return shapely.from_wkb(payload)
+    elif tag == b"M":
+        return shapely.geometry.mapping(shapely.from_wkb(payload))
+    elif tag == b"B":
+        return payload
+    else:
+        return json.loads(payload)
+
+
+def shape_key(
+    geojson: dict[str, Any], function: str, *options: bool | str | None
+) -> bytes | None:
+    """Hashes a GeoJSON geometry's type and coordinates, and the function and
+    options it's being passed to.
+
+    Returns `None` for geometries without coordinates.
+    """
+    coordinates = geojson.get("coordinates", None)
+    if coordinates is None:
+        return None
+    digest = hashlib.blake2b(
+        repr((function, geojson.get("type", None), options)).encode(),
+        digest_size=16,
+    )
+    update_digest(digest, coordinates)
+    return digest.digest()
+
+
+def update_digest(digest: Any, coordinates: Any) -> None:
+    """Adds nested coordinates to a digest, as float64 bytes.
+
+    Each run of equal-length rings is hashed as one array, along with its
+    shape, so the nesting is part of the key.
+    """
+    try:
+        array = numpy.asarray(coordinates, dtype=numpy.float64)
+    except ValueError:
+        # Rings of different lengths.
+        digest.update(b"[%d]" % len(coordinates))
+        for item in coordinates:
+            update_digest(digest, item)
+    else:
+        digest.update(repr(array.shape).encode())
+        digest.update(array.tobytes())
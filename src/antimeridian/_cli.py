@@ -14,13 +14,256 @@ Re-install the package with the 'cli' optional dependency:
     sys.exit(1)
 
 
+import concurrent.futures
+import contextlib
+import functools
+import io
 import json
+from collections.abc import Callable, Iterator
+from typing import IO, Any
 
 import shapely.geometry
 from click import File
 
 import antimeridian
 
+from ._implementation import ExecutorLike
+
+NDJSON_HELP = (
+    "Read newline-delimited GeoJSON (GeoJSONSeq), one object per line, and write "
+    "one result per line as each is processed (or each batch, with --jobs)"
+)
+
+CACHE_DIR_HELP = (
+    "Keep fixed geometries in a cache in this directory, and reuse them when the "
+    "same geometry is fixed with the same options again"
+)
+
+FORMAT_HELP = (
+    "The format of the input and output: GeoJSON, a single well-known binary "
+    "geometry, or one hex-encoded well-known binary geometry per line"
+)
+
+
+def read_ndjson(infile: IO[str]) -> Iterator[Any]:
+    """Yields each object of a newline-delimited GeoJSON file.
+
+    Blank lines are skipped, as are the leading record separators of RFC 8142
+    GeoJSON text sequences.
+    """
+    for line in infile:
+        line = line.lstrip("\x1e").strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_batches(infile: IO[str], batch_size: int) -> Iterator[list[str]]:
+    """Yields the non-blank lines of a file, stripped, a batch at a time."""
+    batch: list[str] = []
+    for line in infile:
+        line = line.strip()
+        if line:
+            batch.append(line)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def fix_ndjson_line(line: str, options: dict[str, Any]) -> str:
+    """Fixes one line of newline-delimited GeoJSON, in a worker process."""
+    geojson = json.loads(line.lstrip("\x1e"))
+    return json.dumps(antimeridian.fix_geojson(geojson, **options))
+
+
+class JsonStream:
+    """Decodes JSON incrementally from a text file.
+
+    Only the structure of the outermost object is walked by hand. Each value
+    inside it is decoded whole with [json.JSONDecoder.raw_decode][], reading
+    more of the file whenever the buffer ends in the middle of one.
+    """
+
+    def __init__(self, infile: IO[str], chunk_size: int = 1 << 16) -> None:
+        self.infile = infile
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def read(self, size: int) -> None:
+        chunk = self.infile.read(size)
+        if chunk:
+            self.buffer = self.buffer[self.position :] + chunk
+            self.position = 0
+        else:
+            self.eof = True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or "" at the end."""
+        while True:
+            while self.position < len(self.buffer):
+                if not self.buffer[self.position].isspace():
+                    return self.buffer[self.position]
+                self.position += 1
+            if self.eof:
+                return ""
+            self.read(self.chunk_size)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(
+                f"Expecting '{char}'", self.buffer, self.position
+            )
+        self.position += 1
+
+    def decode(self) -> Any:
+        """Decodes the next value."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer might not be complete yet.
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            self.read(size)
+            size *= 2
+
+    def keys(self) -> Iterator[str]:
+        """Yields the member names of an object, without decoding their values.
+
+        The caller must consume each value, via [decode][] or otherwise,
+        before asking for the next member.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.position += 1
+            else:
+                self.expect("}")
+                return
+
+    def array(self) -> Iterator[Any]:
+        """Yields the decoded items of an array, one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self.position += 1
+            else:
+                self.expect("]")
+                return
+
+
+def stream_geojson(
+    infile: IO[str] | JsonStream,
+    fix: Callable[[Any], Any],
+    write: Callable[[str], Any],
+    batch_size: int = 1,
+) -> None:
+    """Fixes a GeoJSON file, writing the same text as ``json.dumps`` would.
+
+    If the top-level object is a FeatureCollection whose ``type`` comes
+    before its ``features``, the features are read, fixed, and written a batch
+    at a time. Anything else is read whole and fixed in one go.
+
+    Args:
+        infile: The GeoJSON text, or a stream already reading it.
+        fix: Fixes a GeoJSON object, returning the fixed object.
+        write: Writes a piece of the output.
+        batch_size: How many features to hand to ``fix`` at once, as a
+            FeatureCollection.
+    """
+    stream = infile if isinstance(infile, JsonStream) else JsonStream(infile)
+    if stream.peek() != "{":
+        write(json.dumps(fix(stream.decode())))
+        return
+    members: dict[str, Any] = {}
+    streaming = False
+    for key in stream.keys():
+        if key == "features" and members.get("type") == "FeatureCollection":
+            streaming = True
+            write("{")
+            for member_key, value in members.items():
+                write(f"{json.dumps(member_key)}: {json.dumps(value)}, ")
+            write(f"{json.dumps(key)}: [")
+            batch: list[Any] = []
+            first = True
+            for feature in stream.array():
+                batch.append(feature)
+                if len(batch) >= batch_size:
+                    first = write_features(batch, fix, write, first)
+                    batch = []
+            write_features(batch, fix, write, first)
+            write("]")
+        elif streaming:
+            write(f", {json.dumps(key)}: {json.dumps(stream.decode())}")
+        else:
+            members[key] = stream.decode()
+    if streaming:
+        write("}")
+    else:
+        write(json.dumps(fix(members)))
+    if stream.peek():
+        raise json.JSONDecodeError("Extra data", stream.buffer, stream.position)
+
+
+def write_features(
+    features: list[Any],
+    fix: Callable[[Any], Any],
+    write: Callable[[str], Any],
+    first: bool,
+) -> bool:
+    if not features:
+        return first
+    fixed = fix({"type": "FeatureCollection", "features": features})["features"]
+    text = ", ".join(json.dumps(feature) for feature in fixed)
+    write(text if first else ", " + text)
+    return False
+
+
+@contextlib.contextmanager
+def text_file(infile: IO[bytes]) -> Iterator[IO[str]]:
+    """Reads a binary input file as UTF-8 text, as GeoJSON is written.
+
+    The file itself is left open, for click to close.
+    """
+    text = io.TextIOWrapper(infile, encoding="utf-8")
+    try:
+        yield text
+    finally:
+        text.detach()
+
+
+@contextlib.contextmanager
+def process_pool(jobs: int) -> Iterator[ExecutorLike]:
+    """Starts one process pool for a whole run, rather than one per batch.
+
+    With a single job, no pool is started.
+    """
+    if jobs == 1:
+        yield "process"
+    else:
+        with concurrent.futures.ProcessPoolExecutor(jobs or None) as pool:
+            yield pool
+
 
 @click.group()
 def cli() -> None:
@@ -28,7 +271,7 @@ def cli() -> None:
 
 
 @cli.command()
-@click.argument("infile", type=File("r"), default=sys.stdin)
+@click.argument("infile", type=File("rb"), default="-")
 @click.option(
     "--force-north-pole",
     is_flag=True,
@@ -65,28 +308,133 @@ def cli() -> None:
     is_flag=True,
     help="Reverse the coordinates before fixing",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    show_default=True,
+    default=1,
+    type=int,
+    help=(
+        "Fix the features of a FeatureCollection with this many processes. "
+        "Use 0 for one process per CPU."
+    ),
+)
+@click.option("--ndjson", is_flag=True, default=False, help=NDJSON_HELP)
+@click.option(
+    "--format",
+    "format",
+    type=click.Choice(["geojson", "wkb", "wkb-hex"]),
+    show_default=True,
+    default="geojson",
+    help=FORMAT_HELP,
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="ANTIMERIDIAN_CACHE_DIR",
+    help=CACHE_DIR_HELP,
+)
+@click.option(
+    "--cache-size",
+    show_default=True,
+    default=1024,
+    type=click.IntRange(min=0),
+    help="The most mebibytes to keep in the cache",
+)
 def fix(
-    infile: File,
+    infile: IO[bytes],
     force_north_pole: bool,
     force_south_pole: bool,
     fix_winding: bool | None,
     great_circle: bool,
     reverse: bool,
+    jobs: int,
+    ndjson: bool,
+    format: str,
+    cache_dir: str | None,
+    cache_size: int,
 ) -> None:
     """Fixes any antimeridian problems a GeoJSON file
 
     Writes the fixed GeoJSON to standard output. If the filename is ``-`` the
-    input GeoJSON is read from standard input.
+    input GeoJSON is read from standard input. With ``--format wkb`` or
+    ``--format wkb-hex``, well-known binary is read and written instead,
+    without going through GeoJSON. With ``--cache-dir``, geometries that have
+    been fixed before, with the same options, are read from the cache instead.
     """
-    fixed = antimeridian.fix_geojson(
-        json.load(infile),  # type: ignore
+    if format != "geojson":
+        if ndjson:
+            raise click.UsageError("--ndjson can only be used with GeoJSON")
+        if cache_dir is not None:
+            raise click.UsageError("--cache-dir can only be used with GeoJSON")
+
+        def fix_wkb(wkb: Any) -> Any:
+            return antimeridian.fix_wkb(
+                wkb,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+                reverse=reverse,
+                workers=jobs or None,
+                executor=executor,
+            )
+
+        with process_pool(jobs) as executor:
+            if format == "wkb":
+                sys.stdout.buffer.write(fix_wkb(infile.read()))
+            else:
+                with text_file(infile) as text:
+                    for batch in read_batches(text, 1024):
+                        sys.stdout.write("".join(f"{wkb}\n" for wkb in fix_wkb(batch)))
+                        sys.stdout.flush()
+        return
+
+    if cache_dir is not None and jobs != 1:
+        raise click.UsageError("--cache-dir can only be used with one job")
+    cache = None
+    if cache_dir is not None:
+        cache = antimeridian.DiskCache(cache_dir, max_bytes=cache_size << 20)
+
+    options: dict[str, Any] = dict(
         force_north_pole=force_north_pole,
         force_south_pole=force_south_pole,
         fix_winding=fix_winding,
         great_circle=great_circle,
         reverse=reverse,
     )
-    print(json.dumps(fixed))
+
+    def fix_geojson(geojson: Any) -> Any:
+        if cache is not None:
+            return cache.fix_geojson(geojson, **options)
+        return antimeridian.fix_geojson(
+            geojson, workers=jobs or None, executor=executor, **options
+        )
+
+    try:
+        with text_file(infile) as text, process_pool(jobs) as executor:
+            if ndjson and isinstance(executor, concurrent.futures.Executor):
+                fix_line = functools.partial(fix_ndjson_line, options=options)
+                for batch in read_batches(text, 1024):
+                    lines = [line for line in batch if line.lstrip("\x1e")]
+                    for fixed in executor.map(fix_line, lines, chunksize=16):
+                        print(fixed)
+                    sys.stdout.flush()
+                return
+            elif ndjson:
+                for geojson in read_ndjson(text):
+                    print(json.dumps(fix_geojson(geojson)), flush=True)
+                return
+            stream_geojson(
+                text,
+                fix_geojson,
+                sys.stdout.write,
+                batch_size=1 if jobs == 1 else 1024,
+            )
+        sys.stdout.write("\n")
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 @cli.command()
@@ -100,19 +448,29 @@ def fix(
     default=True,
     help="Compute meridian crossings on the sphere rather than using 2D geometry",
 )
-def segment(infile: File, index: int | None, great_circle: bool) -> None:
+@click.option("--ndjson", is_flag=True, default=False, help=NDJSON_HELP)
+def segment(
+    infile: IO[str], index: int | None, great_circle: bool, ndjson: bool
+) -> None:
     """Segments the exterior coordinates of a GeoJSON file
 
     Prints the resulting MultiLineString to standard output. Useful mostly for
     debugging problems with `fix`.
     """
-    data = json.load(infile)  # type: ignore
+    if ndjson:
+        for data in read_ndjson(infile):
+            print(json.dumps(segment_data(data, index, great_circle)), flush=True)
+    else:
+        data = json.load(infile)
+        print(json.dumps(segment_data(data, index, great_circle)))
+
+
+def segment_data(data: Any, index: int | None, great_circle: bool) -> Any:
     segments = antimeridian.segment_geojson(data, great_circle)
     if index is not None:
-        data = shapely.geometry.mapping(segments.geoms[index])
+        return shapely.geometry.mapping(segments.geoms[index])
     else:
-        data = shapely.geometry.mapping(segments)
-    print(json.dumps(data))
+        return shapely.geometry.mapping(segments)
 
 
 @cli.command()
@@ -123,7 +481,151 @@ def segment(infile: File, index: int | None, great_circle: bool) -> None:
     help="Force the bbox to be antimeridian-spanning",
     type=bool,
 )
-def bbox(infile: File, force_over_antimeridian: bool) -> None:
+@click.option("--ndjson", is_flag=True, default=False, help=NDJSON_HELP)
+def bbox(infile: IO[str], force_over_antimeridian: bool, ndjson: bool) -> None:
     """Calculates the antimeridian-spanning bbox for the input geometry."""
-    shape = json.load(infile)  # type: ignore
-    print(json.dumps(antimeridian.bbox(shape)))
+    if ndjson:
+        for shape in read_ndjson(infile):
+            print(json.dumps(antimeridian.bbox(shape)), flush=True)
+    else:
+        shape = json.load(infile)
+        print(json.dumps(antimeridian.bbox(shape)))
+
+
+@cli.group("cache")
+def cache_group() -> None:
+    """Inspects or empties the cache used by ``fix --cache-dir``."""
+
+
+cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="ANTIMERIDIAN_CACHE_DIR",
+    required=True,
+    help="The cache directory",
+)
+
+
+@cache_group.command("stats")
+@cache_dir_option
+def cache_stats(cache_dir: str) -> None:
+    """Prints how many geometries the cache holds, and how often it was hit."""
+    with antimeridian.DiskCache(cache_dir) as cache:
+        stats = cache.stats
+        print(
+            json.dumps(
+                {
+                    "entries": len(cache),
+                    "bytes": stats.size,
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                }
+            )
+        )
+
+
+@cache_group.command("clear")
+@cache_dir_option
+def cache_clear(cache_dir: str) -> None:
+    """Empties the cache."""
+    with antimeridian.DiskCache(cache_dir) as cache:
+        cache.clear()
+
+
+@cli.command("fix-parquet")
+@click.argument("infile", type=click.Path(exists=True, dir_okay=False))
+@click.argument("outfile", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--geometry-column",
+    help="The geometry column to fix. Defaults to the primary geometry column.",
+)
+@click.option(
+    "--bbox-column",
+    show_default=True,
+    default="bbox",
+    help="The bounding box covering column to write",
+)
+@click.option(
+    "--force-north-pole",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="Force the fixed polygon to enclose the north pole",
+)
+@click.option(
+    "--force-south-pole",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="Force the fixed polygon to enclose the south pole",
+)
+@click.option(
+    "--fix-winding/--no-fix-winding",
+    show_default=True,
+    default=None,
+    help=(
+        "Automatically fix clockwise polygons to be the correct counterclockwise "
+        "winding order. If not provided, defaults to fixing with a warning."
+    ),
+)
+@click.option(
+    "--great-circle/--no-great-circle",
+    show_default=True,
+    default=True,
+    help="Compute meridian crossings on the sphere rather than using 2D geometry",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    show_default=True,
+    default=1,
+    type=int,
+    help=(
+        "Fix the geometries of each row group with this many processes. "
+        "Use 0 for one process per CPU."
+    ),
+)
+def fix_parquet(
+    infile: str,
+    outfile: str,
+    geometry_column: str | None,
+    bbox_column: str,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+    jobs: int,
+) -> None:
+    """Fixes the geometries of a GeoParquet file
+
+    Reads INFILE a row group at a time, fixes its WKB geometries, and writes
+    each row group to OUTFILE with a bounding box covering column.
+    """
+    try:
+        from ._parquet import fix_parquet
+    except ImportError:
+        raise click.ClickException(
+            "`fix-parquet` depends on the pyarrow package. Re-install the package "
+            "with the 'parquet' optional dependency:\n\n"
+            "    pip install 'antimeridian[parquet]'"
+        )
+
+    stats = antimeridian.FixStats()
+    try:
+        with process_pool(jobs) as executor:
+            fix_parquet(
+                infile,
+                outfile,
+                geometry_column=geometry_column,
+                bbox_column=bbox_column,
+                stats=stats,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+                workers=jobs or None,
+                executor=executor,
+            )
+    except ValueError as error:
+        raise click.ClickException(str(error))
+    click.echo(f"{stats.fixed} fixed, {stats.unchanged} unchanged", err=True)
@@ -8,16 +8,21 @@ module can change at any time without warning.
 
 from __future__ import annotations
 
-import copy
+import bisect
+import concurrent.futures
 import itertools
 import math
+import os
 import warnings
 from collections import namedtuple
-from typing import Any, Protocol, cast
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, NamedTuple, Protocol, cast, overload
 
 import numpy
 import shapely
 import shapely.affinity
+import shapely.errors
 import shapely.geometry
 import shapely.validation
 from shapely.geometry import (
@@ -32,6 +37,13 @@ from shapely.geometry import (
 XY = tuple[float, float]
 XYZ = tuple[float, float, float]
 
+Output = Literal["geojson", "shapely", "wkb"]
+"""How fixed shapes are returned: as GeoJSON dictionaries, shapely
+geometries, or well-known binary."""
+
+ExecutorLike = Literal["process", "thread"] | concurrent.futures.Executor
+"""The kind of pool to fix in, or a pool to reuse across calls."""
+
 
 class AntimeridianWarning(UserWarning):
     """Base class for all package-specific warnings."""
@@ -70,6 +82,57 @@ class GeoInterface(Protocol):
     def __geo_interface__(self) -> dict[str, Any]: ...
 
 
+@dataclass
+class FixStats:
+    """Counts which path shapes took through the fix functions.
+
+    Pass an instance as the `stats` argument of [antimeridian.fix_geojson][],
+    [antimeridian.fix_shape][], or [antimeridian.fix_geometries][] and it
+    will be updated in place. One instance can be shared across many calls.
+    """
+
+    unchanged: int = 0
+    """Shapes that didn't cross the antimeridian, and were returned untouched
+    without running the algorithm."""
+
+    fixed: int = 0
+    """Shapes that went through the full algorithm."""
+
+
+@overload
+def fix_geojson(
+    geojson: dict[str, Any],
+    *,
+    force_north_pole: bool = ...,
+    force_south_pole: bool = ...,
+    fix_winding: bool | None = ...,
+    great_circle: bool = ...,
+    reverse: bool = ...,
+    stats: FixStats | None = ...,
+    workers: int | None = ...,
+    executor: ExecutorLike = ...,
+    output: Literal["geojson"] = ...,
+    inplace: bool = ...,
+) -> dict[str, Any]: ...
+
+
+@overload
+def fix_geojson(
+    geojson: dict[str, Any],
+    *,
+    force_north_pole: bool = ...,
+    force_south_pole: bool = ...,
+    fix_winding: bool | None = ...,
+    great_circle: bool = ...,
+    reverse: bool = ...,
+    stats: FixStats | None = ...,
+    workers: int | None = ...,
+    executor: ExecutorLike = ...,
+    output: Literal["shapely", "wkb"],
+    inplace: bool = ...,
+) -> Any: ...
+
+
 def fix_geojson(
     geojson: dict[str, Any],
     *,
@@ -78,7 +141,12 @@ def fix_geojson(
     fix_winding: bool | None = None,
     great_circle: bool = True,
     reverse: bool = False,
-) -> dict[str, Any]:
+    stats: FixStats | None = None,
+    workers: int | None = 1,
+    executor: ExecutorLike = "process",
+    output: Output = "geojson",
+    inplace: bool = True,
+) -> Any:
     """Fixes a GeoJSON object that crosses the antimeridian.
 
     If the object does not cross the antimeridian, it is returned unchanged.
@@ -87,9 +155,9 @@ def fix_geojson(
     `force_south_pole` and `fix_winding` arguments.
 
     Warning:
-        This function mutates the input dictionary in-place. If you need to
-        preserve the original GeoJSON, make a copy before calling this function
-        (e.g., using `copy.deepcopy(geojson)`).
+        By default, this function mutates the input dictionary in-place. If
+        you need to preserve the original GeoJSON, pass `inplace=False`
+        rather than making a copy first.
 
     Args:
         geojson: A GeoJSON object as a dictionary
@@ -105,10 +173,29 @@ def fix_geojson(
         great_circle: Compute meridian crossings on the sphere rather than
             using 2D geometry.
         reverse: Reverse the coordinates before fixing.
+        stats: If provided, updated with how many shapes were fixed and how
+            many were returned unchanged.
+        workers: The number of workers used to fix the features of a
+            FeatureCollection. With more than one (or `None`, for one per
+            CPU), features are fixed in chunks in a pool. The output is
+            identical to fixing them one at a time.
+        executor: Run the chunks in a `"process"` pool, a `"thread"` pool, or
+            an existing pool. See [antimeridian.fix_geometries][].
+        output: Return fixed geometries as GeoJSON dictionaries (`"geojson"`),
+            shapely geometries (`"shapely"`), or well-known binary (`"wkb"`).
+            Features and FeatureCollections stay dictionaries, with their
+            geometries in this form.
+        inplace: Write fixed geometries into the input dictionaries. If
+            `False`, the input is left untouched, and the result is built
+            copy-on-write: it shares every unchanged feature, properties
+            dictionary, and coordinate list with the input, and only fixed
+            geometries (and the Features and FeatureCollection holding them)
+            are new objects.
 
     Return:
         The same GeoJSON with a fixed geometry or geometries
     """
+    check_output(output)
     type_ = geojson.get("type", None)
     if type_ is None:
         raise ValueError("no 'type' field found in GeoJSON")
@@ -116,28 +203,55 @@ def fix_geojson(
         geometry = geojson.get("geometry", None)
         if geometry is None:
             raise ValueError("no 'geometry' field found in GeoJSON Feature")
-        geojson["geometry"] = fix_shape(
-            geometry,
-            force_north_pole=force_north_pole,
-            force_south_pole=force_south_pole,
-            fix_winding=fix_winding,
-            great_circle=great_circle,
-            reverse=reverse,
+        return with_geometry(
+            geojson,
+            fix_shape(
+                geometry,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+                reverse=reverse,
+                stats=stats,
+                output=output,
+            ),
+            inplace,
         )
-        return geojson
     elif type_ == "FeatureCollection":
         features = geojson.get("features", None)
         if features is None:
             raise ValueError("no 'features' field found in GeoJSON FeatureCollection")
-        for i, feature in enumerate(features):
-            features[i] = fix_geojson(
-                feature,
+        if not inplace:
+            features = list(features)
+        if workers == 1:
+            for i, feature in enumerate(features):
+                features[i] = fix_geojson(
+                    feature,
+                    force_north_pole=force_north_pole,
+                    force_south_pole=force_south_pole,
+                    fix_winding=fix_winding,
+                    great_circle=great_circle,
+                    reverse=reverse,
+                    stats=stats,
+                    output=output,
+                    inplace=inplace,
+                )
+        else:
+            fix_features_in_parallel(
+                features,
                 force_north_pole=force_north_pole,
                 force_south_pole=force_south_pole,
                 fix_winding=fix_winding,
                 great_circle=great_circle,
                 reverse=reverse,
+                stats=stats,
+                workers=workers,
+                executor=executor,
+                output=output,
+                inplace=inplace,
             )
+        if not inplace:
+            return {**geojson, "features": features}
         geojson["features"] = features
         return geojson
     else:
@@ -148,9 +262,27 @@ def fix_geojson(
             fix_winding=fix_winding,
             great_circle=great_circle,
             reverse=reverse,
+            stats=stats,
+            output=output,
         )
 
 
+def with_geometry(
+    feature: dict[str, Any], geometry: Any, inplace: bool
+) -> dict[str, Any]:
+    """Sets the geometry of a feature, or of a shallow copy if not `inplace`.
+
+    A feature whose geometry is the very same object is returned as-is.
+    """
+    if inplace:
+        feature["geometry"] = geometry
+        return feature
+    elif feature["geometry"] is geometry:
+        return feature
+    else:
+        return {**feature, "geometry": geometry}
+
+
 def segment_geojson(geojson: dict[str, Any], great_circle: bool) -> MultiLineString:
     """Segments a GeoJSON object into a MultiLineString.
 
@@ -185,6 +317,34 @@ def segment_geojson(geojson: dict[str, Any], great_circle: bool) -> MultiLineStr
         return MultiLineString(segment_shape(geojson, great_circle))
 
 
+@overload
+def fix_shape(
+    shape: dict[str, Any] | GeoInterface,
+    *,
+    force_north_pole: bool = ...,
+    force_south_pole: bool = ...,
+    fix_winding: bool | None = ...,
+    great_circle: bool = ...,
+    reverse: bool = ...,
+    stats: FixStats | None = ...,
+    output: Literal["geojson"] = ...,
+) -> dict[str, Any]: ...
+
+
+@overload
+def fix_shape(
+    shape: dict[str, Any] | GeoInterface,
+    *,
+    force_north_pole: bool = ...,
+    force_south_pole: bool = ...,
+    fix_winding: bool | None = ...,
+    great_circle: bool = ...,
+    reverse: bool = ...,
+    stats: FixStats | None = ...,
+    output: Literal["shapely", "wkb"],
+) -> Any: ...
+
+
 def fix_shape(
     shape: dict[str, Any] | GeoInterface,
     *,
@@ -193,12 +353,22 @@ def fix_shape(
     fix_winding: bool | None = None,
     great_circle: bool = True,
     reverse: bool = False,
-) -> dict[str, Any]:
+    stats: FixStats | None = None,
+    output: Output = "geojson",
+) -> Any:
     """Fixes a shape that crosses the antimeridian.
 
     See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
     `force_south_pole` and `fix_winding` arguments.
 
+    Before doing any work, the raw coordinates are checked: if every
+    longitude is within (-180, 180), no two consecutive points are more than
+    180° apart, and polygons are already wound correctly, the shape can't
+    need fixing, and is returned as-is (as a dictionary) without converting
+    it to a shapely geometry. Shapely geometries are never rebuilt from
+    GeoJSON, and with a shapely or WKB `output` they are handed straight to
+    [antimeridian.fix_geometry][].
+
     Note:
         When `shape` is a dictionary, this function does not mutate it directly,
         but converts it to a Shapely geometry first. However, if called via
@@ -220,83 +390,209 @@ def fix_shape(
         great_circle: Compute meridian crossings on the sphere rather than
             using 2D geometry.
         reverse: Reverse the coordinates before fixing.
+        stats: If provided, updated with whether the shape was fixed or
+            returned unchanged.
+        output: Return the fixed shape as a GeoJSON dictionary (`"geojson"`),
+            a shapely geometry (`"shapely"`), or well-known binary (`"wkb"`).
 
     Returns:
-        The fixed shape as a dictionary
+        The fixed shape, as a dictionary unless another `output` is asked for
     """
-    geom = shapely.geometry.shape(shape)
+    check_output(output)
+    if isinstance(shape, shapely.Geometry) and output != "geojson":
+        return to_output(
+            fix_geometry(
+                shape,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+                reverse=reverse,
+                stats=stats,
+            ),
+            output,
+        )
+    if not reverse:
+        geojson = shape if isinstance(shape, dict) else shape.__geo_interface__
+        if not might_cross_antimeridian_geojson(
+            geojson,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        ):
+            if stats is not None:
+                stats.unchanged += 1
+            if output == "geojson":
+                return geojson
+            return to_output(shapely.geometry.shape(geojson), output)
+    if stats is not None:
+        stats.fixed += 1
+    if isinstance(shape, shapely.Geometry):
+        geom = shape
+    else:
+        geom = shapely.geometry.shape(shape)
     if reverse:
         geom = geom.reverse()
+    return to_output(
+        fix_unscreened(
+            geom,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
+        ),
+        output,
+    )
+
+
+def fix_geometry(
+    geometry: Polygon | MultiPolygon | LineString | MultiLineString,
+    *,
+    force_north_pole: bool = False,
+    force_south_pole: bool = False,
+    fix_winding: bool | None = None,
+    great_circle: bool = True,
+    reverse: bool = False,
+    stats: FixStats | None = None,
+) -> Polygon | MultiPolygon | LineString | MultiLineString:
+    """Fixes a shapely geometry that crosses the antimeridian.
+
+    This is [antimeridian.fix_shape][] with a shapely geometry in and a
+    shapely geometry out, of whichever type the algorithm produces. The
+    geometry is never converted to or from GeoJSON. If it doesn't cross the
+    antimeridian (and is wound correctly), it is returned unchanged.
+
+    See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
+    `force_south_pole` and `fix_winding` arguments.
+
+    Args:
+        geometry: A polygon, multi-polygon, line string, or multi-line string.
+        force_north_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the north pole.
+        force_south_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the south pole.
+        fix_winding: If the polygon is wound clockwise, reverse its
+            coordinates before applying the algorithm. Defaults to `None`,
+            which behaves like `True` but emits a warning when winding is
+            corrected. Pass `True` to fix winding silently, or `False` to
+            disable winding correction entirely.
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+        reverse: Reverse the coordinates before fixing.
+        stats: If provided, updated with whether the geometry was fixed or
+            returned unchanged.
+
+    Returns:
+        The fixed geometry
+    """
+    if geometry.geom_type not in (
+        "Polygon",
+        "MultiPolygon",
+        "LineString",
+        "MultiLineString",
+    ):
+        raise ValueError(f"unsupported geom_type: {geometry.geom_type}")
+    if reverse:
+        geometry = geometry.reverse()
+    else:
+        geometries = numpy.empty(1, dtype=object)
+        geometries[0] = geometry
+        if not might_cross_antimeridian(
+            geometries,
+            shapely.get_type_id(geometries),
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        )[0]:
+            if stats is not None:
+                stats.unchanged += 1
+            return geometry
+    if stats is not None:
+        stats.fixed += 1
+    return fix_unscreened(
+        geometry,
+        force_north_pole=force_north_pole,
+        force_south_pole=force_south_pole,
+        fix_winding=fix_winding,
+        great_circle=great_circle,
+    )
+
+
+def fix_unscreened(
+    geom: Polygon | MultiPolygon | LineString | MultiLineString,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+) -> Polygon | MultiPolygon | LineString | MultiLineString:
+    """Runs the algorithm on a geometry, without screening it first."""
     if geom.geom_type == "Polygon":
-        return cast(
-            dict[str, Any],
-            shapely.geometry.mapping(
-                fix_polygon(
-                    geom,
-                    force_north_pole=force_north_pole,
-                    force_south_pole=force_south_pole,
-                    fix_winding=fix_winding,
-                    great_circle=great_circle,
-                )
-            ),
+        return fix_polygon(
+            geom,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
         )
     elif geom.geom_type == "MultiPolygon":
-        return cast(
-            dict[str, Any],
-            shapely.geometry.mapping(
-                fix_multi_polygon(
-                    geom,
-                    force_north_pole=force_north_pole,
-                    force_south_pole=force_south_pole,
-                    fix_winding=fix_winding,
-                    great_circle=great_circle,
-                )
-            ),
+        return fix_multi_polygon(
+            geom,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
         )
     elif geom.geom_type == "LineString":
-        return cast(
-            dict[str, Any],
-            shapely.geometry.mapping(fix_line_string(geom, great_circle)),
-        )
+        return fix_line_string(geom, great_circle)
     elif geom.geom_type == "MultiLineString":
-        return cast(
-            dict[str, Any],
-            shapely.geometry.mapping(fix_multi_line_string(geom, great_circle)),
-        )
+        return fix_multi_line_string(geom, great_circle)
     else:
         raise ValueError(f"unsupported geom_type: {geom.geom_type}")
 
 
-def segment_shape(
-    shape: dict[str, Any] | GeoInterface, great_circle: bool
-) -> list[list[XY]]:
-    geom = shapely.geometry.shape(shape)
-    if geom.geom_type == "Polygon":
-        return segment_polygon(geom, great_circle)
-    elif geom.geom_type == "MultiPolygon":
-        segments = list()
-        for polygon in geom.geoms:
-            segments += segment_polygon(polygon, great_circle)
-        return segments
+def check_output(output: str) -> None:
+    if output not in ("geojson", "shapely", "wkb"):
+        raise ValueError(f"unsupported output: {output}")
+
+
+def to_output(geometry: Any, output: Output) -> Any:
+    """Converts a shapely geometry to the requested output."""
+    if output == "geojson":
+        return shapely.geometry.mapping(geometry)
+    elif output == "shapely":
+        return geometry
     else:
-        raise ValueError(f"unsupported geom_type: {geom.geom_type}")
+        return shapely.to_wkb(geometry)
 
 
-def fix_multi_polygon(
-    multi_polygon: MultiPolygon,
+def fix_geometries(
+    geometries: numpy.ndarray | Sequence[Any],
     *,
     force_north_pole: bool = False,
     force_south_pole: bool = False,
     fix_winding: bool | None = None,
     great_circle: bool = True,
-) -> MultiPolygon:
-    """Fixes a [shapely.MultiPolygon][].
+    reverse: bool = False,
+    stats: FixStats | None = None,
+    workers: int | None = 1,
+    executor: ExecutorLike = "process",
+) -> numpy.ndarray:
+    """Fixes an array of shapely geometries.
+
+    This is the bulk equivalent of calling [antimeridian.fix_shape][] on every
+    geometry, with shapely geometries in and out. The coordinates of all
+    geometries are screened at once, and any geometry that doesn't cross the
+    antimeridian (and is already wound correctly) is returned unchanged
+    without running the algorithm. Missing geometries (`None`) are passed
+    through.
 
     See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
     `force_south_pole` and `fix_winding` arguments.
 
     Args:
-        multi_polygon: The multi-polygon
+        geometries: An array of polygons, multi-polygons, line strings, and
+            multi-line strings.
         force_north_pole: If the polygon crosses the antimeridian, force the
             joined segments to enclose the north pole.
         force_south_pole: If the polygon crosses the antimeridian, force the
@@ -308,49 +604,126 @@ def fix_multi_polygon(
             disable winding correction entirely.
         great_circle: Compute meridian crossings on the sphere rather than
             using 2D geometry.
+        reverse: Reverse the coordinates before fixing.
+        stats: If provided, updated with how many geometries were fixed and
+            how many were returned unchanged.
+        workers: The number of workers used to fix geometries. With more than
+            one (or `None`, for one per CPU), geometries are fixed in chunks.
+        executor: Run the chunks in a `"process"` pool or a `"thread"` pool.
+            Threads avoid the cost of starting processes and pickling
+            geometries, and still run in parallel while shapely is working
+            (it releases the GIL). Warnings raised in threads are not
+            attributed to the calling thread. An existing
+            [concurrent.futures.Executor][] can be passed instead, so that
+            repeated calls (e.g. one per batch of a stream) share one pool
+            rather than each starting their own. It is not shut down.
 
     Returns:
-        The fixed multi-polygon
+        An array of the fixed geometries, with the same shape as the input
     """
-    polygons = list()
-    for polygon in multi_polygon.geoms:
-        polygons += fix_polygon_to_list(
-            polygon,
+    array = numpy.asarray(geometries, dtype=object)
+    shape = array.shape
+    array = array.ravel()
+    type_ids = shapely.get_type_id(array)
+    unsupported = ~numpy.isin(type_ids, SUPPORTED_TYPE_IDS)
+    if unsupported.any():
+        geom_type = array[numpy.flatnonzero(unsupported)[0]].geom_type
+        raise ValueError(f"unsupported geom_type: {geom_type}")
+    if reverse:
+        array = shapely.reverse(array)
+    to_fix = numpy.flatnonzero(
+        might_cross_antimeridian(
+            array,
+            type_ids,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        )
+    )
+    if stats is not None:
+        stats.fixed += len(to_fix)
+        stats.unchanged += int(
+            numpy.count_nonzero(type_ids != shapely.GeometryType.MISSING)
+        ) - len(to_fix)
+    if workers == 1 or not len(to_fix):
+        return fix_geometries_at(
+            array,
+            to_fix,
             force_north_pole=force_north_pole,
             force_south_pole=force_south_pole,
             fix_winding=fix_winding,
             great_circle=great_circle,
+        ).reshape(shape)
+
+    options: dict[str, Any] = {
+        "force_north_pole": force_north_pole,
+        "force_south_pole": force_south_pole,
+        "fix_winding": fix_winding,
+        "great_circle": great_circle,
+        "reverse": False,
+    }
+    fixed = array.copy()
+    workers = workers or os.cpu_count() or 1
+    chunks = split_into_chunks(to_fix, workers)
+    if uses_threads(executor):
+        results = map_in_pool(
+            fix_geometry_chunk,
+            (array[chunk] for chunk in chunks),
+            options,
+            workers=workers,
+            executor=executor,
+        )
+        for chunk, result in zip(chunks, results):
+            fixed[chunk] = result
+    else:
+        results = map_in_pool(
+            fix_packed_geometries,
+            (pack_shapely(array[chunk]) for chunk in chunks),
+            options,
+            workers=workers,
+            executor=executor,
         )
-    return MultiPolygon(polygons)
+        for chunk, (packed, caught) in zip(chunks, results):
+            warn_all(caught)
+            fixed[chunk] = unpack_shapely(packed)
+    return fixed.reshape(shape)
 
 
-def fix_polygon(
-    polygon: Polygon,
+def fix_geoarrow(
+    geometry_type: shapely.GeometryType,
+    coords: numpy.ndarray,
+    offsets: tuple[numpy.ndarray, ...],
     *,
     force_north_pole: bool = False,
     force_south_pole: bool = False,
     fix_winding: bool | None = None,
     great_circle: bool = True,
-) -> Polygon | MultiPolygon:
-    """Fixes a [shapely.Polygon][].
-
-    If the input polygon is wound clockwise, it will be fixed to be wound
-    counterclockwise _unless_ `fix_winding` is `False` in which case it
-    will be corrected by adding a counterclockwise polygon from (-180, -90) to
-    (180, 90) as its exterior.
-
-    In rare cases, the underlying algorithm might need a little help to fix the polygon.
-    For example, a polygon that just barely crosses over a pole might have very
-    few points at high latitudes, leading to ambiguous antimeridian crossing
-    points and invalid geometries. We provide two flags, `force_north_pole`
-    and `force_south_pole` for those cases. Most users can ignore these
-    flags.
+    stats: FixStats | None = None,
+    workers: int | None = 1,
+    executor: ExecutorLike = "process",
+) -> tuple[shapely.GeometryType, numpy.ndarray, tuple[numpy.ndarray, ...]]:
+    """Fixes an array of geometries stored in GeoArrow buffers.
+
+    The buffers are laid out as [shapely.to_ragged_array][] returns them and
+    [shapely.from_ragged_array][] takes them: a geometry type, a coordinate
+    array, and one offset array per level of nesting. The coordinates are
+    screened straight from the buffers, and only the geometries that might
+    cross the antimeridian are built as shapely geometries and fixed. If none
+    do, the input buffers are returned as they are.
+
+    Fixing can split a line string or a polygon into several, so if any
+    geometry is split, line strings and polygons are returned in the
+    multi-line string or multi-polygon layout.
 
-    If either `force_north_pole` or `force_south_pole` is `True`
-    `fix_winding` is set to `False`
+    See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
+    `force_south_pole` and `fix_winding` arguments, and
+    [antimeridian.fix_geometries][] for `workers` and `executor`.
 
     Args:
-        polygon: The input polygon
+        geometry_type: The type of the geometries: line strings, polygons, or
+            their multis.
+        coords: The (N, 2) or (N, 3) coordinates of every geometry.
+        offsets: The offset arrays.
         force_north_pole: If the polygon crosses the antimeridian, force the
             joined segments to enclose the north pole.
         force_south_pole: If the polygon crosses the antimeridian, force the
@@ -362,77 +735,1161 @@ def fix_polygon(
             disable winding correction entirely.
         great_circle: Compute meridian crossings on the sphere rather than
             using 2D geometry.
+        stats: If provided, updated with how many geometries were fixed and
+            how many were returned unchanged.
+        workers: The number of workers used to fix geometries.
+        executor: Run the workers in a `"process"` pool, a `"thread"` pool,
+            or an existing pool.
 
     Returns:
-        The fixed polygon, either as a single polygon or a multi-polygon (if it
-            was split)
+        The geometry type, coordinates, and offsets of the fixed geometries
     """
-    if force_north_pole or force_south_pole:
-        fix_winding = False
-    polygons = fix_polygon_to_list(
-        polygon,
+    geometry_type = shapely.GeometryType(geometry_type)
+    if geometry_type not in MULTI_GEOARROW_TYPES:
+        raise ValueError(f"unsupported geometry type: {geometry_type.name}")
+    packed = pack_ragged(geometry_type, coords, offsets)
+    to_fix = numpy.flatnonzero(
+        might_cross_antimeridian_packed(
+            packed,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        )
+    )
+    if stats is not None:
+        stats.fixed += len(to_fix)
+        stats.unchanged += len(packed.type_ids) - len(to_fix)
+    if not len(to_fix):
+        return geometry_type, coords, offsets
+    fixed = fix_geometries(
+        unpack_shapely(take_packed(packed, to_fix)),
         force_north_pole=force_north_pole,
         force_south_pole=force_south_pole,
         fix_winding=fix_winding,
         great_circle=great_circle,
+        workers=workers,
+        executor=executor,
     )
-    if len(polygons) == 1:
-        polygon = polygons[0]
-        if shapely.is_ccw(polygon.exterior):
-            return polygon
-        else:
-            pole_covering_polygon = Polygon(
-                [(-180, 90), (-180, -90), (180, -90), (180, 90)],
-                [polygon.exterior.coords],
-            )
-            if shapely.is_valid(pole_covering_polygon):
-                return pole_covering_polygon
-            else:
-                raise ValueError(
-                    "Fixed polygon is invalid, check your input polygon for validity. "
-                    "Reason your polygon is invalid: "
-                    + shapely.is_valid_reason(polygon)
-                )
+    packed = splice_packed(packed, to_fix, pack_shapely(fixed))
+    if not (packed.type_ids == geometry_type).all():
+        geometry_type = MULTI_GEOARROW_TYPES[geometry_type]
+    return unpack_ragged(packed, geometry_type, offsets[0].dtype)
 
-    else:
-        return MultiPolygon(polygons)
 
+def fix_wkb(
+    wkb: bytes | str | numpy.ndarray | Sequence[bytes | str | None],
+    *,
+    force_north_pole: bool = False,
+    force_south_pole: bool = False,
+    fix_winding: bool | None = None,
+    great_circle: bool = True,
+    reverse: bool = False,
+    stats: FixStats | None = None,
+    workers: int | None = 1,
+    executor: ExecutorLike = "process",
+) -> Any:
+    """Fixes well-known binary (WKB) geometries.
+
+    The WKB is parsed straight into shapely geometries, which are fixed as
+    [antimeridian.fix_geometries][] does. Only the geometries that changed are
+    serialized again. The others are returned as the very same bytes (or hex
+    strings) that came in. The spatial reference ID of extended WKB is
+    kept.
 
-def fix_line_string(
-    line_string: LineString, great_circle: bool
-) -> LineString | MultiLineString:
-    """Fixes a [shapely.LineString][].
+    See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
+    `force_south_pole` and `fix_winding` arguments, and
+    [antimeridian.fix_geometries][] for `workers` and `executor`.
 
     Args:
-        line_string: The input line string
+        wkb: A WKB geometry as bytes or a hex string, or an array of them.
+            Missing geometries (`None`) are passed through.
+        force_north_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the north pole.
+        force_south_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the south pole.
+        fix_winding: If the polygon is wound clockwise, reverse its
+            coordinates before applying the algorithm. Defaults to `None`,
+            which behaves like `True` but emits a warning when winding is
+            corrected. Pass `True` to fix winding silently, or `False` to
+            disable winding correction entirely.
         great_circle: Compute meridian crossings on the sphere rather than
             using 2D geometry.
+        reverse: Reverse the coordinates before fixing.
+        stats: If provided, updated with how many geometries were fixed and
+            how many were returned unchanged.
+        workers: The number of workers used to fix geometries.
+        executor: Run the workers in a `"process"` pool, a `"thread"` pool,
+            or an existing pool.
 
     Returns:
-        The fixed line string, either as a single line string or a multi-line
-        string (if it was split)
+        The fixed WKB, in the same form as the input: bytes, a hex string, or
+            an array of them
     """
-    segments = segment(list(line_string.coords), great_circle)
-    if not segments:
-        return line_string
-    else:
-        return MultiLineString(segments)
-
+    array = numpy.asarray(wkb, dtype=object)
+    flat, _ = fix_wkb_array(
+        array.ravel(),
+        force_north_pole=force_north_pole,
+        force_south_pole=force_south_pole,
+        fix_winding=fix_winding,
+        great_circle=great_circle,
+        reverse=reverse,
+        stats=stats,
+        workers=workers,
+        executor=executor,
+    )
+    return flat.reshape(array.shape) if array.ndim else flat[0]
 
-def fix_multi_line_string(
-    multi_line_string: MultiLineString, great_circle: bool
-) -> MultiLineString:
-    """Fixes a [shapely.MultiLineString][].
 
-    Args:
-        multi_line_string: The input multi line string
-        great_circle: Compute meridian crossings on the sphere rather than
-            using 2D geometry.
+def fix_wkb_array(
+    wkb: numpy.ndarray, **options: Any
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Fixes a flat array of WKB, returning both the WKB and the geometries.
 
-    Returns:
-        The fixed multi line string
+    Only the geometries that changed are serialized, in the encoding (bytes
+    or hex) they came in.
     """
-    line_strings = list()
+    geometries = shapely.from_wkb(wkb)
+    fixed = fix_geometries(geometries, **options)
+    changed = numpy.flatnonzero(
+        [a is not b for a, b in zip(fixed.tolist(), geometries.tolist())]
+    )
+    if len(changed):
+        wkb = wkb.copy()
+        fixed[changed] = shapely.set_srid(
+            fixed[changed], shapely.get_srid(geometries[changed])
+        )
+        is_hex = numpy.array([isinstance(wkb[i], str) for i in changed.tolist()])
+        for hex in (False, True):
+            wkb[changed[is_hex == hex]] = shapely.to_wkb(
+                fixed[changed[is_hex == hex]], hex=hex, include_srid=True
+            )
+    return wkb, fixed
+
+
+def fix_geometries_at(
+    geometries: numpy.ndarray,
+    indices: numpy.ndarray,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+) -> numpy.ndarray:
+    """Runs the algorithm on the geometries at `indices`, leaving the rest.
+
+    The pure-Python part of the algorithm runs geometry by geometry, then all
+    resulting polygons and line strings are built with vectorized shapely
+    calls.
+    """
+    type_ids = shapely.get_type_id(geometries)
+    fixed = geometries.copy()
+    # Polygons are split first, then assembled all together.
+    split_polygons: list[list[Polygon] | PolygonPieces] = []
+    split_owners: list[int] = []
+    lines: list[numpy.ndarray] = []
+    line_owners: list[int] = []
+    for i in indices.tolist():
+        geometry = geometries[i]
+        if type_ids[i] == shapely.GeometryType.POLYGON:
+            split_polygons.append(
+                split_polygon(
+                    geometry,
+                    force_north_pole=force_north_pole,
+                    force_south_pole=force_south_pole,
+                    fix_winding=False
+                    if force_north_pole or force_south_pole
+                    else fix_winding,
+                    great_circle=great_circle,
+                )
+            )
+            split_owners.append(i)
+        elif type_ids[i] == shapely.GeometryType.MULTIPOLYGON:
+            for polygon in geometry.geoms:
+                split_polygons.append(
+                    split_polygon(
+                        polygon,
+                        force_north_pole=force_north_pole,
+                        force_south_pole=force_south_pole,
+                        fix_winding=fix_winding,
+                        great_circle=great_circle,
+                    )
+                )
+                split_owners.append(i)
+        elif type_ids[i] == shapely.GeometryType.LINESTRING:
+            segments = segment(numpy.asarray(geometry.coords), great_circle)
+            if segments:
+                lines.extend(segments.arrays())
+                line_owners.extend([i] * len(segments))
+        else:
+            for line_string in geometry.geoms:
+                coords = numpy.asarray(line_string.coords)
+                segments = segment(coords, great_circle)
+                if segments:
+                    lines.extend(segments.arrays())
+                    line_owners.extend([i] * len(segments))
+                else:
+                    lines.append(coords)
+                    line_owners.append(i)
+
+    polygons: list[Polygon] = []
+    polygon_owners: list[int] = []
+    single_polygons: list[int] = []
+    for i, assembled in zip(split_owners, assemble_polygons(split_polygons)):
+        if type_ids[i] == shapely.GeometryType.POLYGON and len(assembled) == 1:
+            fixed[i] = assembled[0]
+            single_polygons.append(i)
+        else:
+            polygons.extend(assembled)
+            polygon_owners.extend([i] * len(assembled))
+    if single_polygons:
+        is_ccw = shapely.is_ccw(shapely.get_exterior_ring(fixed[single_polygons]))
+        for i in numpy.asarray(single_polygons)[~is_ccw].tolist():
+            fixed[i] = cover_poles_if_clockwise(fixed[i])
+    if polygons:
+        owners, indices = numpy.unique(polygon_owners, return_inverse=True)
+        fixed[owners] = shapely.multipolygons(polygons, indices=indices)
+    if lines:
+        line_strings = shapely.linestrings(
+            numpy.concatenate(lines),
+            indices=numpy.repeat(numpy.arange(len(lines)), [len(c) for c in lines]),
+        )
+        owners, indices = numpy.unique(line_owners, return_inverse=True)
+        fixed[owners] = shapely.multilinestrings(line_strings, indices=indices)
+    return fixed
+
+
+SUPPORTED_TYPE_IDS = (
+    shapely.GeometryType.MISSING,
+    shapely.GeometryType.LINESTRING,
+    shapely.GeometryType.POLYGON,
+    shapely.GeometryType.MULTILINESTRING,
+    shapely.GeometryType.MULTIPOLYGON,
+)
+
+
+def might_cross_antimeridian(
+    geometries: numpy.ndarray,
+    type_ids: numpy.ndarray,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+) -> numpy.ndarray:
+    """Screens an array of geometries for ones that need to be fixed.
+
+    The screen is conservative: every geometry that would be changed by the
+    algorithm (other than removing duplicate points or re-wrapping in-range
+    longitudes) is flagged, along with a few that wouldn't.
+
+    Returns:
+        A boolean mask of the geometries to fix
+    """
+    coords, index = shapely.get_coordinates(geometries, return_index=True)
+    mask = might_cross_antimeridian_coords(coords[:, 0], index, type_ids)
+
+    # Polygons are also re-wound.
+    polygonal = numpy.flatnonzero(is_polygonal_type(type_ids) & ~mask)
+    if len(polygonal):
+        parts, part_index = shapely.get_parts(geometries[polygonal], return_index=True)
+        rings, ring_index = shapely.get_rings(parts, return_index=True)
+        owners = polygonal[part_index[ring_index]]
+        is_exterior = numpy.ones(len(rings), dtype=bool)
+        is_exterior[1:] = ring_index[1:] != ring_index[:-1]
+        is_wrong = is_wound_wrong(
+            shapely.is_ccw(rings),
+            is_exterior,
+            type_ids[owners] == shapely.GeometryType.POLYGON,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        )
+        mask[owners[is_wrong]] = True
+    return mask
+
+
+def might_cross_antimeridian_coords(
+    lon: numpy.ndarray, index: numpy.ndarray, type_ids: numpy.ndarray
+) -> numpy.ndarray:
+    """Screens the longitudes of an array of geometries, where `index` is the
+    geometry of each longitude."""
+    mask = numpy.zeros(len(type_ids), dtype=bool)
+    # Any jump of more than 180° between two points in the same geometry is a
+    # potential crossing.
+    is_jump = (numpy.abs(numpy.diff(lon)) > 180) & (index[1:] == index[:-1])
+    mask[index[1:][is_jump]] = True
+
+    # Polygons are normalized, so any longitude out of (-180, 180) needs work.
+    is_out_of_range = (lon <= -180) | (lon >= 180)
+    mask[index[is_out_of_range & is_polygonal_type(type_ids)[index]]] = True
+    return mask
+
+
+def is_wound_wrong(
+    is_ccw: numpy.ndarray,
+    is_exterior: numpy.ndarray,
+    is_polygon: numpy.ndarray,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+) -> numpy.ndarray:
+    """Finds the rings that the algorithm would re-wind.
+
+    Single polygons always need a counterclockwise exterior, since a
+    clockwise one covers the poles.
+    """
+    fix_multi_polygon_winding = fix_winding is not False
+    fix_polygon_winding = fix_multi_polygon_winding and not (
+        force_north_pole or force_south_pole
+    )
+    is_wrong: numpy.ndarray = (
+        is_exterior & ~is_ccw & (is_polygon | fix_multi_polygon_winding)
+    ) | (
+        ~is_exterior
+        & is_ccw
+        & numpy.where(is_polygon, fix_polygon_winding, fix_multi_polygon_winding)
+    )
+    return is_wrong
+
+
+def is_polygonal_type(type_ids: numpy.ndarray) -> numpy.ndarray:
+    is_polygonal: numpy.ndarray = (type_ids == shapely.GeometryType.POLYGON) | (
+        type_ids == shapely.GeometryType.MULTIPOLYGON
+    )
+    return is_polygonal
+
+
+def might_cross_antimeridian_geojson(
+    geojson: dict[str, Any],
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+) -> bool:
+    """Screens a GeoJSON geometry's raw coordinates for anything to fix.
+
+    This is the single-shape equivalent of `might_cross_antimeridian`, and
+    is just as conservative: anything that isn't obviously fine, including
+    types we don't know about and malformed coordinates, is flagged.
+    """
+    type_ = geojson.get("type", None)
+    coordinates: Any = geojson.get("coordinates", None)
+    fix_multi_polygon_winding = fix_winding is not False
+    try:
+        if type_ == "Polygon":
+            return polygons_might_cross_antimeridian(
+                [coordinates],
+                check_exterior_winding=True,
+                check_interior_winding=fix_multi_polygon_winding
+                and not (force_north_pole or force_south_pole),
+            )
+        elif type_ == "MultiPolygon":
+            return polygons_might_cross_antimeridian(
+                coordinates,
+                check_exterior_winding=fix_multi_polygon_winding,
+                check_interior_winding=fix_multi_polygon_winding,
+            )
+        elif type_ == "LineString":
+            return has_jump(numpy.asarray(coordinates, dtype=numpy.float64))
+        elif type_ == "MultiLineString":
+            return any(
+                has_jump(numpy.asarray(line_string, dtype=numpy.float64))
+                for line_string in coordinates
+            )
+        else:
+            return True
+    except (IndexError, TypeError, ValueError, shapely.errors.GEOSException):
+        return True
+
+
+def polygons_might_cross_antimeridian(
+    polygons: list[list[list[list[float]]]],
+    *,
+    check_exterior_winding: bool,
+    check_interior_winding: bool,
+) -> bool:
+    rings = []
+    is_exterior = []
+    for polygon in polygons:
+        for i, ring in enumerate(polygon):
+            coords = numpy.asarray(ring, dtype=numpy.float64)
+            lon = coords[:, 0]
+            if ((lon <= -180) | (lon >= 180)).any() or has_jump(coords):
+                return True
+            if check_exterior_winding if i == 0 else check_interior_winding:
+                rings.append(coords[:, :2])
+                is_exterior.append(i == 0)
+    if not rings:
+        return False
+    # Winding is checked by GEOS (on bare rings, which are cheap to build) so
+    # that we agree with the algorithm even on self-intersecting rings.
+    is_ccw = shapely.is_ccw(
+        shapely.linearrings(
+            numpy.concatenate(rings),
+            indices=numpy.repeat(numpy.arange(len(rings)), [len(r) for r in rings]),
+        )
+    )
+    return bool((is_ccw != numpy.array(is_exterior)).any())
+
+
+def has_jump(coords: numpy.ndarray) -> bool:
+    """Are any two consecutive points more than 180° of longitude apart?"""
+    return bool((numpy.abs(numpy.diff(coords[:, 0])) > 180).any())
+
+
+def fix_features_in_parallel(
+    features: list[dict[str, Any]],
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+    reverse: bool,
+    stats: FixStats | None,
+    workers: int | None,
+    executor: ExecutorLike,
+    output: Output,
+    inplace: bool,
+) -> None:
+    """Fixes a list of features in-place, using a process or thread pool.
+
+    The list is always updated in-place, but unless `inplace` the features
+    in it are replaced with copies rather than mutated.
+
+    Features that don't need fixing are handled up front, without leaving
+    this thread. The rest are fixed in chunks in the pool. For a process
+    pool, chunks are packed into coordinate arrays to cross the process
+    boundary, and warnings raised in the pool are re-raised here.
+    """
+    options: dict[str, Any] = {
+        "force_north_pole": force_north_pole,
+        "force_south_pole": force_south_pole,
+        "fix_winding": fix_winding,
+        "great_circle": great_circle,
+        "reverse": reverse,
+    }
+    to_fix = []
+    for i, feature in enumerate(features):
+        geometry = feature.get("geometry", None)
+        if feature.get("type", None) != "Feature" or geometry is None:
+            # Let the serial path handle (or complain about) anything else.
+            features[i] = fix_geojson(
+                feature, stats=stats, output=output, inplace=inplace, **options
+            )
+            continue
+        geojson = geometry if isinstance(geometry, dict) else geometry.__geo_interface__
+        if geojson.get("type", None) not in PACKABLE_GEOJSON_TYPES:
+            features[i] = fix_geojson(
+                feature, stats=stats, output=output, inplace=inplace, **options
+            )
+        elif reverse or might_cross_antimeridian_geojson(
+            geojson,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        ):
+            to_fix.append(i)
+        else:
+            if output == "geojson":
+                unchanged = geojson
+            elif not isinstance(geometry, shapely.Geometry):
+                unchanged = to_output(shapely.geometry.shape(geojson), output)
+            else:
+                unchanged = to_output(geometry, output)
+            features[i] = with_geometry(feature, unchanged, inplace)
+            if stats is not None:
+                stats.unchanged += 1
+    if stats is not None:
+        stats.fixed += len(to_fix)
+    if not to_fix:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    chunks = split_into_chunks(to_fix, workers)
+    geometries = ([features[i]["geometry"] for i in chunk] for chunk in chunks)
+    if uses_threads(executor):
+        results = map_in_pool(
+            fix_geojson_chunk, geometries, options, workers=workers, executor=executor
+        )
+        for chunk, fixed in zip(chunks, results):
+            for i, geometry in zip(chunk, fixed):
+                features[i] = with_geometry(
+                    features[i], to_output(geometry, output), inplace
+                )
+    else:
+        packed_results = map_in_pool(
+            fix_packed_geometries,
+            (pack_geojson(chunk) for chunk in geometries),
+            options,
+            workers=workers,
+            executor=executor,
+        )
+        for chunk, (packed, caught) in zip(chunks, packed_results):
+            warn_all(caught)
+            for i, geometry in zip(chunk, unpack_shapely(packed)):
+                features[i] = with_geometry(
+                    features[i], to_output(geometry, output), inplace
+                )
+
+
+def split_into_chunks(
+    indices: Sequence[int] | numpy.ndarray, workers: int
+) -> list[Any]:
+    """Splits indices into about four chunks per worker, to balance the load."""
+    chunksize = -(-len(indices) // (workers * 4))
+    return [
+        indices[start : start + chunksize]
+        for start in range(0, len(indices), chunksize)
+    ]
+
+
+def map_in_pool(
+    function: Callable[[Any, dict[str, Any]], Any],
+    chunks: Iterable[Any],
+    options: dict[str, Any],
+    *,
+    workers: int,
+    executor: ExecutorLike,
+) -> Iterator[Any]:
+    """Maps a function over chunks in a pool, yielding results in order.
+
+    A pool passed in as `executor` is used as it is, and left running.
+    """
+    pool: concurrent.futures.Executor
+    if isinstance(executor, concurrent.futures.Executor):
+        yield from executor.map(function, chunks, itertools.repeat(options))
+        return
+    elif executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+    elif executor == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(workers)
+    else:
+        raise ValueError(f"unknown executor: {executor}")
+    with pool:
+        yield from pool.map(function, chunks, itertools.repeat(options))
+
+
+def uses_threads(executor: ExecutorLike) -> bool:
+    """Whether chunks can be handed to the pool as they are, without packing."""
+    return executor == "thread" or isinstance(
+        executor, concurrent.futures.ThreadPoolExecutor
+    )
+
+
+def warn_all(caught: list[tuple[type[Warning], str]]) -> None:
+    for category, message in caught:
+        warnings.warn(message, category, stacklevel=3)
+
+
+def fix_packed_geometries(
+    packed: PackedGeometries, options: dict[str, Any]
+) -> tuple[PackedGeometries, list[tuple[type[Warning], str]]]:
+    """Fixes packed geometries, returning packed results and any warnings.
+
+    This is the unit of work for a process pool, so everything in and out
+    is cheap to pickle.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        fixed = fix_geometry_chunk(unpack_shapely(packed), options)
+    return pack_shapely(fixed), [(w.category, str(w.message)) for w in caught]
+
+
+def fix_geojson_chunk(
+    geometries: list[dict[str, Any]], options: dict[str, Any]
+) -> numpy.ndarray:
+    """Fixes GeoJSON geometries, for a thread pool."""
+    return fix_geometry_chunk(unpack_shapely(pack_geojson(geometries)), options)
+
+
+def fix_geometry_chunk(
+    geometries: numpy.ndarray, options: dict[str, Any]
+) -> numpy.ndarray:
+    """Fixes every geometry in a chunk, for a thread pool."""
+    if options["reverse"]:
+        geometries = shapely.reverse(geometries)
+    return fix_geometries_at(
+        geometries,
+        numpy.arange(len(geometries)),
+        force_north_pole=options["force_north_pole"],
+        force_south_pole=options["force_south_pole"],
+        fix_winding=options["fix_winding"],
+        great_circle=options["great_circle"],
+    )
+
+
+PACKABLE_GEOJSON_TYPES = {
+    "LineString": shapely.GeometryType.LINESTRING,
+    "Polygon": shapely.GeometryType.POLYGON,
+    "MultiLineString": shapely.GeometryType.MULTILINESTRING,
+    "MultiPolygon": shapely.GeometryType.MULTIPOLYGON,
+}
+
+
+class PackedGeometries(NamedTuple):
+    """Geometries packed into flat coordinate and offset arrays.
+
+    Every geometry type uses the same nesting as a GeoArrow multi-polygon:
+    a geometry is made of parts (polygons or line strings), a part is made
+    of rings (a polygon's rings, or a single line string), and a ring is a
+    run of coordinates. Offsets index into the next level down.
+    """
+
+    type_ids: numpy.ndarray
+    """The [shapely.GeometryType][] of each geometry."""
+
+    has_z: numpy.ndarray
+    """Whether each geometry has a z coordinate."""
+
+    coords: numpy.ndarray
+    """All coordinates, (N, 2) or (N, 3) if any geometry has z."""
+
+    ring_offsets: numpy.ndarray
+    part_offsets: numpy.ndarray
+    geometry_offsets: numpy.ndarray
+
+
+def pack_geojson(
+    geometries: Sequence[dict[str, Any] | GeoInterface],
+) -> PackedGeometries:
+    type_ids = []
+    has_z = []
+    rings = []
+    rings_per_part = []
+    parts_per_geometry = []
+    for geometry in geometries:
+        geojson = geometry if isinstance(geometry, dict) else geometry.__geo_interface__
+        type_ = geojson.get("type", None)
+        coordinates: Any = geojson.get("coordinates", None)
+        parts: list[Any]
+        if type_ == "LineString":
+            parts = [[coordinates]]
+        elif type_ == "MultiLineString":
+            parts = [[line_string] for line_string in coordinates]
+        elif type_ == "Polygon":
+            parts = [coordinates]
+        elif type_ == "MultiPolygon":
+            parts = coordinates
+        else:
+            raise ValueError(f"unsupported geom_type: {type_}")
+        type_ids.append(PACKABLE_GEOJSON_TYPES[type_])
+        dimension = 2
+        for part in parts:
+            for ring in part:
+                coords = numpy.asarray(ring, dtype=numpy.float64)
+                if not coords.size:
+                    coords = coords.reshape(0, 2)
+                if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+                    raise ValueError(f"invalid coordinates for a {type_}: {ring}")
+                dimension = max(dimension, coords.shape[1])
+                rings.append(coords)
+            rings_per_part.append(len(part))
+        parts_per_geometry.append(len(parts))
+        has_z.append(dimension == 3)
+
+    dimension = 3 if any(has_z) else 2
+    if dimension == 3:
+        rings = [
+            ring
+            if ring.shape[1] == 3
+            else numpy.pad(ring, ((0, 0), (0, 1)), constant_values=numpy.nan)
+            for ring in rings
+        ]
+    return PackedGeometries(
+        type_ids=numpy.array(type_ids, dtype=numpy.int8),
+        has_z=numpy.array(has_z, dtype=bool),
+        coords=numpy.concatenate(rings) if rings else numpy.empty((0, dimension)),
+        ring_offsets=offsets_from_counts([len(ring) for ring in rings]),
+        part_offsets=offsets_from_counts(rings_per_part),
+        geometry_offsets=offsets_from_counts(parts_per_geometry),
+    )
+
+
+def pack_shapely(geometries: numpy.ndarray) -> PackedGeometries:
+    type_ids = shapely.get_type_id(geometries)
+    if not numpy.isin(type_ids, tuple(PACKABLE_GEOJSON_TYPES.values())).all():
+        raise ValueError("can only pack line strings, polygons, and their multis")
+    has_z = shapely.has_z(geometries)
+    parts, part_geometry = shapely.get_parts(geometries, return_index=True)
+    is_polygon = shapely.get_type_id(parts) == shapely.GeometryType.POLYGON
+    polygon_parts = numpy.flatnonzero(is_polygon)
+    line_parts = numpy.flatnonzero(~is_polygon)
+    polygon_rings, polygon_ring_part = shapely.get_rings(
+        parts[polygon_parts], return_index=True
+    )
+    rings = numpy.concatenate((polygon_rings, parts[line_parts]))
+    ring_part = numpy.concatenate((polygon_parts[polygon_ring_part], line_parts))
+    order = numpy.argsort(ring_part, kind="stable")
+    rings = rings[order]
+    ring_part = ring_part[order]
+    coords, coord_ring = shapely.get_coordinates(
+        rings, include_z=bool(has_z.any()), return_index=True
+    )
+    return PackedGeometries(
+        type_ids=type_ids.astype(numpy.int8),
+        has_z=has_z,
+        coords=coords,
+        ring_offsets=offsets_from_counts(
+            numpy.bincount(coord_ring, minlength=len(rings))
+        ),
+        part_offsets=offsets_from_counts(
+            numpy.bincount(ring_part, minlength=len(parts))
+        ),
+        geometry_offsets=offsets_from_counts(
+            numpy.bincount(part_geometry, minlength=len(geometries))
+        ),
+    )
+
+
+def unpack_shapely(packed: PackedGeometries) -> numpy.ndarray:
+    geometries = numpy.empty(len(packed.type_ids), dtype=object)
+    geometry_ids = numpy.arange(len(packed.type_ids))
+    part_geometry = numpy.repeat(geometry_ids, numpy.diff(packed.geometry_offsets))
+    ring_part = numpy.repeat(
+        numpy.arange(len(packed.part_offsets) - 1), numpy.diff(packed.part_offsets)
+    )
+    coord_ring = numpy.repeat(
+        numpy.arange(len(packed.ring_offsets) - 1), numpy.diff(packed.ring_offsets)
+    )
+    coord_geometry = part_geometry[ring_part[coord_ring]]
+    is_polygonal = (packed.type_ids == shapely.GeometryType.POLYGON) | (
+        packed.type_ids == shapely.GeometryType.MULTIPOLYGON
+    )
+    is_single = (packed.type_ids == shapely.GeometryType.POLYGON) | (
+        packed.type_ids == shapely.GeometryType.LINESTRING
+    )
+    is_empty = (
+        numpy.diff(packed.ring_offsets[packed.part_offsets[packed.geometry_offsets]])
+        == 0
+    )
+    for polygonal in (True, False):
+        for has_z in (False, True):
+            selected = (is_polygonal == polygonal) & (packed.has_z == has_z) & ~is_empty
+            if not selected.any():
+                continue
+            is_selected_coord = selected[coord_geometry]
+            coords = packed.coords[is_selected_coord, : 3 if has_z else 2]
+            ring_ids = compact_ids(coord_ring[is_selected_coord])
+            if polygonal:
+                rings = shapely.linearrings(coords, indices=ring_ids)
+                selected_rings = numpy.unique(coord_ring[is_selected_coord])
+                parts = shapely.polygons(
+                    rings, indices=compact_ids(ring_part[selected_rings])
+                )
+            else:
+                parts = shapely.linestrings(coords, indices=ring_ids)
+            selected_parts = numpy.unique(ring_part[coord_ring[is_selected_coord]])
+            owners = part_geometry[selected_parts]
+            is_single_owner = is_single[owners]
+            geometries[owners[is_single_owner]] = parts[is_single_owner]
+            multi_owners = owners[~is_single_owner]
+            if len(multi_owners):
+                multi = (
+                    shapely.multipolygons if polygonal else shapely.multilinestrings
+                )(parts[~is_single_owner], indices=compact_ids(multi_owners))
+                geometries[numpy.unique(multi_owners)] = multi
+    for i in numpy.flatnonzero(is_empty).tolist():
+        geometries[i] = shapely.from_wkt(
+            shapely.GeometryType(packed.type_ids[i]).name + " EMPTY"
+        )
+    return geometries
+
+
+def offsets_from_counts(counts: Sequence[int] | numpy.ndarray) -> numpy.ndarray:
+    offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def compact_ids(ids: numpy.ndarray) -> numpy.ndarray:
+    """Renumbers sorted, possibly gappy ids to 0, 1, 2, ..."""
+    compacted = numpy.zeros(len(ids), dtype=numpy.int64)
+    numpy.cumsum(ids[1:] != ids[:-1], out=compacted[1:])
+    return compacted
+
+
+MULTI_GEOARROW_TYPES = {
+    shapely.GeometryType.LINESTRING: shapely.GeometryType.MULTILINESTRING,
+    shapely.GeometryType.POLYGON: shapely.GeometryType.MULTIPOLYGON,
+    shapely.GeometryType.MULTILINESTRING: shapely.GeometryType.MULTILINESTRING,
+    shapely.GeometryType.MULTIPOLYGON: shapely.GeometryType.MULTIPOLYGON,
+}
+"""The GeoArrow layouts we can fix, and the layout each one becomes if a
+geometry is split."""
+
+
+def pack_ragged(
+    geometry_type: shapely.GeometryType,
+    coords: numpy.ndarray,
+    offsets: tuple[numpy.ndarray, ...],
+) -> PackedGeometries:
+    """Views GeoArrow buffers as packed geometries, without copying coordinates.
+
+    Levels of nesting that the layout doesn't have get one entry per item of
+    the level below. The offsets are rebased to start at zero, so slices of
+    larger buffers work too.
+    """
+    levels = len(offsets)
+    if geometry_type == shapely.GeometryType.LINESTRING and levels == 1:
+        (ring_offsets,) = offsets
+        part_offsets = geometry_offsets = numpy.arange(len(ring_offsets))
+    elif geometry_type == shapely.GeometryType.POLYGON and levels == 2:
+        ring_offsets, part_offsets = offsets
+        geometry_offsets = numpy.arange(len(part_offsets))
+    elif geometry_type == shapely.GeometryType.MULTILINESTRING and levels == 2:
+        ring_offsets, geometry_offsets = offsets
+        part_offsets = numpy.arange(len(ring_offsets))
+    elif geometry_type == shapely.GeometryType.MULTIPOLYGON and levels == 3:
+        ring_offsets, part_offsets, geometry_offsets = offsets
+    else:
+        raise ValueError(
+            f"invalid offsets for a {shapely.GeometryType(geometry_type).name} "
+            f"array: expected {len(PACKED_LEVELS[geometry_type])}, got {levels}"
+        )
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+        raise ValueError(f"invalid coordinates shape: {coords.shape}")
+    geometry_offsets = numpy.asarray(geometry_offsets, dtype=numpy.int64)
+    part_offsets = numpy.asarray(part_offsets, dtype=numpy.int64)[
+        geometry_offsets[0] : geometry_offsets[-1] + 1
+    ]
+    ring_offsets = numpy.asarray(ring_offsets, dtype=numpy.int64)[
+        part_offsets[0] : part_offsets[-1] + 1
+    ]
+    return PackedGeometries(
+        type_ids=numpy.full(len(geometry_offsets) - 1, geometry_type, dtype=numpy.int8),
+        has_z=numpy.full(len(geometry_offsets) - 1, coords.shape[1] == 3),
+        coords=coords[ring_offsets[0] : ring_offsets[-1]],
+        ring_offsets=ring_offsets - ring_offsets[0],
+        part_offsets=part_offsets - part_offsets[0],
+        geometry_offsets=geometry_offsets - geometry_offsets[0],
+    )
+
+
+PACKED_LEVELS = {
+    shapely.GeometryType.LINESTRING: ("ring_offsets",),
+    shapely.GeometryType.POLYGON: ("ring_offsets", "part_offsets"),
+    shapely.GeometryType.MULTILINESTRING: ("ring_offsets", "geometry_offsets"),
+    shapely.GeometryType.MULTIPOLYGON: (
+        "ring_offsets",
+        "part_offsets",
+        "geometry_offsets",
+    ),
+}
+"""Which of the packed offsets each GeoArrow layout keeps."""
+
+
+def unpack_ragged(
+    packed: PackedGeometries,
+    geometry_type: shapely.GeometryType,
+    dtype: numpy.dtype[Any],
+) -> tuple[shapely.GeometryType, numpy.ndarray, tuple[numpy.ndarray, ...]]:
+    """Lays packed geometries out as GeoArrow buffers of one type.
+
+    The packed geometries must fit the layout, e.g. every geometry of a
+    polygon layout must have exactly one part.
+    """
+    if geometry_type == shapely.GeometryType.MULTIPOLYGON:
+        # A multi-polygon has no empty parts (and shapely can't build
+        # polygons without rings from buffers), so drop empty polygons.
+        is_empty_part = numpy.diff(packed.part_offsets) == 0
+        if is_empty_part.any():
+            packed = packed._replace(
+                part_offsets=packed.part_offsets[
+                    numpy.concatenate(([True], ~is_empty_part))
+                ],
+                geometry_offsets=offsets_from_counts(~is_empty_part)[
+                    packed.geometry_offsets
+                ],
+            )
+    return (
+        geometry_type,
+        packed.coords,
+        tuple(
+            getattr(packed, level).astype(dtype)
+            for level in PACKED_LEVELS[geometry_type]
+        ),
+    )
+
+
+def take_packed(packed: PackedGeometries, indices: numpy.ndarray) -> PackedGeometries:
+    """Copies the geometries at `indices` into new packed geometries."""
+    parts = ranges(packed.geometry_offsets, indices)
+    rings = ranges(packed.part_offsets, parts)
+    return PackedGeometries(
+        type_ids=packed.type_ids[indices],
+        has_z=packed.has_z[indices],
+        coords=packed.coords[ranges(packed.ring_offsets, rings)],
+        ring_offsets=offsets_from_counts(numpy.diff(packed.ring_offsets)[rings]),
+        part_offsets=offsets_from_counts(numpy.diff(packed.part_offsets)[parts]),
+        geometry_offsets=offsets_from_counts(
+            numpy.diff(packed.geometry_offsets)[indices]
+        ),
+    )
+
+
+def splice_packed(
+    packed: PackedGeometries, indices: numpy.ndarray, replacements: PackedGeometries
+) -> PackedGeometries:
+    """Replaces the geometries at `indices` with `replacements`, in order."""
+    dimension = max(packed.coords.shape[1], replacements.coords.shape[1])
+    coords = [
+        c
+        if c.shape[1] == dimension
+        else numpy.pad(c, ((0, 0), (0, 1)), constant_values=numpy.nan)
+        for c in (packed.coords, replacements.coords)
+    ]
+    combined = PackedGeometries(
+        type_ids=numpy.concatenate((packed.type_ids, replacements.type_ids)),
+        has_z=numpy.concatenate((packed.has_z, replacements.has_z)),
+        coords=numpy.concatenate(coords),
+        ring_offsets=numpy.concatenate(
+            (packed.ring_offsets, replacements.ring_offsets[1:] + len(packed.coords))
+        ),
+        part_offsets=numpy.concatenate(
+            (
+                packed.part_offsets,
+                replacements.part_offsets[1:] + len(packed.ring_offsets) - 1,
+            )
+        ),
+        geometry_offsets=numpy.concatenate(
+            (
+                packed.geometry_offsets,
+                replacements.geometry_offsets[1:] + len(packed.part_offsets) - 1,
+            )
+        ),
+    )
+    order = numpy.arange(len(packed.type_ids))
+    order[indices] = len(packed.type_ids) + numpy.arange(len(indices))
+    return take_packed(combined, order)
+
+
+def ranges(offsets: numpy.ndarray, indices: numpy.ndarray) -> numpy.ndarray:
+    """Concatenates `range(offsets[i], offsets[i + 1])` for each of `indices`."""
+    starts = offsets[indices]
+    counts = offsets[indices + 1] - starts
+    return numpy.repeat(starts - offsets_from_counts(counts)[:-1], counts) + (
+        numpy.arange(counts.sum())
+    )
+
+
+def might_cross_antimeridian_packed(
+    packed: PackedGeometries,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+) -> numpy.ndarray:
+    """Screens packed geometries, just like `might_cross_antimeridian`."""
+    part_geometry = numpy.repeat(
+        numpy.arange(len(packed.type_ids)), numpy.diff(packed.geometry_offsets)
+    )
+    ring_part = numpy.repeat(
+        numpy.arange(len(packed.part_offsets) - 1), numpy.diff(packed.part_offsets)
+    )
+    ring_counts = numpy.diff(packed.ring_offsets)
+    ring_geometry = part_geometry[ring_part]
+    mask = might_cross_antimeridian_coords(
+        packed.coords[:, 0],
+        numpy.repeat(ring_geometry, ring_counts),
+        packed.type_ids,
+    )
+
+    polygonal = numpy.flatnonzero(is_polygonal_type(packed.type_ids) & ~mask)
+    if len(polygonal):
+        parts = ranges(packed.geometry_offsets, polygonal)
+        rings = ranges(packed.part_offsets, parts)
+        rings = rings[ring_counts[rings] > 0]
+        is_ccw = shapely.is_ccw(
+            shapely.linearrings(
+                packed.coords[ranges(packed.ring_offsets, rings), :2],
+                indices=numpy.repeat(numpy.arange(len(rings)), ring_counts[rings]),
+            )
+        )
+        owners = ring_geometry[rings]
+        is_wrong = is_wound_wrong(
+            is_ccw,
+            packed.part_offsets[ring_part[rings]] == rings,
+            packed.type_ids[owners] == shapely.GeometryType.POLYGON,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+        )
+        mask[owners[is_wrong]] = True
+    return mask
+
+
+def segment_shape(
+    shape: dict[str, Any] | GeoInterface, great_circle: bool
+) -> list[list[XY]]:
+    geom = shapely.geometry.shape(shape)
+    if geom.geom_type == "Polygon":
+        return segment_polygon(geom, great_circle)
+    elif geom.geom_type == "MultiPolygon":
+        segments = list()
+        for polygon in geom.geoms:
+            segments += segment_polygon(polygon, great_circle)
+        return segments
+    else:
+        raise ValueError(f"unsupported geom_type: {geom.geom_type}")
+
+
+def fix_multi_polygon(
+    multi_polygon: MultiPolygon,
+    *,
+    force_north_pole: bool = False,
+    force_south_pole: bool = False,
+    fix_winding: bool | None = None,
+    great_circle: bool = True,
+) -> MultiPolygon:
+    """Fixes a [shapely.MultiPolygon][].
+
+    See [antimeridian.fix_polygon][] for a description of the `force_north_pole`
+    `force_south_pole` and `fix_winding` arguments.
+
+    Args:
+        multi_polygon: The multi-polygon
+        force_north_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the north pole.
+        force_south_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the south pole.
+        fix_winding: If the polygon is wound clockwise, reverse its
+            coordinates before applying the algorithm. Defaults to `None`,
+            which behaves like `True` but emits a warning when winding is
+            corrected. Pass `True` to fix winding silently, or `False` to
+            disable winding correction entirely.
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+
+    Returns:
+        The fixed multi-polygon
+    """
+    split_polygons = [
+        split_polygon(
+            polygon,
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
+        )
+        for polygon in multi_polygon.geoms
+    ]
+    return MultiPolygon(
+        [polygon for split in assemble_polygons(split_polygons) for polygon in split]
+    )
+
+
+def fix_polygon(
+    polygon: Polygon,
+    *,
+    force_north_pole: bool = False,
+    force_south_pole: bool = False,
+    fix_winding: bool | None = None,
+    great_circle: bool = True,
+) -> Polygon | MultiPolygon:
+    """Fixes a [shapely.Polygon][].
+
+    If the input polygon is wound clockwise, it will be fixed to be wound
+    counterclockwise _unless_ `fix_winding` is `False` in which case it
+    will be corrected by adding a counterclockwise polygon from (-180, -90) to
+    (180, 90) as its exterior.
+
+    In rare cases, the underlying algorithm might need a little help to fix the polygon.
+    For example, a polygon that just barely crosses over a pole might have very
+    few points at high latitudes, leading to ambiguous antimeridian crossing
+    points and invalid geometries. We provide two flags, `force_north_pole`
+    and `force_south_pole` for those cases. Most users can ignore these
+    flags.
+
+    If either `force_north_pole` or `force_south_pole` is `True`
+    `fix_winding` is set to `False`
+
+    Args:
+        polygon: The input polygon
+        force_north_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the north pole.
+        force_south_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the south pole.
+        fix_winding: If the polygon is wound clockwise, reverse its
+            coordinates before applying the algorithm. Defaults to `None`,
+            which behaves like `True` but emits a warning when winding is
+            corrected. Pass `True` to fix winding silently, or `False` to
+            disable winding correction entirely.
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+
+    Returns:
+        The fixed polygon, either as a single polygon or a multi-polygon (if it
+            was split)
+    """
+    if force_north_pole or force_south_pole:
+        fix_winding = False
+    polygons = fix_polygon_to_list(
+        polygon,
+        force_north_pole=force_north_pole,
+        force_south_pole=force_south_pole,
+        fix_winding=fix_winding,
+        great_circle=great_circle,
+    )
+    if len(polygons) == 1:
+        return cover_poles_if_clockwise(polygons[0])
+    else:
+        return MultiPolygon(polygons)
+
+
+def cover_poles_if_clockwise(polygon: Polygon) -> Polygon:
+    """Turns a clockwise polygon into a hole in a pole-covering polygon."""
+    if shapely.is_ccw(polygon.exterior):
+        return polygon
+    else:
+        pole_covering_polygon = Polygon(
+            [(-180, 90), (-180, -90), (180, -90), (180, 90)],
+            [polygon.exterior.coords],
+        )
+        if shapely.is_valid(pole_covering_polygon):
+            return pole_covering_polygon
+        else:
+            raise ValueError(
+                "Fixed polygon is invalid, check your input polygon for validity. "
+                "Reason your polygon is invalid: " + shapely.is_valid_reason(polygon)
+            )
+
+
+def fix_line_string(
+    line_string: LineString, great_circle: bool
+) -> LineString | MultiLineString:
+    """Fixes a [shapely.LineString][].
+
+    Args:
+        line_string: The input line string
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+
+    Returns:
+        The fixed line string, either as a single line string or a multi-line
+        string (if it was split)
+    """
+    segments = segment(numpy.asarray(line_string.coords), great_circle)
+    if not segments:
+        return line_string
+    else:
+        return MultiLineString(segments.arrays())
+
+
+def fix_multi_line_string(
+    multi_line_string: MultiLineString, great_circle: bool
+) -> MultiLineString:
+    """Fixes a [shapely.MultiLineString][].
+
+    Args:
+        multi_line_string: The input multi line string
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+
+    Returns:
+        The fixed multi line string
+    """
+    line_strings = list()
     for line_string in multi_line_string.geoms:
         fixed = fix_line_string(line_string, great_circle)
         if isinstance(fixed, LineString):
@@ -443,11 +1900,13 @@ def fix_multi_line_string(
 
 
 def segment_polygon(polygon: Polygon, great_circle: bool) -> list[list[XY]]:
-    segments = segment(list(polygon.exterior.coords), great_circle)
+    segments = segment(numpy.asarray(polygon.exterior.coords), great_circle).tolist()
     if not segments:
         segments = [list(polygon.exterior.coords)]
     for interior in polygon.interiors:
-        interior_segments = segment(list(interior.coords), great_circle)
+        interior_segments = segment(
+            numpy.asarray(interior.coords), great_circle
+        ).tolist()
         if interior_segments:
             segments.extend(interior_segments)
         else:
@@ -463,13 +1922,52 @@ def fix_polygon_to_list(
     fix_winding: bool | None,
     great_circle: bool,
 ) -> list[Polygon]:
-    exterior = remove_consecutive_duplicates(normalize(list(polygon.exterior.coords)))
+    return assemble_polygons(
+        [
+            split_polygon(
+                polygon,
+                force_north_pole=force_north_pole,
+                force_south_pole=force_south_pole,
+                fix_winding=fix_winding,
+                great_circle=great_circle,
+            )
+        ]
+    )[0]
+
+
+class PolygonPieces(NamedTuple):
+    """The pieces of a polygon that was split at the antimeridian."""
+
+    exteriors: SegmentSet
+    """The exterior rings of the split polygons."""
+
+    interiors: list[LinearRing]
+    """Interiors that didn't cross the antimeridian, not yet assigned to a
+    polygon."""
+
+
+def split_polygon(
+    polygon: Polygon,
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+) -> list[Polygon] | PolygonPieces:
+    """Runs the coordinate-wrangling part of the algorithm on one polygon.
+
+    Returns the fixed polygon if it doesn't cross the antimeridian, otherwise
+    the pieces to pass to [assemble_polygons][].
+    """
+    exterior = remove_consecutive_duplicates(
+        normalize(numpy.asarray(polygon.exterior.coords))
+    )
     segments = segment(exterior, great_circle)
     if not segments:
         polygon = Polygon(shell=exterior, holes=polygon.interiors)
         if fix_winding is not False and (
             not shapely.is_ccw(polygon.exterior)
-            or any(shapely.is_ccw(interior) for interior in polygon.interiors)
+            or shapely.is_ccw(shapely.get_rings(polygon)[1:]).any()
         ):
             if fix_winding is None:
                 FixWindingWarning.warn()
@@ -477,139 +1975,416 @@ def fix_polygon_to_list(
         else:
             return [polygon]
     else:
-        interiors = []
-        for interior in polygon.interiors:
-            interior_segments = segment(list(interior.coords), great_circle)
-            if interior_segments:
-                if fix_winding is not False:
-                    unwrapped_linearring = LinearRing(
-                        list((x % 360, y) for x, y in interior.coords)
-                    )
-                    if shapely.is_ccw(unwrapped_linearring):
-                        if fix_winding is None:
-                            FixWindingWarning.warn()
-                        interior_segments = segment(
-                            list(reversed(interior.coords)), great_circle
-                        )
-                segments.extend(interior_segments)
-            else:
-                interiors.append(interior)
+        exteriors, is_crossing = split_exterior(
+            segments,
+            [numpy.asarray(interior.coords) for interior in polygon.interiors],
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
+        )
+        interiors = [
+            interior
+            for interior, crosses in zip(polygon.interiors, is_crossing)
+            if not crosses
+        ]
+        return PolygonPieces(exteriors, interiors)
+
+
+def split_exterior(
+    segments: SegmentSet,
+    interiors: list[numpy.ndarray],
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+) -> tuple[SegmentSet, list[bool]]:
+    """Joins the segments of a polygon's exterior, and of any interiors that
+    cross the antimeridian, into the exterior rings of the fixed polygons.
+
+    Returns the rings, and whether each interior crossed the antimeridian.
+    """
+    is_crossing = []
+    crossing_interiors = []
+    interior_segments = []
+    for coords in interiors:
+        split = segment(coords, great_circle)
+        is_crossing.append(bool(split))
+        if split:
+            crossing_interiors.append(coords)
+            interior_segments.append(split)
+    if crossing_interiors and fix_winding is not False:
+        # Check the winding of the crossing interiors all at once, in
+        # [0, 360) so they don't wrap.
+        unwrapped = numpy.concatenate(crossing_interiors)[:, :2]
+        unwrapped[:, 0] %= 360
+        is_ccw = shapely.is_ccw(
+            shapely.linearrings(
+                unwrapped,
+                indices=numpy.repeat(
+                    numpy.arange(len(crossing_interiors)),
+                    [len(coords) for coords in crossing_interiors],
+                ),
+            )
+        )
+        for i in numpy.flatnonzero(is_ccw).tolist():
+            if fix_winding is None:
+                FixWindingWarning.warn()
+            interior_segments[i] = segment(crossing_interiors[i][::-1], great_circle)
     segments = extend_over_poles(
-        segments,
+        SegmentSet.concatenate([segments, *interior_segments]),
         force_north_pole=force_north_pole,
         force_south_pole=force_south_pole,
         fix_winding=fix_winding,
     )
-    polygons = build_polygons(segments)
-    assert polygons
-    for i, polygon in enumerate(polygons):
-        new_interiors = []
-        for interior in interiors:
-            if polygon.contains(interior):
-                polygon_interiors = list(polygon.interiors)
-                polygon_interiors.append(interior)
-                polygons[i] = Polygon(polygon.exterior, polygon_interiors)
-            else:
-                new_interiors.append(interior)
-        interiors = new_interiors
-    assert not interiors
-    return polygons
-
-
-def normalize(coords: list[XY]) -> list[XY]:
-    original = list(coords)
-    all_are_on_antimeridian = True
-    for i, point in enumerate(coords):
-        # Ensure all longitudes are between -180 and 180, and that tiny floating
-        # point differences are ignored.
-        if math.isclose(point[0], 180):
-            # https://github.com/gadomski/antimeridian/issues/81
-            if abs(coords[i][1]) != 90 and numpy.isclose(
-                coords[(i - 1) % len(coords)][0], -180
-            ):
-                coords[i] = (-180, point[1])
-            else:
-                coords[i] = (180, point[1])
-        elif math.isclose(point[0], -180):
-            # https://github.com/gadomski/antimeridian/issues/81
-            if abs(coords[i][1]) != 90 and numpy.isclose(
-                coords[(i - 1) % len(coords)][0], 180
-            ):
-                coords[i] = (180, point[1])
-            else:
-                coords[i] = (-180, point[1])
+    exteriors = build_polygons(segments)
+    assert len(exteriors)
+    return exteriors, is_crossing
+
+
+def assemble_polygons(
+    split_polygons: Sequence[list[Polygon] | PolygonPieces],
+) -> list[list[Polygon]]:
+    """Builds the polygons for many split polygons at once.
+
+    All pieces are built, and their interiors assigned, with a handful of
+    vectorized shapely calls. Shapely releases the GIL while it works through
+    an array, so these calls run in parallel when made from several threads.
+    """
+    pieces = [p for p in split_polygons if isinstance(p, PolygonPieces)]
+    if not pieces:
+        return cast(list[list[Polygon]], list(split_polygons))
+    counts = numpy.concatenate([numpy.diff(p.exteriors.offsets) for p in pieces])
+    polygons = shapely.polygons(
+        shapely.linearrings(
+            numpy.concatenate([p.exteriors.coords for p in pieces]),
+            indices=numpy.repeat(numpy.arange(len(counts)), counts),
+        )
+    )
+
+    # Each interior belongs to the first polygon of its piece that contains it.
+    first = offsets_from_counts([len(p.exteriors) for p in pieces])
+    interiors = [interior for p in pieces for interior in p.interiors]
+    if interiors:
+        interior_owners = numpy.repeat(
+            numpy.arange(len(pieces)), [len(p.interiors) for p in pieces]
+        )
+        polygon_owners = numpy.repeat(numpy.arange(len(pieces)), numpy.diff(first))
+        # Querying with the polygons prepares them, rather than the interiors.
+        pair_polygons, pair_interiors = shapely.STRtree(interiors).query(
+            polygons, predicate="contains"
+        )
+        is_own = interior_owners[pair_interiors] == polygon_owners[pair_polygons]
+        pair_interiors = pair_interiors[is_own]
+        pair_polygons = pair_polygons[is_own]
+        order = numpy.lexsort((pair_polygons, pair_interiors))
+        assigned, first_pairs = numpy.unique(pair_interiors[order], return_index=True)
+        assert len(assigned) == len(interiors)
+        holes: list[list[LinearRing]] = [[] for _ in range(len(polygons))]
+        for i, j in zip(assigned.tolist(), pair_polygons[order[first_pairs]].tolist()):
+            holes[j].append(interiors[i])
+        with_holes = [i for i, h in enumerate(holes) if h]
+        if with_holes:
+            rings = []
+            for i in with_holes:
+                rings.append(shapely.get_exterior_ring(polygons[i]))
+                rings.extend(holes[i])
+            polygons[with_holes] = shapely.polygons(
+                rings,
+                indices=numpy.repeat(
+                    numpy.arange(len(with_holes)),
+                    [len(holes[i]) + 1 for i in with_holes],
+                ),
+            )
+
+    assembled = []
+    pieces_iter = iter(range(len(pieces)))
+    for split in split_polygons:
+        if isinstance(split, PolygonPieces):
+            i = next(pieces_iter)
+            assembled.append(list(polygons[first[i] : first[i + 1]]))
         else:
-            coords[i] = (((point[0] + 180) % 360) - 180, point[1])
-            all_are_on_antimeridian = False
-        if len(point) > 2:
-            point_as_list = list(coords[i])
-            point_as_list.extend(point[2:])
-            coords[i] = tuple(point_as_list)
-    if all_are_on_antimeridian:
+            assembled.append(split)
+    return assembled
+
+
+def normalize(coords: list[XY] | numpy.ndarray) -> numpy.ndarray:
+    original = numpy.asarray(coords, dtype=numpy.float64)
+    if not len(original):
         return original
-    else:
-        return coords
+    lon = original[:, 0]
+    lat = original[:, 1]
+    # Ensure all longitudes are between -180 and 180, and that tiny floating
+    # point differences are ignored.
+    is_east = is_close_to(lon, 180)
+    is_on_antimeridian = is_east | is_close_to(lon, -180)
+    if is_on_antimeridian.all():
+        return original
+    normalized = ((lon + 180) % 360) - 180
+    side = numpy.where(is_east, 180.0, -180.0)
+    # https://github.com/gadomski/antimeridian/issues/81
+    #
+    # A point on the antimeridian takes the side of the point before it if
+    # that point is on the other side. When the point before it is also on the
+    # antimeridian this means the side carries through the whole run, so we
+    # only need to look back at the point before the start of each run (for
+    # the first point, that's the unnormalized last point) and then fill
+    # forwards.
+    can_switch_sides = is_on_antimeridian & (numpy.abs(lat) != 90)
+    previous = numpy.empty_like(lon)
+    previous[0] = lon[-1]
+    previous[1:] = normalized[:-1]
+    is_run_start = numpy.ones_like(is_on_antimeridian)
+    is_run_start[1:] = ~is_on_antimeridian[:-1]
+    switch = can_switch_sides & is_run_start & numpy.isclose(previous, -side)
+    side[switch] = -side[switch]
+    is_anchor = is_on_antimeridian & (is_run_start | ~can_switch_sides)
+    anchors = numpy.maximum.accumulate(
+        numpy.where(is_anchor, numpy.arange(len(lon)), 0)
+    )
+    normalized[is_on_antimeridian] = side[anchors][is_on_antimeridian]
+    result = original.copy()
+    result[:, 0] = normalized
+    return result
+
 
+def is_close_to(values: numpy.ndarray, value: float) -> numpy.ndarray:
+    """Elementwise `math.isclose` with its default tolerances."""
+    difference = numpy.abs(value - values)
+    is_close: numpy.ndarray = (values == value) | (
+        numpy.isfinite(values)
+        & (
+            (difference <= abs(1e-09 * value))
+            | (difference <= numpy.abs(1e-09 * values))
+        )
+    )
+    return is_close
 
-def remove_consecutive_duplicates(coords: list[XY]) -> list[XY]:
-    """Remove consecutive near-duplicate points from a coordinate list.
+
+def remove_consecutive_duplicates(coords: list[XY] | numpy.ndarray) -> numpy.ndarray:
+    """Remove consecutive near-duplicate points from a coordinate array.
 
     Args:
-        coords: The coordinate list.
+        coords: The coordinate array.
 
     Returns:
-        The coordinate list with consecutive near-duplicates removed.
+        The coordinate array with consecutive near-duplicates removed.
     """
+    coords = numpy.asarray(coords, dtype=numpy.float64)
     if len(coords) < 2:
         return coords
-    result = [coords[0]]
-    for coord in coords[1:]:
-        if not numpy.allclose(coord, result[-1]):
-            result.append(coord)
-    return result
+    is_duplicate = numpy.isclose(coords[1:], coords[:-1]).all(axis=1)
+    if not is_duplicate.any():
+        return coords
+    # Each point is compared against the last point we kept, not against its
+    # immediate predecessor, so runs of near-duplicates are walked one point
+    # at a time. Everywhere else the vectorized comparison is already correct.
+    keep = numpy.ones(len(coords), dtype=bool)
+    position = 0
+    for index in (numpy.flatnonzero(is_duplicate) + 1).tolist():
+        if index < position:
+            continue
+        anchor = index - 1
+        keep[index] = False
+        index += 1
+        while (
+            index < len(coords) and numpy.isclose(coords[index], coords[anchor]).all()
+        ):
+            keep[index] = False
+            index += 1
+        position = index + 1
+    return coords[keep]
 
 
-def segment(coords: list[XY], great_circle: bool) -> list[list[XY]]:
-    coords = remove_consecutive_duplicates(coords)
-    segment = []
-    segments = []
-    for start, end in itertools.pairwise(coords):
-        segment.append(start)
-        if (end[0] - start[0] > 180) and (end[0] - start[0] != 360):  # left
-            latitude = crossing_latitude(start, end, great_circle)
-            segment.append((-180, latitude))
-            segments.append(segment)
-            segment = [(180, latitude)]
-        elif (start[0] - end[0] > 180) and (start[0] - end[0] != 360):  # right
-            latitude = crossing_latitude(end, start, great_circle)
-            segment.append((180, latitude))
-            segments.append(segment)
-            segment = [(-180, latitude)]
-    if not segments:
+class SegmentSet:
+    """Segments of a ring or line, split at the antimeridian.
+
+    Every vertex lives in one (N, 2) coordinate buffer, and segment `i` is
+    `coords[offsets[i]:offsets[i + 1]]`. Joining segments only looks at their
+    first and last points, so those are cached as tuples. Extending a segment
+    over a pole or reversing it is recorded next to the buffer rather than
+    applied to it, and only takes effect when segments are joined into rings.
+    """
+
+    __slots__ = ("coords", "ends", "extensions", "is_reversed", "offsets", "starts")
+
+    def __init__(
+        self,
+        coords: numpy.ndarray,
+        offsets: numpy.ndarray,
+        starts: list[XY],
+        ends: list[XY],
+    ) -> None:
+        self.coords = coords
+        self.offsets = offsets
+        self.starts = starts
+        self.ends = ends
+        self.extensions: dict[int, numpy.ndarray] = {}
+        self.is_reversed = [False] * len(starts)
+
+    @classmethod
+    def empty(cls) -> SegmentSet:
+        return cls(numpy.empty((0, 2)), numpy.zeros(1, dtype=numpy.int64), [], [])
+
+    @classmethod
+    def concatenate(cls, segment_sets: Sequence[SegmentSet]) -> SegmentSet:
+        """Puts the segments of many sets, none yet extended or reversed, into
+        one set."""
+        if len(segment_sets) == 1:
+            return segment_sets[0]
+        bases = offsets_from_counts([len(s.coords) for s in segment_sets])
+        return cls(
+            numpy.concatenate([s.coords for s in segment_sets]),
+            numpy.concatenate(
+                [bases[:1]]
+                + [s.offsets[1:] + base for s, base in zip(segment_sets, bases)]
+            ),
+            [start for s in segment_sets for start in s.starts],
+            [end for s in segment_sets for end in s.ends],
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def extend(self, i: int, points: list[XY]) -> None:
+        """Adds points to the end of a segment."""
+        assert not self.is_reversed[i] and i not in self.extensions
+        self.extensions[i] = numpy.array(points, dtype=numpy.float64)
+        self.ends[i] = points[-1]
+
+    def reverse(self, i: int) -> None:
+        self.is_reversed[i] = not self.is_reversed[i]
+        self.starts[i], self.ends[i] = self.ends[i], self.starts[i]
+
+    def reverse_all(self) -> None:
+        for i in range(len(self)):
+            self.reverse(i)
+
+    def pieces(self, i: int) -> list[numpy.ndarray]:
+        """Returns views of the buffer that make up a segment, in order."""
+        pieces = [self.coords[self.offsets[i] : self.offsets[i + 1]]]
+        if i in self.extensions:
+            pieces.append(self.extensions[i])
+        if self.is_reversed[i]:
+            pieces = [piece[::-1] for piece in reversed(pieces)]
+        return pieces
+
+    def arrays(self) -> list[numpy.ndarray]:
+        """Returns the coordinates of each segment."""
+        return [
+            numpy.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+            for pieces in map(self.pieces, range(len(self)))
+        ]
+
+    def tolist(self) -> list[list[XY]]:
+        return [list(map(tuple, array.tolist())) for array in self.arrays()]
+
+    def join(self, chains: list[list[int]]) -> SegmentSet:
+        """Joins chains of segments end to end, one new segment per chain."""
+        if not chains:
+            return SegmentSet.empty()
+        pieces = [
+            [piece for i in chain for piece in self.pieces(i)] for chain in chains
+        ]
+        lengths = [sum(map(len, chain)) for chain in pieces]
+        return SegmentSet(
+            numpy.concatenate(list(itertools.chain.from_iterable(pieces))),
+            numpy.array([0, *itertools.accumulate(lengths)]),
+            [self.starts[chain[0]] for chain in chains],
+            [self.ends[chain[-1]] for chain in chains],
+        )
+
+
+def segment(coords: list[XY] | numpy.ndarray, great_circle: bool) -> SegmentSet:
+    array = remove_consecutive_duplicates(coords)
+    if len(array) < 2:
+        return SegmentSet.empty()
+    # Find every left (eastward over the antimeridian) and right (westward)
+    # crossing with a single pass over the longitude deltas.
+    delta = numpy.diff(array[:, 0])
+    is_left = (delta > 180) & (delta != 360)
+    is_right = (delta < -180) & (delta != -360)
+    indices = numpy.flatnonzero(is_left | is_right)
+    if not len(indices):
         # No antimeridian crossings
-        return []
-    elif coords[-1] == segments[0][0]:
-        # Join polygons
-        segments[0] = segment + segments[0]
+        return SegmentSet.empty()
+    if array.shape[1] > 2:
+        # The segments are built in two dimensions, so rather than silently
+        # dropping the extra coordinates we refuse to fix the shape.
+        raise ValueError(
+            "cannot fix an antimeridian-crossing shape with more than two "
+            "dimensions (e.g. Z coordinates)"
+        )
+    left = is_left[indices]
+    # Right crossings are computed from the eastern point to the western point.
+    starts = numpy.where(left[:, None], array[indices, :2], array[indices + 1, :2])
+    ends = numpy.where(left[:, None], array[indices + 1, :2], array[indices, :2])
+    latitudes = crossing_latitudes(starts, ends, great_circle)
+
+    # Each crossing ends one segment on the side it crosses to, then starts
+    # the next one on the other side.
+    segment_ends: list[XY] = [
+        (-180.0 if is_left_crossing else 180.0, latitude)
+        for is_left_crossing, latitude in zip(left.tolist(), latitudes)
+    ]
+    heads: list[XY] = [(-x, latitude) for x, latitude in segment_ends]
+    crossings = numpy.array(list(zip(segment_ends, heads)), dtype=numpy.float64)
+    pieces = []
+    offsets = [0]
+    start = 0
+    for k, index in enumerate(indices.tolist()):
+        pieces.append(array[start : index + 1, :2])
+        pieces.append(crossings[k])
+        offsets.append(index + 2 + 2 * k)
+        start = index + 1
+    x0, y0 = array[0, :2].tolist()
+    x1, y1 = array[-1, :2].tolist()
+    if (x0, y0) == (x1, y1):
+        # Join polygons, by putting the last segment (less its closing
+        # vertex) in front of the first.
+        pieces[-1] = crossings[-1, :1]
+        pieces[:0] = [crossings[-1, 1:], array[start:-1, :2]]
+        offsets[1:] = [offset + len(array) - start for offset in offsets[1:]]
+        segment_starts = heads[-1:] + heads[:-1]
     else:
-        segment.append(coords[-1])
-        segments.append(segment)
-    return segments
+        pieces.append(array[start:, :2])
+        offsets.append(len(array) + 2 * len(indices))
+        segment_starts = [(x0, y0), *heads]
+        segment_ends.append((x1, y1))
+    return SegmentSet(
+        numpy.concatenate(pieces), numpy.array(offsets), segment_starts, segment_ends
+    )
 
 
-def spherical_degrees_to_cartesian(point: XY) -> XYZ:
-    lon, lat = numpy.deg2rad(point)
-    return (
-        float(numpy.cos(lon) * numpy.cos(lat)),
-        float(numpy.sin(lon) * numpy.cos(lat)),
-        float(numpy.sin(lat)),
+def spherical_degrees_to_cartesian(points: numpy.ndarray) -> numpy.ndarray:
+    lon = numpy.deg2rad(points[:, 0])
+    lat = numpy.deg2rad(points[:, 1])
+    return numpy.stack(
+        (
+            numpy.cos(lon) * numpy.cos(lat),
+            numpy.sin(lon) * numpy.cos(lat),
+            numpy.sin(lat),
+        ),
+        axis=-1,
     )
 
 
-def crossing_latitude_great_circle(start: XY, end: XY) -> float:
-    # Compute a 3D vector representing the start and end points.
-    p1 = spherical_degrees_to_cartesian(start)
-    p2 = spherical_degrees_to_cartesian(end)
+def crossing_latitudes_great_circle(
+    starts: numpy.ndarray, ends: numpy.ndarray
+) -> numpy.ndarray:
+    """Computes where many great circle arcs cross the antimeridian.
+
+    Args:
+        starts: A (K, 2) array of arc start points, in degrees.
+        ends: A (K, 2) array of arc end points, in degrees.
+
+    Returns:
+        The K crossing latitudes, rounded to seven decimal places.
+    """
+    # Compute 3D vectors representing the start and end points.
+    p1 = spherical_degrees_to_cartesian(starts)
+    p2 = spherical_degrees_to_cartesian(ends)
     # The cross product of these vectors defines the plane passing through both points.
     n1 = numpy.cross(p1, p2)
     # The unit vector -Y defines the meridian plane.
@@ -617,75 +2392,109 @@ def crossing_latitude_great_circle(start: XY, end: XY) -> float:
     # The intersection of both planes is defined by their cross product, which we
     # normalize to get its intersection with the unit sphere.
     intersection = numpy.cross(n1, n2)
-    intersection /= numpy.linalg.norm(intersection)
+    intersection /= numpy.linalg.norm(intersection, axis=-1)[:, None]
     # Convert back to spherical coordinates.
     # We're only interested in the latitude, so the arcsin of the z-coordinate is
     # sufficient.
-    return round(float(numpy.rad2deg(numpy.arcsin(intersection[2]))), 7)
+    return round_latitudes(numpy.rad2deg(numpy.arcsin(intersection[:, 2])))
 
 
-def crossing_latitude_flat(start: XY, end: XY) -> float:
-    latitude_delta = end[1] - start[1]
-    if end[0] < 0:
-        return round(
-            start[1]
-            + (180.0 - start[0]) * latitude_delta / (end[0] + 360.0 - start[0]),
-            7,
-        )
-    else:
-        return round(
-            start[1]
-            + (start[0] + 180.0) * latitude_delta / (start[0] + 360.0 - end[0]),
-            7,
-        )
+def crossing_latitudes_flat(
+    starts: numpy.ndarray, ends: numpy.ndarray
+) -> numpy.ndarray:
+    """Computes where many straight (planar) lines cross the antimeridian.
+
+    Args:
+        starts: A (K, 2) array of line start points, in degrees.
+        ends: A (K, 2) array of line end points, in degrees.
+
+    Returns:
+        The K crossing latitudes, rounded to seven decimal places.
+    """
+    start_lon, start_lat = starts[:, 0], starts[:, 1]
+    end_lon = ends[:, 0]
+    latitude_delta = ends[:, 1] - start_lat
+    west = end_lon < 0
+    offset = numpy.where(west, 180.0 - start_lon, start_lon + 180.0)
+    width = numpy.where(west, end_lon + 360.0 - start_lon, start_lon + 360.0 - end_lon)
+    return round_latitudes(start_lat + offset * latitude_delta / width)
+
+
+def round_latitudes(latitudes: numpy.ndarray) -> numpy.ndarray:
+    # numpy.round scales, rounds, and unscales, which can differ from the
+    # correctly-rounded builtin in the last digit, so we use the builtin.
+    return numpy.array([round(latitude, 7) for latitude in latitudes.tolist()])
 
 
-def crossing_latitude(start: XY, end: XY, great_circle: bool) -> float:
-    if abs(start[0]) == 180:
-        return start[1]
-    elif abs(end[0]) == 180:
-        return end[1]
+def crossing_latitudes(
+    starts: numpy.ndarray, ends: numpy.ndarray, great_circle: bool
+) -> list[float]:
+    """Computes the antimeridian crossing latitude for many segments at once.
+
+    If either end of a segment is already on the antimeridian, that point's
+    latitude is used as-is.
+
+    Args:
+        starts: A (K, 2) array of segment start points.
+        ends: A (K, 2) array of segment end points.
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
 
-    if great_circle:
-        return crossing_latitude_great_circle(start, end)
-    return crossing_latitude_flat(start, end)
+    Returns:
+        The K crossing latitudes.
+    """
+    latitudes = numpy.empty(len(starts))
+    start_is_on_antimeridian = numpy.abs(starts[:, 0]) == 180
+    end_is_on_antimeridian = ~start_is_on_antimeridian & (numpy.abs(ends[:, 0]) == 180)
+    is_crossing = ~(start_is_on_antimeridian | end_is_on_antimeridian)
+    latitudes[start_is_on_antimeridian] = starts[start_is_on_antimeridian, 1]
+    latitudes[end_is_on_antimeridian] = ends[end_is_on_antimeridian, 1]
+    if is_crossing.any():
+        if great_circle:
+            latitudes[is_crossing] = crossing_latitudes_great_circle(
+                starts[is_crossing], ends[is_crossing]
+            )
+        else:
+            latitudes[is_crossing] = crossing_latitudes_flat(
+                starts[is_crossing], ends[is_crossing]
+            )
+    return latitudes.tolist()
 
 
 IndexAndLatitude = namedtuple("IndexAndLatitude", "index latitude")
 
 
 def extend_over_poles(
-    segments: list[list[XY]],
+    segments: SegmentSet,
     *,
     force_north_pole: bool,
     force_south_pole: bool,
     fix_winding: bool | None,
-) -> list[list[XY]]:
+) -> SegmentSet:
     left_start = None
     right_start = None
     left_end = None
     right_end = None
-    for i, segment in enumerate(segments):
-        if segment[0][0] == -180 and (
-            left_start is None or segment[0][1] < left_start.latitude
+    for i, (start, end) in enumerate(zip(segments.starts, segments.ends)):
+        if start[0] == -180 and (left_start is None or start[1] < left_start.latitude):
+            left_start = IndexAndLatitude(i, start[1])
+        elif start[0] == 180 and (
+            right_start is None or start[1] > right_start.latitude
         ):
-            left_start = IndexAndLatitude(i, segment[0][1])
-        elif segment[0][0] == 180 and (
-            right_start is None or segment[0][1] > right_start.latitude
-        ):
-            right_start = IndexAndLatitude(i, segment[0][1])
-        if segment[-1][0] == -180 and (
-            left_end is None or segment[-1][1] < left_end.latitude
-        ):
-            left_end = IndexAndLatitude(i, segment[-1][1])
-        elif segment[-1][0] == 180 and (
-            right_end is None or segment[-1][1] > right_end.latitude
-        ):
-            right_end = IndexAndLatitude(i, segment[-1][1])
-
+            right_start = IndexAndLatitude(i, start[1])
+        if end[0] == -180 and (left_end is None or end[1] < left_end.latitude):
+            left_end = IndexAndLatitude(i, end[1])
+        elif end[0] == 180 and (right_end is None or end[1] > right_end.latitude):
+            right_end = IndexAndLatitude(i, end[1])
+
+    # Decide which segment ends to extend over which pole before touching any
+    # segment, so the both-poles case can bail out without undoing anything.
     is_over_north_pole = False
     is_over_south_pole = False
-    original_segments = copy.deepcopy(segments)
+    left_pole: XY | None = None
+    right_pole: XY | None = None
+    reverse_left = False
+    reverse_right = False
 
     # If there's no segment ends between a start and the pole, extend the
     # segment over the pole.
@@ -697,29 +2506,29 @@ def extend_over_poles(
             and (not left_start or left_end.latitude > left_start.latitude)
         ):
             is_over_north_pole = True
-            segments[left_end.index] += [(-180, 90), (180, 90)]
-            segments[left_end.index].reverse()
+            left_pole = (-180, 90)
+            reverse_left = True
         elif (
             force_south_pole
             or not left_start
             or left_end.latitude < left_start.latitude
         ):
             is_over_south_pole = True
-            segments[left_end.index] += [(-180, -90), (180, -90)]
+            left_pole = (-180, -90)
     if right_end:
         if (force_south_pole and not force_north_pole) and (
             not right_start or right_end.latitude < right_start.latitude
         ):
             is_over_south_pole = True
-            segments[right_end.index] += [(180, -90), (-180, -90)]
-            segments[right_end.index].reverse()
+            right_pole = (180, -90)
+            reverse_right = True
         elif (
             force_north_pole
             or not right_start
             or right_end.latitude > right_start.latitude
         ):
             is_over_north_pole = True
-            segments[right_end.index] += [(180, 90), (-180, 90)]
+            right_pole = (180, 90)
     if fix_winding is not False and is_over_north_pole and is_over_south_pole:
         # These assertions are here because we're assuming that we set
         # `fix_winding` to `False` up in `fix_polygon` if either of the
@@ -732,74 +2541,151 @@ def extend_over_poles(
         # winding order.
         if fix_winding is None:
             FixWindingWarning.warn()
-        for segment in original_segments:
-            segment.reverse()
-        return original_segments
-    else:
+        segments.reverse_all()
         return segments
 
+    if left_end and left_pole:
+        segments.extend(left_end.index, [left_pole, (180, left_pole[1])])
+        if reverse_left:
+            segments.reverse(left_end.index)
+    if right_end and right_pole:
+        segments.extend(right_end.index, [right_pole, (-180, right_pole[1])])
+        if reverse_right:
+            segments.reverse(right_end.index)
+    return segments
 
-def build_polygons(
-    segments: list[list[XY]],
-) -> list[Polygon]:
-    if not segments:
-        return []
-    segment = segments.pop()
-    is_right = segment[-1][0] == 180
-    candidates: list[tuple[int | None, float]] = list()
-    if is_self_closing(segment):
-        # Self-closing segments might end up joining up with themselves. They
-        # might not, e.g. donuts.
-        candidates.append((None, segment[0][1]))
-    for i, s in enumerate(segments):
-        # Is the start of s on the same side as the end of segment?
-        if s[0][0] == segment[-1][0]:
-            # If so, check the following:
-            # - Is the start of s closer to the pole than the end of segment, and
-            # - is the end of s on the other side, or
-            # - is the end of s further away from the pole than the start of
-            #   segment (e.g. donuts)?
-            if (
-                is_right
-                and s[0][1] > segment[-1][1]
-                and (not is_self_closing(s) or s[-1][1] < segment[0][1])
-            ) or (
-                not is_right
-                and s[0][1] < segment[-1][1]
-                and (not is_self_closing(s) or s[-1][1] > segment[0][1])
-            ):
-                candidates.append((i, s[0][1]))
-
-    # Sort the candidates so the closest point is first in the list.
-    candidates.sort(key=lambda c: c[1], reverse=not is_right)
-    if candidates:
-        index = candidates[0][0]
-    else:
-        index = None
 
-    if index is not None:
-        # Join the segments, then re-add them to the list and recurse.
-        segment = segment + segments.pop(index)
-        segments.append(segment)
-        return build_polygons(segments)
-    else:
-        # This segment should self-joining, so just build the rest of the
-        # polygons without it.
-        polygons = build_polygons(segments)
-        if not all(p == segment[0] for p in segment):
-            # If every point is the same, then we don't need it in the output
-            # set of polygons. This happens if, e.g., one corner of an input
-            # polygon is on the antimeridian.
-            # https://github.com/gadomski/antimeridian/issues/45#issuecomment-1614586166
-            polygons.append(Polygon(segment))
-        return polygons
+def build_polygons(segments: SegmentSet) -> SegmentSet:
+    """Joins segments into the exterior rings of polygons.
 
+    Segments are taken from the back of the set. Each one is extended by the
+    segment whose start is the next one along the antimeridian past its end,
+    until it closes on itself. Segment starts are indexed by latitude for each
+    side of the antimeridian, so each join costs O(log n). Only the cached
+    endpoints are looked at until the chains of segments are known, then each
+    ring's coordinates are gathered at once.
+    """
+    grouped: dict[float, list[int]] = {}
+    for i, (x, _) in enumerate(segments.starts):
+        grouped.setdefault(x, []).append(i)
+    starts = {x: SegmentStarts(segments, x, indices) for x, indices in grouped.items()}
+    is_remaining = [True] * len(segments)
+
+    def remove(i: int) -> None:
+        is_remaining[i] = False
+        starts[segments.starts[i][0]].remove(i)
+
+    chains = []
+    last = len(segments) - 1
+    while True:
+        while last >= 0 and not is_remaining[last]:
+            last -= 1
+        if last < 0:
+            break
+        chain = [last]
+        start = segments.starts[last]
+        end = segments.ends[last]
+        remove(last)
+        while True:
+            x, y = end
+            sign = direction(x)
+            start_latitude = sign * start[1]
+            candidate = (
+                starts[x].next(sign * y, start_latitude) if x in starts else None
+            )
+            if candidate is None or (
+                # Self-closing segments might end up joining up with
+                # themselves. They might not, e.g. donuts.
+                is_self_closing(start, end) and (start_latitude, -1) < candidate
+            ):
+                break
+            chain.append(candidate[1])
+            end = segments.ends[candidate[1]]
+            remove(candidate[1])
+        chains.append(chain)
+    chains.reverse()
+    # If every point is the same, then we don't need it in the output set of
+    # polygons. This happens if, e.g., one corner of an input polygon is on
+    # the antimeridian.
+    # https://github.com/gadomski/antimeridian/issues/45#issuecomment-1614586166
+    return segments.join([chain for chain in chains if not is_point(segments, chain)])
+
+
+def is_point(segments: SegmentSet, chain: list[int]) -> bool:
+    """Returns true if every point of a chain of segments is the same."""
+    first = segments.starts[chain[0]]
+    if any(segments.starts[i] != first or segments.ends[i] != first for i in chain):
+        return False
+    return all((piece == first).all() for i in chain for piece in segments.pieces(i))
+
+
+class SegmentStarts:
+    """The starts of the segments that start on one side of the antimeridian.
+
+    Starts are keyed by latitude in the direction we walk along that side
+    (north on the right, south on the left), with ties going to the earliest
+    segment. A self-closing segment can only be joined onto a segment that
+    starts past its end, so each start also has a limit. The limit is the
+    key of the segment's end, or -inf for segments that aren't self-closing.
+    A min-tree over the limits finds the next joinable start with one
+    descent.
+    """
 
-def is_self_closing(segment: list[XY]) -> bool:
-    is_right = segment[-1][0] == 180
-    return segment[0][0] == segment[-1][0] and (
-        (is_right and segment[0][1] > segment[-1][1])
-        or (not is_right and segment[0][1] < segment[-1][1])
+    def __init__(self, segments: SegmentSet, x: float, indices: list[int]):
+        sign = direction(x)
+        self.keys = sorted((sign * segments.starts[i][1], i) for i in indices)
+        self.positions = {i: position for position, (_, i) in enumerate(self.keys)}
+        self.size = 1 << (len(self.keys) - 1).bit_length()
+        self.limits = [math.inf] * (2 * self.size)
+        for position, (_, i) in enumerate(self.keys):
+            start = segments.starts[i]
+            end = segments.ends[i]
+            self.limits[self.size + position] = (
+                sign * end[1] if is_self_closing(start, end) else -math.inf
+            )
+        for node in range(self.size - 1, 0, -1):
+            self.limits[node] = min(self.limits[2 * node], self.limits[2 * node + 1])
+
+    def remove(self, i: int) -> None:
+        node = self.size + self.positions[i]
+        self.limits[node] = math.inf
+        while node > 1:
+            node //= 2
+            self.limits[node] = min(self.limits[2 * node], self.limits[2 * node + 1])
+
+    def next(self, key: float, start: float) -> tuple[float, int] | None:
+        """Returns the key of the first remaining start past `key` that can be
+        joined onto a segment that starts at `start`."""
+        position = self.find(
+            1, 0, self.size, bisect.bisect_right(self.keys, (key, math.inf)), start
+        )
+        return None if position is None else self.keys[position]
+
+    def find(
+        self, node: int, low: int, high: int, position: int, start: float
+    ) -> int | None:
+        if high <= position or self.limits[node] >= start:
+            return None
+        if high - low == 1:
+            return low
+        middle = (low + high) // 2
+        found = self.find(2 * node, low, middle, position, start)
+        if found is None:
+            found = self.find(2 * node + 1, middle, high, position, start)
+        return found
+
+
+def direction(x: float) -> int:
+    """Returns 1 if we walk north along this side of the antimeridian, else -1."""
+    return 1 if x == 180 else -1
+
+
+def is_self_closing(start: XY, end: XY) -> bool:
+    """Returns true if a segment with these endpoints starts and ends on the
+    same side of the antimeridian, with its start past its end."""
+    is_right = end[0] == 180
+    return start[0] == end[0] and (
+        (is_right and start[1] > end[1]) or (not is_right and start[1] < end[1])
     )
 
 
@@ -824,23 +2710,18 @@ def bbox(
     if geom.geom_type == "Polygon":
         return list(geom.bounds)
     elif geom.geom_type == "MultiPolygon":
-        crosses_antimeridian = False
-        xmins = list()
-        ymin = 90
-        xmaxs = list()
-        ymax = -90
-        for polygon in geom.geoms:
-            bounds = polygon.bounds
-            xmins.append(bounds[0])
-            if bounds[1] < ymin:
-                ymin = bounds[1]
-            xmaxs.append(bounds[2])
-            if bounds[3] > ymax:
-                ymax = bounds[3]
-            if is_coincident_to_antimeridian(polygon) and not (
-                bounds[0] == -180 and bounds[2] == 180
-            ):
-                crosses_antimeridian = True
+        polygons = shapely.get_parts(geom)
+        bounds = shapely.bounds(polygons)
+        xmins = bounds[:, 0].tolist()
+        ymin = min([90, *bounds[:, 1].tolist()])
+        xmaxs = bounds[:, 2].tolist()
+        ymax = max([-90, *bounds[:, 3].tolist()])
+        crosses_antimeridian = bool(
+            (
+                is_coincident_to_antimeridian(polygons)
+                & ~((bounds[:, 0] == -180) & (bounds[:, 2] == 180))
+            ).any()
+        )
 
         if crosses_antimeridian or force_over_antimeridian:
             return [max(xmins), ymin, min(xmaxs), ymax]
@@ -852,6 +2733,239 @@ def bbox(
         )
 
 
+def fixed_bbox(
+    shape: dict[str, Any] | GeoInterface,
+    force_over_antimeridian: bool = False,
+    *,
+    force_north_pole: bool = False,
+    force_south_pole: bool = False,
+    fix_winding: bool | None = None,
+    great_circle: bool = True,
+    reverse: bool = False,
+) -> list[float]:
+    """Calculates the bounding box of a shape as if it had been fixed first.
+
+    This gives the same bounding box as
+    `antimeridian.bbox(antimeridian.fix_shape(shape), ...)`, but without
+    building any polygons. The raw rings are split at their antimeridian
+    crossings and joined into the exterior rings of the fixed polygons,
+    extended over the poles where needed, and the bounding box is read
+    straight off those rings' coordinates.
+
+    Since the fixed polygons are never built, they aren't checked for
+    validity either: some invalid shapes that make
+    [antimeridian.fix_shape][] raise an error get a bounding box here.
+
+    See [antimeridian.fix_polygon][] for a description of the fix arguments.
+
+    Args:
+        shape: The unfixed polygon or multipolygon, either as a dictionary or
+            as a [antimeridian.GeoInterface][].
+        force_over_antimeridian: Force the bounding box to be over the antimeridian.
+        force_north_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the north pole.
+        force_south_pole: If the polygon crosses the antimeridian, force the
+            joined segments to enclose the south pole.
+        fix_winding: If the polygon is wound clockwise, reverse its
+            coordinates before applying the algorithm.
+        great_circle: Compute meridian crossings on the sphere rather than
+            using 2D geometry.
+        reverse: Reverse the coordinates before fixing.
+
+    Returns:
+        List[float]: The bounding box.
+    """
+    geojson = shape if isinstance(shape, dict) else shape.__geo_interface__
+    type_ = geojson.get("type")
+    if type_ == "Polygon":
+        polygons = [geojson["coordinates"]]
+        if force_north_pole or force_south_pole:
+            # As `fix_polygon` does.
+            fix_winding = False
+    elif type_ == "MultiPolygon":
+        polygons = geojson["coordinates"]
+    else:
+        raise ValueError(f"unsupported geom_type for bbox calculation: {type_}")
+    rings = [
+        [close_ring(numpy.asarray(ring, dtype=numpy.float64)) for ring in polygon]
+        for polygon in polygons
+    ]
+    if reverse:
+        rings = [[ring[::-1] for ring in polygon] for polygon in rings]
+    is_fixed = reverse or might_cross_antimeridian_geojson(
+        geojson,
+        force_north_pole=force_north_pole,
+        force_south_pole=force_south_pole,
+        fix_winding=fix_winding,
+    )
+    exteriors: list[numpy.ndarray] = []
+    for polygon in rings:
+        if not polygon or not len(polygon[0]):
+            continue
+        elif is_fixed:
+            exteriors.extend(
+                fixed_exteriors(
+                    polygon,
+                    force_north_pole=force_north_pole,
+                    force_south_pole=force_south_pole,
+                    fix_winding=fix_winding,
+                    great_circle=great_circle,
+                )
+            )
+        else:
+            exteriors.append(polygon[0])
+    if not exteriors:
+        return [numpy.nan] * 4
+    exteriors = [close_ring(exterior[:, :2]) for exterior in exteriors]
+    bounds, is_coincident = ring_bounds(
+        numpy.concatenate(exteriors), numpy.array([len(e) for e in exteriors])
+    )
+    if type_ == "Polygon" and len(exteriors) == 1:
+        if is_fixed and not shapely.is_ccw(shapely.linearrings(exteriors[0])):
+            # The fixed polygon covers the poles, see `cover_poles_if_clockwise`.
+            return [-180.0, -90.0, 180.0, 90.0]
+        return cast(list[float], bounds[0].tolist())
+    return cast(
+        list[float],
+        multi_polygon_bboxes(
+            bounds,
+            is_coincident,
+            numpy.array([0, len(exteriors)]),
+            force_over_antimeridian,
+        )[0].tolist(),
+    )
+
+
+def close_ring(coords: numpy.ndarray) -> numpy.ndarray:
+    """Closes a ring, as shapely does when it builds one.
+
+    Shapely also repeats the first point of a closed three-point ring, so
+    that it has the four points a ring needs.
+    """
+    if len(coords) == 3 or (len(coords) and (coords[0] != coords[-1]).any()):
+        return numpy.concatenate((coords, coords[:1]))
+    return coords
+
+
+def fixed_exteriors(
+    rings: list[numpy.ndarray],
+    *,
+    force_north_pole: bool,
+    force_south_pole: bool,
+    fix_winding: bool | None,
+    great_circle: bool,
+) -> list[numpy.ndarray]:
+    """Returns the exterior rings of the polygons that a polygon's rings are
+    fixed into, as `split_polygon` would build them."""
+    exterior = remove_consecutive_duplicates(normalize(rings[0]))
+    segments = segment(exterior, great_circle)
+    if segments:
+        exteriors, _ = split_exterior(
+            segments,
+            rings[1:],
+            force_north_pole=force_north_pole,
+            force_south_pole=force_south_pole,
+            fix_winding=fix_winding,
+            great_circle=great_circle,
+        )
+        return exteriors.arrays()
+    if fix_winding is not False:
+        is_ccw = shapely.is_ccw(
+            shapely.linearrings(
+                numpy.concatenate([ring[:, :2] for ring in [exterior, *rings[1:]]]),
+                indices=numpy.repeat(
+                    numpy.arange(len(rings)), [len(exterior), *map(len, rings[1:])]
+                ),
+            )
+        )
+        if not is_ccw[0] or is_ccw[1:].any():
+            if fix_winding is None:
+                FixWindingWarning.warn()
+            if not is_ccw[0]:
+                # `orient` winds the exterior counterclockwise.
+                return [exterior[::-1]]
+    return [exterior]
+
+
+def bboxes(
+    geometries: numpy.ndarray | Sequence[Any] | dict[str, Any],
+    force_over_antimeridian: bool | Sequence[bool] | numpy.ndarray = False,
+) -> numpy.ndarray:
+    """Calculates GeoJSON-spec conforming bounding boxes for many shapes at once.
+
+    This is the bulk equivalent of calling [antimeridian.bbox][] on every
+    shape. All parts are bounded with one call to [shapely.bounds][], and the
+    parts touching the antimeridian are found in one pass over their
+    exterior coordinates.
+
+    Args:
+        geometries: An array of polygons and multi-polygons, as shapely
+            geometries, GeoJSON dictionaries or Features, or anything with a
+            [antimeridian.GeoInterface][]. A GeoJSON FeatureCollection gives
+            one bounding box per feature. Missing geometries (`None`) are
+            allowed.
+        force_over_antimeridian: Force the bounding boxes of multi-polygons to
+            be over the antimeridian, for every shape or for each one.
+
+    Returns:
+        An (N, 4) array, with one `[xmin, ymin, xmax, ymax]` bounding box per
+            shape. Missing and empty shapes have NaN bounding boxes.
+    """
+    array = geometry_array(geometries)
+    type_ids = shapely.get_type_id(array)
+    unsupported = ~numpy.isin(
+        type_ids,
+        (
+            shapely.GeometryType.MISSING,
+            shapely.GeometryType.POLYGON,
+            shapely.GeometryType.MULTIPOLYGON,
+        ),
+    )
+    if unsupported.any():
+        geom_type = array[numpy.flatnonzero(unsupported)[0]].geom_type
+        raise ValueError(f"unsupported geom_type for bbox calculation: {geom_type}")
+    force = numpy.broadcast_to(
+        numpy.asarray(force_over_antimeridian, dtype=bool), array.shape
+    )
+
+    result: numpy.ndarray = shapely.bounds(array)
+    multi_polygons = numpy.flatnonzero(type_ids == shapely.GeometryType.MULTIPOLYGON)
+    if len(multi_polygons):
+        parts, part_index = shapely.get_parts(array[multi_polygons], return_index=True)
+        result[multi_polygons] = multi_polygon_bboxes(
+            shapely.bounds(parts),
+            is_coincident_to_antimeridian(parts),
+            offsets_from_counts(
+                numpy.bincount(part_index, minlength=len(multi_polygons))
+            ),
+            force[multi_polygons],
+        )
+    return result
+
+
+def geometry_array(
+    geometries: numpy.ndarray | Sequence[Any] | dict[str, Any],
+) -> numpy.ndarray:
+    """Makes a flat array of shapely geometries.
+
+    Anything that isn't already a shapely geometry or `None` is converted with
+    [shapely.geometry.shape][], except GeoJSON Features, whose geometry is
+    used. A FeatureCollection becomes the geometries of its features.
+    """
+    if isinstance(geometries, dict):
+        geometries = geometries.get("features", [geometries])
+    array = numpy.empty(len(geometries), dtype=object)
+    array[:] = list(geometries)
+    for i in numpy.flatnonzero(~shapely.is_geometry(array)).tolist():
+        item = array[i]
+        if isinstance(item, dict) and item.get("type") == "Feature":
+            item = item.get("geometry")
+        if item is not None:
+            item = shapely.geometry.shape(item)
+        array[i] = item
+    return array
+
+
 def centroid(shape: dict[str, Any] | GeoInterface) -> Point:
     """Calculates the centroid for a polygon or multipolygon.
 
@@ -871,12 +2985,12 @@ def centroid(shape: dict[str, Any] | GeoInterface) -> Point:
     if geom.geom_type == "Polygon":
         return cast(Point, geom.centroid)
     elif geom.geom_type == "MultiPolygon":
-        geoms = list()
-        for component in geom.geoms:
-            if any(c[0] < 0 for c in component.exterior.coords):
-                geoms.append(shapely.affinity.translate(component, xoff=+360))
-            else:
-                geoms.append(component)
+        geoms = list(geom.geoms)
+        coords, index = shapely.get_coordinates(
+            shapely.get_exterior_ring(geoms), return_index=True
+        )
+        for i in numpy.unique(index[coords[:, 0] < 0]).tolist():
+            geoms[i] = shapely.affinity.translate(geoms[i], xoff=+360)
         centroid = cast(
             Point, shapely.validation.make_valid(MultiPolygon(geoms)).centroid
         )
@@ -889,8 +3003,403 @@ def centroid(shape: dict[str, Any] | GeoInterface) -> Point:
         )
 
 
-def is_coincident_to_antimeridian(polygon: Polygon) -> bool:
-    for start, end in zip(polygon.exterior.coords, polygon.exterior.coords[1:]):
-        if abs(start[0]) == 180 and start[0] == end[0]:
-            return True
-    return False
+def centroids(
+    geometries: numpy.ndarray | Sequence[Any] | dict[str, Any],
+    spherical: bool = False,
+) -> numpy.ndarray:
+    """Calculates the centroids of many polygons and multi-polygons at once.
+
+    This is the bulk equivalent of calling [antimeridian.centroid][] on every
+    shape. As there, the parts of multi-polygons with a negative longitude in
+    their exterior are shifted into [0, 360), but each centroid is then
+    weighted by area straight from the rings' coordinates. A valid
+    multi-polygon can't overlap itself once shifted, so only multi-polygons
+    that are invalid to begin with are passed through [shapely.make_valid][].
+
+    Args:
+        geometries: An array of polygons and multi-polygons, as shapely
+            geometries, GeoJSON dictionaries or Features, or anything with a
+            [antimeridian.GeoInterface][]. A GeoJSON FeatureCollection gives
+            one centroid per feature. Missing geometries (`None`) are allowed.
+        spherical: Calculate the centroids of the shapes' areas on the
+            sphere, with every edge taken as a great circle arc, rather than
+            in the plane.
+
+    Returns:
+        An (N, 2) array, with one `[x, y]` centroid per shape. Missing and
+            empty shapes have NaN centroids, as do shapes without any area
+            when `spherical` is set.
+    """
+    array = geometry_array(geometries)
+    type_ids = shapely.get_type_id(array)
+    unsupported = ~numpy.isin(
+        type_ids,
+        (
+            shapely.GeometryType.MISSING,
+            shapely.GeometryType.POLYGON,
+            shapely.GeometryType.MULTIPOLYGON,
+        ),
+    )
+    if unsupported.any():
+        geom_type = array[numpy.flatnonzero(unsupported)[0]].geom_type
+        raise ValueError(f"unsupported geom_type for centroid calculation: {geom_type}")
+    is_multi = type_ids == shapely.GeometryType.MULTIPOLYGON
+    bounds = shapely.bounds(array)
+    needs_repair = is_multi & ~((bounds[:, 0] >= -180) & (bounds[:, 2] <= 180))
+    candidates = numpy.flatnonzero(is_multi & ~needs_repair)
+    needs_repair[candidates] = ~shapely.is_valid(array[candidates])
+
+    parts, rows = shapely.get_parts(array, return_index=True)
+    is_shifted = is_multi[rows] & (
+        shapely.bounds(shapely.get_exterior_ring(parts))[:, 0] < 0
+    )
+    parts[is_shifted] = shapely.transform(
+        parts[is_shifted], lambda coords: coords + numpy.array([360.0, 0.0])
+    )
+    is_repaired = needs_repair[rows]
+    if is_repaired.any():
+        valid = shapely.make_valid(
+            shapely.multipolygons(
+                parts[is_repaired], indices=compact_ids(rows[is_repaired])
+            )
+        )
+        # A repaired multi-polygon can be a collection of polygons,
+        # multi-polygons, and lower-dimensional leftovers.
+        pieces, index = shapely.get_parts(valid, return_index=True)
+        pieces, piece_index = shapely.get_parts(pieces, return_index=True)
+        is_polygon = shapely.get_type_id(pieces) == shapely.GeometryType.POLYGON
+        parts = numpy.concatenate((parts[~is_repaired], pieces[is_polygon]))
+        rows = numpy.concatenate(
+            (
+                rows[~is_repaired],
+                numpy.unique(rows[is_repaired])[index[piece_index[is_polygon]]],
+            )
+        )
+
+    rings, ring_part = shapely.get_rings(parts, return_index=True)
+    is_exterior = numpy.ones(len(rings), dtype=bool)
+    is_exterior[1:] = ring_part[1:] != ring_part[:-1]
+    centroids = ring_centroids(
+        shapely.get_coordinates(rings),
+        offsets_from_counts(shapely.get_num_coordinates(rings)),
+        rows[ring_part],
+        is_exterior,
+        len(array),
+        spherical,
+    )
+    if spherical:
+        return centroids
+    is_defined = ~numpy.isnan(centroids[:, 0])
+    is_flat = ~is_defined & shapely.is_geometry(array) & ~shapely.is_empty(array)
+    for i in numpy.flatnonzero(is_flat).tolist():
+        # Shapes without any area fall back to the centroid of their edges.
+        point = centroid(array[i])
+        centroids[i] = (point.x, point.y)
+    is_wrapped = is_multi & (centroids[:, 0] > 180)
+    centroids[is_wrapped, 0] -= 360
+    return centroids
+
+
+def ring_centroids(
+    coords: numpy.ndarray,
+    ring_offsets: numpy.ndarray,
+    ring_row: numpy.ndarray,
+    is_exterior: numpy.ndarray,
+    rows: int,
+    spherical: bool,
+) -> numpy.ndarray:
+    """Calculates area-weighted centroids straight from ring coordinates.
+
+    Args:
+        coords: The (N, 2) coordinates of every ring.
+        ring_offsets: The offsets of each ring's coordinates.
+        ring_row: The row (shape) each ring belongs to.
+        is_exterior: Whether each ring is an exterior, rather than a hole.
+        rows: The number of rows.
+        spherical: Calculate the centroids on the sphere.
+
+    Returns:
+        An (rows, 2) array of centroids, NaN for rows without any area
+    """
+    coord_ring = numpy.repeat(
+        numpy.arange(len(ring_offsets) - 1), numpy.diff(ring_offsets)
+    )
+    edges = numpy.flatnonzero(coord_ring[:-1] == coord_ring[1:])
+    edge_ring = coord_ring[edges]
+    rings = len(ring_offsets) - 1
+
+    # Each ring's area and first moments, as triangles fanned out from its
+    # first point to keep the sums small.
+    origins = coords[ring_offsets[:-1][edge_ring]]
+    start = coords[edges] - origins
+    end = coords[edges + 1] - origins
+    cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+    area = numpy.bincount(edge_ring, cross, minlength=rings) / 2
+    # Exteriors count positively, and holes negatively, whichever way they're
+    # wound.
+    sign = numpy.sign(area) * numpy.where(is_exterior, 1, -1)
+
+    centroids = numpy.full((rows, 2), numpy.nan)
+    if spherical:
+        points = spherical_degrees_to_cartesian(coords)
+        normals = numpy.cross(points[edges], points[edges + 1])
+        sines = numpy.linalg.norm(normals, axis=-1)
+        angles = numpy.arctan2(sines, (points[edges] * points[edges + 1]).sum(axis=-1))
+        # The integral of the position vector over a region of the sphere is
+        # half the sum, along its boundary, of each great circle arc's length
+        # times its unit normal.
+        weights = (
+            numpy.divide(angles, sines, out=numpy.zeros_like(sines), where=sines > 0)
+            * sign[edge_ring]
+        )
+        vectors = numpy.column_stack(
+            [
+                numpy.bincount(
+                    ring_row[edge_ring], weights * normals[:, i], minlength=rows
+                )
+                for i in range(3)
+            ]
+        )
+        is_defined = numpy.linalg.norm(vectors, axis=-1) > 0
+        x, y, z = vectors[is_defined].T
+        centroids[is_defined] = numpy.rad2deg(
+            numpy.column_stack(
+                (numpy.arctan2(y, x), numpy.arctan2(z, numpy.hypot(x, y)))
+            )
+        )
+        return centroids
+
+    moments = numpy.column_stack(
+        [
+            numpy.bincount(
+                edge_ring, cross * (start[:, i] + end[:, i]), minlength=rings
+            )
+            / 6
+            + area * coords[ring_offsets[:-1], i]
+            for i in range(2)
+        ]
+    )
+    row_area = numpy.bincount(ring_row, sign * area, minlength=rows)
+    row_moments = numpy.column_stack(
+        [
+            numpy.bincount(ring_row, sign * moments[:, i], minlength=rows)
+            for i in range(2)
+        ]
+    )
+    is_defined = row_area != 0
+    centroids[is_defined] = row_moments[is_defined] / row_area[is_defined, None]
+    return centroids
+
+
+def bbox_geoarrow(
+    geometry_type: shapely.GeometryType,
+    coords: numpy.ndarray,
+    offsets: tuple[numpy.ndarray, ...],
+    force_over_antimeridian: bool = False,
+) -> numpy.ndarray:
+    """Calculates the bounding box of every polygon or multi-polygon in GeoArrow
+    buffers.
+
+    This is the columnar equivalent of calling [antimeridian.bbox][] on every
+    geometry, read straight from the buffers. See
+    [antimeridian.fix_geoarrow][] for the layout of the buffers.
+
+    Args:
+        geometry_type: The type of the geometries, polygons or multi-polygons.
+        coords: The (N, 2) or (N, 3) coordinates of every geometry.
+        offsets: The offset arrays.
+        force_over_antimeridian: Force the bounding boxes of multi-polygons to
+            be over the antimeridian.
+
+    Returns:
+        An (N, 4) array, with one `[xmin, ymin, xmax, ymax]` bounding box per
+            geometry. Empty geometries have NaN bounding boxes.
+    """
+    geometry_type = shapely.GeometryType(geometry_type)
+    if geometry_type not in (
+        shapely.GeometryType.POLYGON,
+        shapely.GeometryType.MULTIPOLYGON,
+    ):
+        raise ValueError(
+            f"unsupported geometry type for bbox calculation: {geometry_type.name}"
+        )
+    packed = pack_ragged(geometry_type, coords, offsets)
+    bounds, is_coincident = exterior_bounds(packed)
+    if geometry_type == shapely.GeometryType.POLYGON:
+        return bounds
+    return multi_polygon_bboxes(
+        bounds, is_coincident, packed.geometry_offsets, force_over_antimeridian
+    )
+
+
+def multi_polygon_bboxes(
+    bounds: numpy.ndarray,
+    is_coincident: numpy.ndarray,
+    geometry_offsets: numpy.ndarray,
+    force_over_antimeridian: bool | numpy.ndarray,
+) -> numpy.ndarray:
+    """Combines the bounds of each multi-polygon's parts, as `bbox` does.
+
+    Args:
+        bounds: The (N, 4) bounds of every part.
+        is_coincident: Whether each part's exterior has an edge on the
+            antimeridian.
+        geometry_offsets: The offsets of each multi-polygon's parts.
+        force_over_antimeridian: Force the bounding boxes to be over the
+            antimeridian, for all multi-polygons or for each one.
+
+    Returns:
+        An (M, 4) array of bounding boxes, NaN for multi-polygons without parts
+    """
+    has_parts = numpy.diff(geometry_offsets) > 0
+    first = geometry_offsets[:-1][has_parts]
+    xmins = bounds[:, 0]
+    xmaxs = bounds[:, 2]
+    crosses_antimeridian = numpy.logical_or.reduceat(
+        is_coincident & ~((xmins == -180) & (xmaxs == 180)), first
+    )
+    is_over = (
+        crosses_antimeridian
+        | numpy.broadcast_to(force_over_antimeridian, has_parts.shape)[has_parts]
+    )
+    bboxes = numpy.full((len(has_parts), 4), numpy.nan)
+    bboxes[has_parts] = numpy.column_stack(
+        (
+            numpy.where(
+                is_over,
+                numpy.maximum.reduceat(xmins, first),
+                numpy.minimum.reduceat(xmins, first),
+            ),
+            numpy.fmin(numpy.fmin.reduceat(bounds[:, 1], first), 90),
+            numpy.where(
+                is_over,
+                numpy.minimum.reduceat(xmaxs, first),
+                numpy.maximum.reduceat(xmaxs, first),
+            ),
+            numpy.fmax(numpy.fmax.reduceat(bounds[:, 3], first), -90),
+        )
+    )
+    return bboxes
+
+
+def centroid_geoarrow(
+    geometry_type: shapely.GeometryType,
+    coords: numpy.ndarray,
+    offsets: tuple[numpy.ndarray, ...],
+) -> numpy.ndarray:
+    """Calculates the centroid of every polygon or multi-polygon in GeoArrow
+    buffers.
+
+    This is the columnar equivalent of calling [antimeridian.centroid][] on
+    every geometry, calculated as [antimeridian.centroids][] does. See
+    [antimeridian.fix_geoarrow][] for the layout of the buffers.
+
+    Args:
+        geometry_type: The type of the geometries, polygons or multi-polygons.
+        coords: The (N, 2) or (N, 3) coordinates of every geometry.
+        offsets: The offset arrays.
+
+    Returns:
+        An (N, 2) array, with one `[x, y]` centroid per geometry. Empty
+            geometries have NaN centroids.
+    """
+    geometry_type = shapely.GeometryType(geometry_type)
+    if geometry_type not in (
+        shapely.GeometryType.POLYGON,
+        shapely.GeometryType.MULTIPOLYGON,
+    ):
+        raise ValueError(
+            f"unsupported geometry type for centroid calculation: {geometry_type.name}"
+        )
+    packed = pack_ragged(geometry_type, coords, offsets)
+    rows = len(packed.geometry_offsets) - 1
+    part_counts = numpy.diff(packed.part_offsets)
+    ring_part = numpy.repeat(numpy.arange(len(part_counts)), part_counts)
+    ring_row = numpy.repeat(numpy.arange(rows), numpy.diff(packed.geometry_offsets))[
+        ring_part
+    ]
+    is_exterior = numpy.zeros(len(ring_part), dtype=bool)
+    is_exterior[packed.part_offsets[:-1][part_counts > 0]] = True
+    xy = packed.coords[:, :2]
+    geometries = None
+    needs_fallback = numpy.zeros(rows, dtype=bool)
+    if geometry_type == shapely.GeometryType.MULTIPOLYGON:
+        # As in `centroids`, shift parts with a negative longitude in their
+        # exterior, and leave multi-polygons that need repair to it.
+        coord_ring = numpy.repeat(ring_part, numpy.diff(packed.ring_offsets))
+        bounds, _ = exterior_bounds(packed)
+        xy = xy.copy()
+        xy[(bounds[:, 0] < 0)[coord_ring], 0] += 360
+        out_of_range = numpy.abs(packed.coords[:, 0]) > 180
+        needs_fallback = (
+            numpy.bincount(ring_row[coord_ring], out_of_range, minlength=rows) > 0
+        )
+        geometries = shapely.from_ragged_array(geometry_type, coords, offsets)
+        candidates = numpy.flatnonzero(~needs_fallback)
+        needs_fallback[candidates] = ~shapely.is_valid(geometries[candidates])
+    result = ring_centroids(
+        xy, packed.ring_offsets, ring_row, is_exterior, rows, spherical=False
+    )
+    if geometry_type == shapely.GeometryType.MULTIPOLYGON:
+        is_wrapped = ~needs_fallback & (result[:, 0] > 180)
+        result[is_wrapped, 0] -= 360
+    # Shapes without any area are also left to `centroids`.
+    coord_offsets = packed.ring_offsets[packed.part_offsets[packed.geometry_offsets]]
+    needs_fallback |= numpy.isnan(result[:, 0]) & (numpy.diff(coord_offsets) > 0)
+    if needs_fallback.any():
+        if geometries is None:
+            geometries = shapely.from_ragged_array(geometry_type, coords, offsets)
+        result[needs_fallback] = centroids(geometries[needs_fallback])
+    return result
+
+
+def exterior_bounds(packed: PackedGeometries) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the bounds of each part's exterior, and whether it has an edge on
+    the antimeridian."""
+    bounds = numpy.full((len(packed.part_offsets) - 1, 4), numpy.nan)
+    is_coincident = numpy.zeros(len(bounds), dtype=bool)
+    parts = numpy.flatnonzero(numpy.diff(packed.part_offsets) > 0)
+    rings = packed.part_offsets[parts]
+    counts = numpy.diff(packed.ring_offsets)[rings]
+    parts = parts[counts > 0]
+    rings = rings[counts > 0]
+    counts = counts[counts > 0]
+    if not len(parts):
+        return bounds, is_coincident
+    bounds[parts], is_coincident[parts] = ring_bounds(
+        packed.coords[ranges(packed.ring_offsets, rings), :2], counts
+    )
+    return bounds, is_coincident
+
+
+def ring_bounds(
+    coords: numpy.ndarray, counts: numpy.ndarray
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the bounds of each closed, non-empty ring in a coordinate
+    buffer, and whether it has an edge on the antimeridian."""
+    first = offsets_from_counts(counts)[:-1]
+    bounds = numpy.column_stack(
+        (numpy.minimum.reduceat(coords, first), numpy.maximum.reduceat(coords, first))
+    )
+    x = coords[:, 0]
+    index = numpy.repeat(numpy.arange(len(counts)), counts)
+    is_edge_on_antimeridian = (
+        (numpy.abs(x[:-1]) == 180) & (x[:-1] == x[1:]) & (index[:-1] == index[1:])
+    )
+    is_coincident = numpy.zeros(len(counts), dtype=bool)
+    is_coincident[index[:-1][is_edge_on_antimeridian]] = True
+    return bounds, is_coincident
+
+
+def is_coincident_to_antimeridian(polygons: numpy.ndarray) -> numpy.ndarray:
+    """Returns whether each polygon's exterior has an edge on the antimeridian."""
+    coords, index = shapely.get_coordinates(
+        shapely.get_exterior_ring(polygons), return_index=True
+    )
+    x = coords[:, 0]
+    is_edge_on_antimeridian = (
+        (numpy.abs(x[:-1]) == 180) & (x[:-1] == x[1:]) & (index[:-1] == index[1:])
+    )
+    is_coincident = numpy.zeros(len(polygons), dtype=bool)
+    is_coincident[index[:-1][is_edge_on_antimeridian]] = True
+    return is_coincident
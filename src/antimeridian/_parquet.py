@@ -0,0 +1,138 @@
+"""Fix the geometries of GeoParquet files, a row group at a time."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pyarrow
+import pyarrow.parquet
+import shapely
+
+from ._implementation import FixStats, bboxes, fix_wkb_array
+
+BBOX_TYPE = pyarrow.struct(
+    [
+        ("xmin", pyarrow.float64()),
+        ("ymin", pyarrow.float64()),
+        ("xmax", pyarrow.float64()),
+        ("ymax", pyarrow.float64()),
+    ]
+)
+"""The type of a GeoParquet 1.1 bounding box covering column."""
+
+MULTI_GEOMETRY_TYPES = {
+    "LineString": "MultiLineString",
+    "Polygon": "MultiPolygon",
+}
+"""The geometry types a fixed geometry can turn into, when it's split."""
+
+
+def fix_parquet(
+    source: str,
+    destination: str,
+    *,
+    geometry_column: str | None = None,
+    bbox_column: str = "bbox",
+    stats: FixStats | None = None,
+    **options: Any,
+) -> None:
+    """Fixes the geometries of a GeoParquet file, writing a new file.
+
+    Row groups are read, fixed, and written one at a time, so memory use is
+    bounded by the size of a row group. The geometry column must be WKB
+    encoded. Every row gets a GeoParquet 1.1 bounding box covering column,
+    calculated with [antimeridian.bbox][] for polygons, so the boxes of
+    polygons that were split over the antimeridian have `xmin > xmax`.
+
+    Args:
+        source: The GeoParquet file to fix.
+        destination: Where to write the fixed GeoParquet file.
+        geometry_column: The geometry column to fix. Defaults to the primary
+            column.
+        bbox_column: The name of the bounding box column. It is replaced if
+            it already exists.
+        stats: If provided, updated with how many geometries were fixed and
+            how many were returned unchanged.
+        options: Passed to [antimeridian.fix_geometries][].
+    """
+    parquet_file = pyarrow.parquet.ParquetFile(source)
+    schema = parquet_file.schema_arrow
+    metadata = dict(schema.metadata or {})
+    if b"geo" not in metadata:
+        raise ValueError(f"{source} is not a GeoParquet file: no 'geo' metadata")
+    geo = json.loads(metadata[b"geo"])
+    geometry_column = geometry_column or geo["primary_column"]
+    column = geo["columns"].get(geometry_column)
+    if column is None:
+        raise ValueError(f"no geometry column named '{geometry_column}'")
+    if column.get("encoding", "").upper() != "WKB":
+        raise ValueError(
+            f"unsupported encoding for column '{geometry_column}': "
+            f"{column.get('encoding')} (only WKB is supported)"
+        )
+
+    # A fixed geometry can be split into a multi-geometry, and the old file
+    # bbox might have been calculated from unfixed coordinates.
+    geometry_types = column.get("geometry_types", [])
+    for geometry_type in list(geometry_types):
+        base, _, z = geometry_type.partition(" ")
+        if base in MULTI_GEOMETRY_TYPES:
+            multi = " ".join(filter(None, (MULTI_GEOMETRY_TYPES[base], z)))
+            if multi not in geometry_types:
+                geometry_types.append(multi)
+    column.pop("bbox", None)
+    column["covering"] = {
+        "bbox": {name: [bbox_column, name] for name in BBOX_TYPE.names}
+    }
+    if geo.get("version", "1.0.0").startswith("1.0"):
+        # Covering columns are new in GeoParquet 1.1.
+        geo["version"] = "1.1.0"
+    metadata[b"geo"] = json.dumps(geo).encode()
+
+    if bbox_column in schema.names:
+        schema = schema.remove(schema.get_field_index(bbox_column))
+    schema = schema.append(pyarrow.field(bbox_column, BBOX_TYPE)).with_metadata(
+        metadata
+    )
+    with pyarrow.parquet.ParquetWriter(destination, schema) as writer:
+        for i in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(i)
+            writer.write_table(
+                fix_table(table, geometry_column, bbox_column, stats, **options)
+                .select(schema.names)
+                .replace_schema_metadata(metadata),
+                row_group_size=max(len(table), 1),
+            )
+
+
+def fix_table(
+    table: pyarrow.Table,
+    geometry_column: str,
+    bbox_column: str,
+    stats: FixStats | None,
+    **options: Any,
+) -> pyarrow.Table:
+    """Fixes the WKB geometry column of a table, and sets its bbox column."""
+    index = table.schema.get_field_index(geometry_column)
+    wkb = table.column(index).to_numpy(zero_copy_only=False).astype(object)
+    wkb, geometries = fix_wkb_array(wkb, stats=stats, **options)
+    table = table.set_column(
+        index,
+        table.field(index),
+        pyarrow.array(wkb, type=table.field(index).type),
+    )
+    # Multi-polygons get antimeridian-aware boxes, everything else its bounds.
+    bbox = shapely.bounds(geometries)
+    is_multi_polygon = (
+        shapely.get_type_id(geometries) == shapely.GeometryType.MULTIPOLYGON
+    )
+    bbox[is_multi_polygon] = bboxes(geometries[is_multi_polygon])
+    bbox_array = pyarrow.StructArray.from_arrays(
+        [pyarrow.array(bbox[:, i]) for i in range(4)],
+        fields=list(BBOX_TYPE),
+        mask=pyarrow.array(shapely.is_missing(geometries)),
+    )
+    if bbox_column in table.schema.names:
+        table = table.drop_columns([bbox_column])
+    return table.append_column(pyarrow.field(bbox_column, BBOX_TYPE), bbox_array)
@@ -1,7 +1,7 @@
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 import pytest
 import shapely.geometry
@@ -57,6 +57,28 @@ def read_input() -> Reader:
     return read_input
 
 
+FeatureCollectionReader = Callable[[list[str]], dict[str, Any]]
+
+
+@pytest.fixture
+def read_feature_collection(read_input: Reader) -> FeatureCollectionReader:
+    def read_feature_collection(names: list[str]) -> dict[str, Any]:
+        return feature_collection(read_input(name) for name in names)
+
+    return read_feature_collection
+
+
+def feature_collection(geometries: Iterable[Any]) -> dict[str, Any]:
+    """Wraps each geometry in a Feature, in a FeatureCollection."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": geometry, "properties": {}}
+            for geometry in geometries
+        ],
+    }
+
+
 @pytest.fixture
 def input_path() -> Callable[[str], Path]:
     def input_path(name: str) -> Path:
@@ -1,8 +1,10 @@
+import numpy
 import pytest
+from shapely.geometry import LineString, mapping
 
 import antimeridian
 
-from .conftest import Reader
+from .conftest import Reader, feature_collection
 
 
 @pytest.mark.parametrize(
@@ -31,3 +33,75 @@ def test_bbox_force_over_antimeridian(read_output: Reader) -> None:
     shape = read_output("issues-134")
     bbox = antimeridian.bbox(shape, force_over_antimeridian=True)
     assert bbox == expected
+
+
+def test_bboxes(read_output: Reader) -> None:
+    names = ["simple", "split", "multi-no-antimeridian", "north-pole", "ocean"]
+    shapes = [read_output(name) for name in names]
+    bboxes = antimeridian.bboxes([*shapes, None])
+    assert bboxes.shape == (len(shapes) + 1, 4)
+    assert bboxes[:-1].tolist() == [antimeridian.bbox(shape) for shape in shapes]
+    assert numpy.isnan(bboxes[-1]).all()
+
+
+def test_bboxes_force_over_antimeridian(read_output: Reader) -> None:
+    shape = read_output("issues-134")
+    bboxes = antimeridian.bboxes([shape, shape], [True, False])
+    assert bboxes.tolist() == [
+        antimeridian.bbox(shape, force_over_antimeridian=True),
+        antimeridian.bbox(shape),
+    ]
+
+
+def test_bboxes_feature_collection(read_output: Reader) -> None:
+    shapes = [read_output(name) for name in ["simple", "split"]]
+    bboxes = antimeridian.bboxes(feature_collection(map(mapping, shapes)))
+    assert bboxes.tolist() == [antimeridian.bbox(shape) for shape in shapes]
+
+
+def test_bboxes_unsupported() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.bboxes([LineString([(0, 0), (1, 1)])])
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "simple",
+        "split",
+        "north-pole",
+        "south-pole",
+        "both-poles",
+        "complex-split",
+        "cw-split",
+        "multi-split",
+        "one-hole",
+        "two-holes",
+        "latitude-band",
+        "point-on-antimeridian",
+    ],
+)
+@pytest.mark.parametrize("great_circle", [True, False])
+def test_fixed_bbox(read_input: Reader, name: str, great_circle: bool) -> None:
+    geometry = mapping(read_input(name))
+    fixed = antimeridian.fix_shape(
+        geometry, fix_winding=True, great_circle=great_circle
+    )
+    expected = antimeridian.bbox(fixed)
+    assert (
+        antimeridian.fixed_bbox(geometry, fix_winding=True, great_circle=great_circle)
+        == expected
+    )
+
+
+def test_fixed_bbox_force_over_antimeridian(read_input: Reader) -> None:
+    shape = read_input("multi-split")
+    expected = antimeridian.bbox(
+        antimeridian.fix_shape(shape), force_over_antimeridian=True
+    )
+    assert antimeridian.fixed_bbox(shape, force_over_antimeridian=True) == expected
+
+
+def test_fixed_bbox_unsupported() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.fixed_bbox(LineString([(170, 0), (-170, 0)]))
@@ -0,0 +1,185 @@
+import concurrent.futures
+import copy
+import json
+from pathlib import Path
+
+import pytest
+import shapely.geometry
+
+import antimeridian
+
+from .conftest import FeatureCollectionReader, Reader
+
+
+def test_fix_shape(read_input: Reader) -> None:
+    cache = antimeridian.FixCache()
+    geometry = shapely.geometry.mapping(read_input("split"))
+    expected = antimeridian.fix_shape(copy.deepcopy(geometry))
+    assert cache.fix_shape(geometry) == expected
+    # An equal shape in another object, with lists rather than tuples.
+    fixed = cache.fix_shape(json.loads(json.dumps(geometry)))
+    assert fixed == expected
+    assert cache.stats == antimeridian.CacheStats(
+        hits=1, misses=1, size=1, maxsize=4096
+    )
+
+
+def test_fix_shape_returns_copies(read_input: Reader) -> None:
+    cache = antimeridian.FixCache()
+    geometry = shapely.geometry.mapping(read_input("split"))
+    fixed = cache.fix_shape(geometry)
+    fixed["type"] = "Changed"
+    assert cache.fix_shape(geometry)["type"] == "MultiPolygon"
+
+
+def test_fix_shape_unchanged(read_input: Reader) -> None:
+    cache = antimeridian.FixCache()
+    geometry = shapely.geometry.mapping(read_input("simple"))
+    other = copy.deepcopy(geometry)
+    stats = antimeridian.FixStats()
+    assert cache.fix_shape(geometry, stats=stats) is geometry
+    assert cache.fix_shape(other, stats=stats) is other
+    assert stats == antimeridian.FixStats(unchanged=2, fixed=0)
+    shape = cache.fix_shape(read_input("simple"), output="shapely")
+    assert shape == read_input("simple")
+
+
+def test_options_are_part_of_the_key(read_input: Reader) -> None:
+    cache = antimeridian.FixCache()
+    geometry = shapely.geometry.mapping(read_input("split"))
+    spherical = cache.fix_shape(geometry)
+    flat = cache.fix_shape(geometry, great_circle=False)
+    assert flat == antimeridian.fix_shape(geometry, great_circle=False)
+    assert cache.stats.misses == 2
+    assert cache.fix_shape(geometry, output="shapely") == shapely.geometry.shape(
+        spherical
+    )
+
+
+def test_fix_geojson(read_feature_collection: FeatureCollectionReader) -> None:
+    cache = antimeridian.FixCache()
+    feature_collection = read_feature_collection(["simple", "split", "split", "line"])
+    expected = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    stats = antimeridian.FixStats()
+    fixed = cache.fix_geojson(feature_collection, inplace=False, stats=stats)
+    assert fixed == expected
+    assert fixed is not feature_collection
+    assert stats == antimeridian.FixStats(unchanged=1, fixed=3)
+    assert cache.stats.hits == 1
+    assert cache.fix_geojson(feature_collection) == expected
+    assert cache.stats.hits == 5
+
+
+def test_bbox_and_centroid(read_output: Reader) -> None:
+    cache = antimeridian.FixCache()
+    shape = read_output("split")
+    for _ in range(2):
+        assert cache.bbox(shape) == antimeridian.bbox(shape)
+        assert cache.bbox(shape, force_over_antimeridian=True) == antimeridian.bbox(
+            shape, force_over_antimeridian=True
+        )
+        assert cache.centroid(shape) == antimeridian.centroid(shape)
+    assert cache.stats == antimeridian.CacheStats(
+        hits=3, misses=3, size=3, maxsize=4096
+    )
+
+
+def test_eviction(read_output: Reader) -> None:
+    cache = antimeridian.FixCache(maxsize=2)
+    names = ["simple", "split", "north-pole"]
+    shapes = [read_output(name) for name in names]
+    for shape in shapes:
+        cache.bbox(shape)
+    assert len(cache) == 2
+    cache.bbox(shapes[2])
+    cache.bbox(shapes[1])
+    assert cache.stats.hits == 2
+    cache.bbox(shapes[0])
+    assert cache.stats.misses == 4
+    cache.clear()
+    assert cache.stats == antimeridian.CacheStats(maxsize=2)
+
+
+def test_negative_maxsize() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.FixCache(maxsize=-1)
+
+
+def test_threads(read_input: Reader) -> None:
+    cache = antimeridian.FixCache(maxsize=8)
+    geometries = [
+        shapely.geometry.mapping(read_input(name))
+        for name in ["simple", "split", "north-pole", "complex-split", "line"] * 20
+    ]
+    expected = [antimeridian.fix_shape(geometry) for geometry in geometries]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        fixed = list(executor.map(cache.fix_shape, geometries))
+    assert fixed == expected
+    stats = cache.stats
+    assert stats.hits + stats.misses == len(geometries)
+    assert stats.size == 5
+
+
+def test_disk_cache(
+    read_input: Reader, read_feature_collection: FeatureCollectionReader, tmp_path: Path
+) -> None:
+    feature_collection = read_feature_collection(["simple", "split", "line"])
+    expected = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    with antimeridian.DiskCache(tmp_path) as cache:
+        fixed = cache.fix_geojson(feature_collection, inplace=False)
+        assert fixed == expected
+        assert cache.stats.misses == 3
+    # A new process would start from what's on disk.
+    with antimeridian.DiskCache(tmp_path) as cache:
+        stats = antimeridian.FixStats()
+        fixed = cache.fix_geojson(feature_collection, inplace=False, stats=stats)
+        assert fixed == expected
+        assert stats == antimeridian.FixStats(unchanged=1, fixed=2)
+        assert cache.stats.hits == 3
+        assert cache.stats.misses == 3
+        assert len(cache) == 3
+        shape = read_input("split")
+        assert cache.fix_shape(
+            shapely.geometry.mapping(shape), output="shapely"
+        ) == antimeridian.fix_shape(shape, output="shapely")
+        assert cache.bbox(shape) == cache.bbox(shape) == antimeridian.bbox(shape)
+        assert cache.centroid(shape) == antimeridian.centroid(shape)
+        assert cache.centroid(shape) == antimeridian.centroid(shape)
+
+
+def test_disk_cache_miss_and_hit_are_equal(read_input: Reader, tmp_path: Path) -> None:
+    geometry = shapely.geometry.mapping(read_input("split"))
+    expected = antimeridian.fix_shape(copy.deepcopy(geometry))
+    with antimeridian.DiskCache(tmp_path) as cache:
+        miss = cache.fix_shape(geometry)
+        hit = cache.fix_shape(geometry)
+        assert cache.stats.hits == 1
+    with antimeridian.DiskCache(tmp_path) as cache:
+        reopened = cache.fix_shape(geometry)
+    assert miss == hit == reopened == expected
+
+
+def test_disk_cache_close_twice(tmp_path: Path) -> None:
+    with antimeridian.DiskCache(tmp_path) as cache:
+        cache.close()
+    cache.close()
+
+
+def test_disk_cache_eviction(read_output: Reader, tmp_path: Path) -> None:
+    shapes = [read_output(name) for name in ["simple", "split", "north-pole"]]
+    sizes = []
+    for i, shape in enumerate(shapes):
+        with antimeridian.DiskCache(tmp_path / str(i)) as cache:
+            cache.bbox(shape)
+            sizes.append(cache.stats.size)
+    max_bytes = sizes[1] + sizes[2]
+    with antimeridian.DiskCache(tmp_path / "cache", max_bytes=max_bytes) as cache:
+        for shape in shapes:
+            cache.bbox(shape)
+        assert len(cache) == 2
+        assert cache.stats.size == max_bytes
+        cache.bbox(shapes[0])
+        assert cache.stats.misses == 4
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats == antimeridian.CacheStats(maxsize=max_bytes)
@@ -1,11 +1,21 @@
+import io
+import json
 from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+import shapely
+import shapely.geometry
 from pytest_console_scripts import ScriptRunner
 
+import antimeridian
+
 pytest.importorskip("click")
 
+from click.testing import CliRunner
+
+from antimeridian._cli import JsonStream, cli, stream_geojson
+
 
 def test_fix(script_runner: ScriptRunner, input_path: Callable[[str], Path]) -> None:
     path = input_path("simple")
@@ -19,3 +29,169 @@ def test_segment(
     path = input_path("simple")
     result = script_runner.run(["antimeridian", "segment", str(path)])
     assert result.success
+
+
+def test_fix_jobs(
+    script_runner: ScriptRunner, input_path: Callable[[str], Path]
+) -> None:
+    path = input_path("simple")
+    serial = script_runner.run(["antimeridian", "fix", str(path)])
+    parallel = script_runner.run(["antimeridian", "fix", "--jobs", "2", str(path)])
+    assert parallel.success
+    assert parallel.stdout == serial.stdout
+
+
+def test_fix_wkb(input_path: Callable[[str], Path], tmp_path: Path) -> None:
+    geometry = shapely.geometry.shape(json.loads(input_path("split").read_text()))
+    path = tmp_path / "input.wkb"
+    path.write_bytes(shapely.to_wkb(geometry))
+    # The output is binary, so it's captured in-process as bytes.
+    result = CliRunner().invoke(cli, ["fix", "--format", "wkb", str(path)])
+    assert result.exit_code == 0
+    assert (
+        shapely.from_wkb(result.stdout_bytes)
+        == (antimeridian.fix_geometries([geometry])[0])
+    )
+
+
+def test_fix_stdin(input_path: Callable[[str], Path]) -> None:
+    text = input_path("split").read_text()
+    geometry = shapely.geometry.shape(json.loads(text))
+    expected = antimeridian.fix_geometries([geometry])[0]
+    result = CliRunner().invoke(cli, ["fix", "--format", "wkb"], input=geometry.wkb)
+    assert result.exit_code == 0
+    assert shapely.from_wkb(result.stdout_bytes) == expected
+    result = CliRunner().invoke(cli, ["fix", "-"], input=text)
+    assert result.exit_code == 0
+    assert shapely.geometry.shape(json.loads(result.stdout)) == expected
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_fix_wkb_hex(
+    script_runner: ScriptRunner,
+    input_path: Callable[[str], Path],
+    tmp_path: Path,
+    jobs: str,
+) -> None:
+    geometries = [
+        shapely.geometry.shape(json.loads(input_path(name).read_text()))
+        for name in ["simple", "split", "line"]
+    ]
+    path = tmp_path / "input.txt"
+    path.write_text("\n\n".join(shapely.to_wkb(geometries, hex=True)) + "\n")
+    result = script_runner.run(
+        ["antimeridian", "fix", "--format", "wkb-hex", "--jobs", jobs, str(path)]
+    )
+    assert result.success
+    lines = result.stdout.splitlines()
+    assert list(shapely.from_wkb(lines)) == list(
+        antimeridian.fix_geometries(geometries)
+    )
+
+
+@pytest.mark.parametrize("command", ["fix", "segment", "bbox"])
+def test_ndjson(
+    script_runner: ScriptRunner,
+    input_path: Callable[[str], Path],
+    tmp_path: Path,
+    command: str,
+) -> None:
+    names = ["simple", "split", "north-pole"]
+    path = tmp_path / "input.geojsonl"
+    path.write_text(
+        "\x1e"
+        + "\n\n".join(
+            json.dumps(json.loads(input_path(name).read_text())) for name in names
+        )
+        + "\n"
+    )
+    result = script_runner.run(["antimeridian", command, "--ndjson", str(path)])
+    assert result.success
+    lines = result.stdout.splitlines()
+    assert len(lines) == len(names)
+    for name, line in zip(names, lines):
+        expected = script_runner.run(["antimeridian", command, str(input_path(name))])
+        assert json.loads(line) == json.loads(expected.stdout)
+
+
+def test_fix_ndjson_jobs(
+    script_runner: ScriptRunner, input_path: Callable[[str], Path], tmp_path: Path
+) -> None:
+    names = ["simple", "split", "north-pole", "line", "complex-split"] * 3
+    path = tmp_path / "input.geojsonl"
+    path.write_text(
+        "\x1e\n"
+        + "\n".join(
+            json.dumps(json.loads(input_path(name).read_text())) for name in names
+        )
+        + "\n\n"
+    )
+    serial = script_runner.run(["antimeridian", "fix", "--ndjson", str(path)])
+    parallel = script_runner.run(
+        ["antimeridian", "fix", "--ndjson", "--jobs", "2", str(path)]
+    )
+    assert parallel.success
+    assert len(parallel.stdout.splitlines()) == len(names)
+    assert parallel.stdout == serial.stdout
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_stream_feature_collection(
+    input_path: Callable[[str], Path], chunk_size: int
+) -> None:
+    features = [
+        {
+            "type": "Feature",
+            "id": i,
+            "properties": {"name": name},
+            "geometry": json.loads(input_path(name).read_text()),
+        }
+        for i, name in enumerate(["simple", "split", "line"])
+    ]
+    text = json.dumps(
+        {"type": "FeatureCollection", "features": features, "bbox": [0, 1, 2, 3]},
+        indent=2,
+    )
+    expected = json.dumps(antimeridian.fix_geojson(json.loads(text)))
+    output = io.StringIO()
+    stream = JsonStream(io.StringIO(text), chunk_size=chunk_size)
+    stream_geojson(stream, antimeridian.fix_geojson, output.write)
+    assert output.getvalue() == expected
+
+
+def test_fix_cache_dir(input_path: Callable[[str], Path], tmp_path: Path) -> None:
+    path = input_path("split")
+    cache_dir = str(tmp_path / "cache")
+    runner = CliRunner()
+    expected = runner.invoke(cli, ["fix", str(path)]).stdout
+    for _ in range(2):
+        result = runner.invoke(cli, ["fix", "--cache-dir", cache_dir, str(path)])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == json.loads(expected)
+    result = runner.invoke(cli, ["cache", "stats", "--cache-dir", cache_dir])
+    stats = json.loads(result.stdout)
+    assert stats["bytes"] > 0
+    assert stats == {
+        "entries": 1,
+        "bytes": stats["bytes"],
+        "hits": 1,
+        "misses": 1,
+    }
+    runner.invoke(cli, ["cache", "clear"], env={"ANTIMERIDIAN_CACHE_DIR": cache_dir})
+    result = runner.invoke(cli, ["cache", "stats", "--cache-dir", cache_dir])
+    assert json.loads(result.stdout) == {
+        "entries": 0,
+        "bytes": 0,
+        "hits": 0,
+        "misses": 0,
+    }
+
+
+@pytest.mark.parametrize("args", [["--jobs", "2"], ["--format", "wkb-hex"]])
+def test_fix_cache_dir_usage(
+    input_path: Callable[[str], Path], tmp_path: Path, args: list[str]
+) -> None:
+    result = CliRunner().invoke(
+        cli, ["fix", "--cache-dir", str(tmp_path), *args, str(input_path("simple"))]
+    )
+    assert result.exit_code == 2
@@ -0,0 +1,142 @@
+import numpy
+import pytest
+import shapely
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+
+import antimeridian
+
+from .conftest import Reader
+
+
+@pytest.mark.parametrize(
+    "subdirectory,great_circle",
+    [("flat", False), ("spherical", True)],
+)
+def test_fix_geoarrow(
+    read_input: Reader, read_output: Reader, subdirectory: str, great_circle: bool
+) -> None:
+    names = ["simple", "split", "complex-split", "north-pole", "one-hole"]
+    input = numpy.array([read_input(name) for name in names])
+    geometry_type, coords, offsets = antimeridian.fix_geoarrow(
+        *shapely.to_ragged_array(input), great_circle=great_circle
+    )
+    assert geometry_type == shapely.GeometryType.MULTIPOLYGON
+    fixed = shapely.from_ragged_array(geometry_type, coords, offsets)
+    assert fixed.shape == input.shape
+    for name, geometry in zip(names, fixed):
+        expected = read_output(name, subdirectory)
+        if isinstance(expected, Polygon):
+            expected = MultiPolygon([expected])
+        assert geometry.normalize() == expected.normalize()
+
+
+def test_fix_geoarrow_returns_buffers_unchanged(read_input: Reader) -> None:
+    hole = [(2, 2), (2, 4), (4, 4), (4, 2)]
+    polygon = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)], [hole])
+    input = shapely.to_ragged_array([read_input("simple"), polygon])
+    stats = antimeridian.FixStats()
+    geometry_type, coords, offsets = antimeridian.fix_geoarrow(*input, stats=stats)
+    assert geometry_type == input[0]
+    assert coords is input[1]
+    assert offsets is input[2]
+    assert stats.unchanged == 2
+    assert stats.fixed == 0
+
+
+def test_fix_geoarrow_keeps_layout_if_nothing_splits(read_input: Reader) -> None:
+    input = shapely.to_ragged_array([read_input("simple"), read_input("cw-only")])
+    with pytest.warns(antimeridian.FixWindingWarning):
+        geometry_type, coords, offsets = antimeridian.fix_geoarrow(*input)
+    assert geometry_type == shapely.GeometryType.POLYGON
+    assert offsets[0].dtype == input[2][0].dtype
+    fixed = shapely.from_ragged_array(geometry_type, coords, offsets)
+    assert fixed[0] == read_input("simple")
+    assert shapely.is_ccw(fixed[1].exterior)
+
+
+def test_fix_geoarrow_line_strings() -> None:
+    lines = [LineString([(170, 0), (-170, 10)]), LineString([(0, 0), (10, 10)])]
+    geometry_type, coords, offsets = antimeridian.fix_geoarrow(
+        *shapely.to_ragged_array(lines), great_circle=False
+    )
+    assert geometry_type == shapely.GeometryType.MULTILINESTRING
+    fixed = shapely.from_ragged_array(geometry_type, coords, offsets)
+    assert len(fixed[0].geoms) == 2
+    assert fixed[1].geoms[0] == lines[1]
+
+
+def test_fix_geoarrow_sliced_offsets(read_input: Reader) -> None:
+    names = ["simple", "split", "complex-split", "north-pole"]
+    geometry_type, coords, (rings, parts) = shapely.to_ragged_array(
+        [read_input(name) for name in names]
+    )
+    fixed = antimeridian.fix_geoarrow(geometry_type, coords, (rings, parts[1:4]))
+    expected = antimeridian.fix_geometries(
+        [read_input("split"), read_input("complex-split")]
+    )
+    assert list(shapely.from_ragged_array(*fixed)) == list(expected)
+
+
+def test_fix_geoarrow_unsupported() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.fix_geoarrow(*shapely.to_ragged_array([Point(0, 0)]))
+
+
+def test_bbox_geoarrow(read_input: Reader) -> None:
+    names = ["split", "complex-split", "north-pole", "multi-split"]
+    fixed = antimeridian.fix_geometries([read_input(name) for name in names])
+    geometry_type, coords, offsets = shapely.to_ragged_array(
+        [g if isinstance(g, MultiPolygon) else MultiPolygon([g]) for g in fixed]
+    )
+    bboxes = antimeridian.bbox_geoarrow(geometry_type, coords, offsets)
+    assert bboxes.tolist() == [antimeridian.bbox(g) for g in fixed]
+    bboxes = antimeridian.bbox_geoarrow(
+        geometry_type, coords, offsets, force_over_antimeridian=True
+    )
+    assert bboxes.tolist() == [antimeridian.bbox(g, True) for g in fixed]
+
+
+def test_bbox_geoarrow_polygons(read_input: Reader) -> None:
+    polygons = [read_input("simple"), read_input("one-hole")]
+    bboxes = antimeridian.bbox_geoarrow(*shapely.to_ragged_array(polygons))
+    assert bboxes.tolist() == [antimeridian.bbox(g) for g in polygons]
+
+
+def test_centroid_geoarrow(read_input: Reader) -> None:
+    names = ["simple", "split", "complex-split", "multi-split"]
+    fixed = antimeridian.fix_geometries([read_input(name) for name in names])
+    input = shapely.to_ragged_array(
+        [g if isinstance(g, MultiPolygon) else MultiPolygon([g]) for g in fixed]
+    )
+    centroids = antimeridian.centroid_geoarrow(*input)
+    for centroid, geometry in zip(centroids, fixed):
+        expected = antimeridian.centroid(geometry)
+        assert centroid == pytest.approx([expected.x, expected.y])
+
+
+def test_centroid_geoarrow_matches_centroids() -> None:
+    overlapping = MultiPolygon(
+        [
+            Polygon([(170, 0), (180, 0), (180, 10), (170, 10)]),
+            Polygon([(175, 5), (180, 5), (180, 15), (175, 15)]),
+            Polygon([(-180, 0), (-175, 0), (-175, 10), (-180, 10)]),
+        ]
+    )
+    geometries = [
+        MultiPolygon(),
+        overlapping,
+        MultiPolygon([Polygon([(170, 0), (190, 0), (190, 10), (170, 10)])]),
+        MultiPolygon([Polygon([(0, 0), (1, 1), (2, 2)])]),
+    ]
+    centroids = antimeridian.centroid_geoarrow(*shapely.to_ragged_array(geometries))
+    expected = numpy.array([antimeridian.centroids([g])[0] for g in geometries])
+    numpy.testing.assert_allclose(centroids, expected)
+    numpy.testing.assert_allclose(antimeridian.centroids(geometries), expected)
+
+
+@pytest.mark.parametrize(
+    "function", [antimeridian.bbox_geoarrow, antimeridian.centroid_geoarrow]
+)
+def test_geoarrow_unsupported(function: object) -> None:
+    with pytest.raises(ValueError):
+        function(*shapely.to_ragged_array([LineString([(0, 0), (1, 1)])]))  # type: ignore[operator]
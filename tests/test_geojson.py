@@ -1,11 +1,14 @@
+import concurrent.futures
 import copy
+from collections.abc import Callable
+from typing import Literal
 
 import pytest
 import shapely.geometry
 
 import antimeridian
 
-from .conftest import Reader
+from .conftest import FeatureCollectionReader, Reader
 
 
 @pytest.mark.parametrize("great_circle", [True, False])
@@ -58,3 +61,148 @@ def test_reverse(
         shapely.geometry.shape(fixed["geometry"]).normalize()
         == read_output("issues-164", subdirectory).normalize()
     )
+
+
+def test_fix_shape_unchanged_fast_path(read_input: Reader) -> None:
+    geometry = shapely.geometry.mapping(read_input("simple"))
+    stats = antimeridian.FixStats()
+    fixed = antimeridian.fix_shape(geometry, stats=stats)
+    assert fixed is geometry
+    assert stats == antimeridian.FixStats(unchanged=1, fixed=0)
+
+
+def test_fix_geojson_stats(read_feature_collection: FeatureCollectionReader) -> None:
+    feature_collection = read_feature_collection(["simple", "split", "line"])
+    stats = antimeridian.FixStats()
+    antimeridian.fix_geojson(feature_collection, stats=stats)
+    assert stats == antimeridian.FixStats(unchanged=1, fixed=2)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_fix_geojson_workers(
+    read_feature_collection: FeatureCollectionReader, executor: str
+) -> None:
+    feature_collection = read_feature_collection(
+        ["simple", "split", "line", "north-pole", "complex-split"]
+    )
+    serial = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    stats = antimeridian.FixStats()
+    parallel = antimeridian.fix_geojson(
+        feature_collection,
+        workers=2,
+        executor=executor,  # type: ignore[call-overload]
+        stats=stats,
+    )
+    assert parallel == serial
+    assert stats == antimeridian.FixStats(unchanged=1, fixed=4)
+
+
+@pytest.mark.parametrize(
+    "pool",
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+)
+def test_fix_geojson_shared_executor(
+    read_feature_collection: FeatureCollectionReader,
+    pool: Callable[[int], concurrent.futures.Executor],
+) -> None:
+    feature_collection = read_feature_collection(
+        ["simple", "split", "line", "north-pole", "complex-split"]
+    )
+    serial = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    with pool(2) as executor:
+        for _ in range(2):
+            parallel = antimeridian.fix_geojson(
+                copy.deepcopy(feature_collection), workers=2, executor=executor
+            )
+            assert parallel == serial
+
+
+def test_fix_shape_clockwise_is_not_unchanged(read_input: Reader) -> None:
+    geometry = shapely.geometry.mapping(read_input("cw-only"))
+    stats = antimeridian.FixStats()
+    fixed = antimeridian.fix_shape(geometry, fix_winding=True, stats=stats)
+    assert stats.fixed == 1
+    assert shapely.geometry.shape(fixed).exterior.is_ccw
+
+
+@pytest.mark.parametrize("name", ["simple", "split", "line"])
+def test_fix_shape_output(read_input: Reader, name: str) -> None:
+    geometry = shapely.geometry.mapping(read_input(name))
+    expected = shapely.geometry.shape(antimeridian.fix_shape(geometry))
+    assert antimeridian.fix_shape(geometry, output="shapely") == expected
+    wkb = antimeridian.fix_shape(geometry, output="wkb")
+    assert isinstance(wkb, bytes)
+    assert shapely.from_wkb(wkb) == expected
+
+
+def test_fix_shape_unsupported_output(read_input: Reader) -> None:
+    with pytest.raises(ValueError):
+        antimeridian.fix_shape(read_input("simple"), output="wkt")  # type: ignore[call-overload]
+
+
+def test_fix_geometry(read_input: Reader, read_output: Reader) -> None:
+    simple = read_input("simple")
+    stats = antimeridian.FixStats()
+    assert antimeridian.fix_geometry(simple, stats=stats) is simple
+    fixed = antimeridian.fix_geometry(read_input("split"), stats=stats)
+    assert fixed.normalize() == read_output("split", "spherical").normalize()
+    assert stats == antimeridian.FixStats(unchanged=1, fixed=1)
+    with pytest.raises(ValueError):
+        antimeridian.fix_geometry(shapely.geometry.Point(0, 0))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fix_geojson_output_shapely(
+    read_feature_collection: FeatureCollectionReader, workers: int
+) -> None:
+    names = ["simple", "split", "line"]
+    feature_collection = read_feature_collection(names)
+    expected = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    fixed = antimeridian.fix_geojson(
+        feature_collection, output="shapely", workers=workers, executor="thread"
+    )
+    for feature, expected_feature in zip(fixed["features"], expected["features"]):
+        assert isinstance(feature["geometry"], shapely.Geometry)
+        assert feature["geometry"] == shapely.geometry.shape(
+            expected_feature["geometry"]
+        )
+
+
+@pytest.mark.parametrize(
+    "workers,executor", [(1, "thread"), (2, "thread"), (2, "process")]
+)
+def test_fix_geojson_not_inplace(
+    read_input: Reader, workers: int, executor: Literal["thread", "process"]
+) -> None:
+    names = ["simple", "split", "line", "north-pole"]
+    features = [
+        {
+            "type": "Feature",
+            "geometry": shapely.geometry.mapping(read_input(name)),
+            "properties": {"name": name},
+        }
+        for name in names
+    ]
+    feature_collection = {"type": "FeatureCollection", "features": features}
+    original = copy.deepcopy(feature_collection)
+    expected = antimeridian.fix_geojson(copy.deepcopy(feature_collection))
+    fixed = antimeridian.fix_geojson(
+        feature_collection, inplace=False, workers=workers, executor=executor
+    )
+    assert feature_collection == original
+    assert fixed == expected
+    assert fixed is not feature_collection
+    assert fixed["features"] is not features
+    simple, split = features[:2]
+    assert fixed["features"][0] is simple
+    assert fixed["features"][1] is not split
+    assert fixed["features"][1]["properties"] is split["properties"]
+
+
+def test_fix_feature_not_inplace(read_input: Reader) -> None:
+    geometry = shapely.geometry.mapping(read_input("split"))
+    feature = {"type": "Feature", "geometry": geometry, "properties": {}}
+    fixed = antimeridian.fix_geojson(feature, inplace=False)
+    assert feature["geometry"] is geometry
+    assert fixed["geometry"] is not geometry
+    assert fixed["properties"] is feature["properties"]
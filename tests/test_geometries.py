@@ -0,0 +1,72 @@
+import numpy
+import pytest
+import shapely
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+
+import antimeridian
+
+from .conftest import Reader
+
+
+@pytest.mark.parametrize(
+    "subdirectory,great_circle",
+    [("flat", False), ("spherical", True)],
+)
+def test_fix_geometries(
+    read_input: Reader, read_output: Reader, subdirectory: str, great_circle: bool
+) -> None:
+    names = ["simple", "split", "complex-split", "north-pole", "multi-split", "line"]
+    input = numpy.array([read_input(name) for name in names])
+    fixed = antimeridian.fix_geometries(input, great_circle=great_circle)
+    assert fixed.shape == input.shape
+    for name, geometry in zip(names, fixed):
+        assert geometry.normalize() == read_output(name, subdirectory).normalize()
+
+
+def test_fix_geometries_passes_through_non_crossing(read_input: Reader) -> None:
+    simple = read_input("simple")
+    fixed = antimeridian.fix_geometries([simple, None, read_input("split")])
+    assert fixed[0] is simple
+    assert fixed[1] is None
+    assert isinstance(fixed[2], MultiPolygon)
+
+
+def test_fix_geometries_winding(read_input: Reader) -> None:
+    input = read_input("cw-only")
+    assert isinstance(input, Polygon)
+    with pytest.warns(antimeridian.FixWindingWarning):
+        fixed = antimeridian.fix_geometries([input])
+    assert shapely.is_ccw(fixed[0].exterior)
+
+
+def test_fix_geometries_line_strings() -> None:
+    line = LineString([(170, 0), (-170, 10)])
+    fixed = antimeridian.fix_geometries([line, line], great_circle=False)
+    for geometry in fixed:
+        assert geometry.geom_type == "MultiLineString"
+        assert len(geometry.geoms) == 2
+
+
+def test_fix_geometries_unsupported() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.fix_geometries([Point(0, 0)])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_fix_geometries_workers(read_input: Reader, executor: str) -> None:
+    names = ["simple", "split", "complex-split", "north-pole", "multi-split", "line"]
+    input = numpy.array([read_input(name) for name in names] * 4)
+    expected = antimeridian.fix_geometries(input)
+    fixed = antimeridian.fix_geometries(input, workers=3, executor=executor)  # type: ignore[arg-type]
+    assert all(shapely.equals_exact(a, b, 0) for a, b in zip(fixed, expected))
+
+
+def test_fix_geometries_winding_in_process_pool(read_input: Reader) -> None:
+    input = read_input("cw-only")
+    with pytest.warns(antimeridian.FixWindingWarning):
+        antimeridian.fix_geometries([input], workers=2)
+
+
+def test_fix_geometries_unknown_executor(read_input: Reader) -> None:
+    with pytest.raises(ValueError):
+        antimeridian.fix_geometries([read_input("split")], workers=2, executor="gpu")  # type: ignore[arg-type]
@@ -1,4 +1,5 @@
 import pytest
+from shapely.geometry import LineString
 
 import antimeridian
 
@@ -25,3 +26,9 @@ def test_multi_line_string(
     fixed = antimeridian.fix_multi_line_string(input, great_circle)
     assert fixed.is_valid
     assert fixed.normalize() == output.normalize()
+
+
+def test_crossing_line_string_with_z() -> None:
+    line_string = LineString([(170, 0, 1), (-170, 0, 2)])
+    with pytest.raises(ValueError, match="more than two dimensions"):
+        antimeridian.fix_line_string(line_string, great_circle=True)
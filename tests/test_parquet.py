@@ -0,0 +1,113 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+import shapely
+import shapely.geometry
+from pytest_console_scripts import ScriptRunner
+
+import antimeridian
+
+pytest.importorskip("click")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+NAMES = ["simple", "split", "complex-split", "north-pole", "line"]
+
+
+@pytest.fixture
+def geoparquet(input_path: Callable[[str], Path], tmp_path: Path) -> Path:
+    geometries = [
+        shapely.geometry.shape(json.loads(input_path(name).read_text()))
+        for name in NAMES
+    ]
+    table = pa.table(
+        {
+            "name": [*NAMES, "missing"],
+            "geometry": pa.array([*shapely.to_wkb(geometries), None], pa.binary()),
+        }
+    )
+    geo = {
+        "version": "1.0.0",
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "WKB",
+                "geometry_types": ["Polygon", "LineString"],
+                "bbox": [-180, -90, 180, 90],
+            }
+        },
+    }
+    table = table.replace_schema_metadata({"geo": json.dumps(geo)})
+    path = tmp_path / "input.parquet"
+    pq.write_table(table, path, row_group_size=4)
+    return path
+
+
+def test_fix_parquet(
+    script_runner: ScriptRunner, geoparquet: Path, tmp_path: Path
+) -> None:
+    outfile = tmp_path / "output.parquet"
+    result = script_runner.run(
+        ["antimeridian", "fix-parquet", str(geoparquet), str(outfile)]
+    )
+    assert result.success
+    assert result.stderr.strip() == "4 fixed, 1 unchanged"
+
+    parquet_file = pq.ParquetFile(outfile)
+    assert parquet_file.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column("name").to_pylist() == [*NAMES, "missing"]
+    input = shapely.from_wkb(pq.read_table(geoparquet).column("geometry").to_pylist())
+    fixed = shapely.from_wkb(table.column("geometry").to_pylist())
+    assert list(fixed) == list(antimeridian.fix_geometries(input))
+
+    bboxes = table.column("bbox").to_pylist()
+    assert bboxes[-1] is None
+    for geometry, bbox in zip(fixed[:-1], bboxes[:-1]):
+        expected = (
+            list(geometry.bounds)
+            if geometry.geom_type == "MultiLineString"
+            else antimeridian.bbox(geometry)
+        )
+        assert list(bbox.values()) == expected
+    assert bboxes[1]["xmin"] > bboxes[1]["xmax"]
+
+    geo = json.loads(table.schema.metadata[b"geo"])
+    assert geo["version"] == "1.1.0"
+    column = geo["columns"]["geometry"]
+    assert "bbox" not in column
+    assert column["covering"]["bbox"]["xmin"] == ["bbox", "xmin"]
+    assert set(column["geometry_types"]) == {
+        "Polygon",
+        "LineString",
+        "MultiPolygon",
+        "MultiLineString",
+    }
+
+
+def test_fix_parquet_jobs(
+    script_runner: ScriptRunner, geoparquet: Path, tmp_path: Path
+) -> None:
+    serial = tmp_path / "serial.parquet"
+    parallel = tmp_path / "parallel.parquet"
+    assert script_runner.run(
+        ["antimeridian", "fix-parquet", str(geoparquet), str(serial)]
+    ).success
+    assert script_runner.run(
+        ["antimeridian", "fix-parquet", "-j", "2", str(geoparquet), str(parallel)]
+    ).success
+    assert pq.read_table(parallel).equals(pq.read_table(serial))
+
+
+def test_fix_parquet_not_geoparquet(
+    script_runner: ScriptRunner, tmp_path: Path
+) -> None:
+    path = tmp_path / "input.parquet"
+    pq.write_table(pa.table({"a": [1]}), path)
+    result = script_runner.run(
+        ["antimeridian", "fix-parquet", str(path), str(tmp_path / "output.parquet")]
+    )
+    assert not result.success
+    assert "not a GeoParquet file" in result.stderr
@@ -1,6 +1,8 @@
 from typing import cast
 
+import numpy
 import pytest
+import shapely
 import shapely.affinity
 import shapely.geometry
 from shapely.geometry import MultiPolygon, Point, Polygon
@@ -237,6 +239,47 @@ def test_centroid_split_with_shift(read_input: Reader) -> None:
     assert centroid.y == 45
 
 
+@pytest.mark.parametrize(
+    "name", ["simple", "split", "complex-split", "multi-split", "north-pole"]
+)
+def test_centroids(read_output: Reader, name: str) -> None:
+    shape = read_output(name)
+    centroid = cast(Point, antimeridian.centroid(shape))
+    centroids = antimeridian.centroids([shape, None])
+    # A centroid on the antimeridian can come out on either side of it.
+    assert abs(centroids[0, 0]) % 360 == pytest.approx(abs(centroid.x) % 360)
+    assert centroids[0, 1] == pytest.approx(centroid.y)
+    assert numpy.isnan(centroids[1]).all()
+
+
+def test_centroids_overlapping_parts() -> None:
+    shape = MultiPolygon(
+        [
+            Polygon([(170, 0), (180, 0), (180, 10), (170, 10)]),
+            Polygon([(175, 5), (180, 5), (180, 15), (175, 15)]),
+            Polygon([(-180, 0), (-175, 0), (-175, 10), (-180, 10)]),
+        ]
+    )
+    centroid = cast(Point, antimeridian.centroid(shape))
+    assert antimeridian.centroids([shape])[0].tolist() == pytest.approx(
+        [centroid.x, centroid.y]
+    )
+
+
+def test_centroids_spherical(read_output: Reader) -> None:
+    simple = read_output("simple")
+    centroids = antimeridian.centroids([simple, read_output("split")], spherical=True)
+    assert centroids[0, 0] == pytest.approx(95)
+    assert centroids[0, 1] == pytest.approx(45, abs=0.1)
+    assert abs(centroids[1, 0]) == pytest.approx(180)
+    assert centroids[1, 1] == pytest.approx(45, abs=0.1)
+
+
+def test_centroids_unsupported() -> None:
+    with pytest.raises(ValueError):
+        antimeridian.centroids([Point(0, 0)])
+
+
 def test_z_coordinates() -> None:
     # https://github.com/gadomski/antimeridian/issues/115
     polygon = Polygon([[0, 0, 1], [10, 0, 2], [10, 10, 3], [0, 10, 4]])
@@ -278,3 +321,31 @@ def test_invalid_polygon(read_input: Reader) -> None:
     with pytest.warns(FixWindingWarning):
         with pytest.raises(ValueError):
             antimeridian.fix_polygon(input)
+
+
+def test_many_crossings() -> None:
+    # A comb whose teeth cross the antimeridian far more often than the
+    # recursion limit would allow, if we joined segments recursively.
+    teeth = 1000
+    latitudes = [-80 + 160 * i / (2 * teeth) for i in range(2 * teeth + 1)]
+    coords = []
+    for south, north in zip(latitudes[0:-1:2], latitudes[1::2]):
+        coords += [(170, south), (-170, south), (-170, north), (170, north)]
+    coords += [(160, 80), (160, -80)]
+    fixed = antimeridian.fix_polygon(Polygon(coords))
+    assert isinstance(fixed, MultiPolygon)
+    assert len(fixed.geoms) == teeth + 1
+    assert fixed.is_valid
+
+
+def test_crossing_polygon_with_z() -> None:
+    polygon = Polygon([(170, 0, 1), (-170, 0, 2), (-170, 10, 3), (170, 10, 4)])
+    with pytest.raises(ValueError, match="more than two dimensions"):
+        antimeridian.fix_polygon(polygon)
+    # Shapes that don't cross keep their Z coordinates.
+    polygon = Polygon([(10, 0, 1), (20, 0, 2), (20, 10, 3), (10, 10, 4)])
+    fixed = antimeridian.fix_polygon(polygon)
+    assert numpy.array_equal(
+        shapely.get_coordinates(fixed, include_z=True),
+        shapely.get_coordinates(polygon, include_z=True),
+    )
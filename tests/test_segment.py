@@ -28,3 +28,15 @@ def test_fix_feature_collection(read_input: Reader, great_circle: bool) -> None:
         feature_collection, great_circle=great_circle
     )
     assert len(segments.geoms)
+
+
+@pytest.mark.parametrize("great_circle", [True, False])
+def test_segment_endpoints_on_antimeridian(
+    read_input: Reader, great_circle: bool
+) -> None:
+    input = read_input("complex-split")
+    segments = antimeridian.segment_shape(input, great_circle)
+    assert len(segments) > 2
+    for segment in segments:
+        assert abs(segment[0][0]) == 180
+        assert abs(segment[-1][0]) == 180
@@ -0,0 +1,47 @@
+import numpy
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+
+import antimeridian
+
+from .conftest import Reader
+
+
+def test_fix_wkb(read_input: Reader, read_output: Reader) -> None:
+    fixed = antimeridian.fix_wkb(shapely.to_wkb(read_input("split")))
+    assert isinstance(fixed, bytes)
+    assert (
+        shapely.from_wkb(fixed).normalize()
+        == read_output("split", "spherical").normalize()
+    )
+
+
+def test_fix_wkb_hex(read_input: Reader, read_output: Reader) -> None:
+    fixed = antimeridian.fix_wkb(shapely.to_wkb(read_input("split"), hex=True))
+    assert isinstance(fixed, str)
+    assert (
+        shapely.from_wkb(fixed).normalize()
+        == read_output("split", "spherical").normalize()
+    )
+
+
+def test_fix_wkb_array(read_input: Reader) -> None:
+    names = ["simple", "split", "line"]
+    input = numpy.array([*shapely.to_wkb([read_input(name) for name in names]), None])
+    stats = antimeridian.FixStats()
+    fixed = antimeridian.fix_wkb(input, stats=stats)
+    assert fixed.shape == input.shape
+    assert fixed[0] is input[0]
+    assert fixed[3] is None
+    expected = antimeridian.fix_geometries([read_input(name) for name in names])
+    assert list(shapely.from_wkb(fixed[:3])) == list(expected)
+    assert stats.fixed == 2
+    assert stats.unchanged == 1
+
+
+def test_fix_wkb_keeps_srid() -> None:
+    polygon = Polygon([(170, 0), (-170, 0), (-170, 10), (170, 10)])
+    input = shapely.to_wkb(shapely.set_srid(polygon, 4326), include_srid=True)
+    fixed = shapely.from_wkb(antimeridian.fix_wkb(input))
+    assert isinstance(fixed, MultiPolygon)
+    assert shapely.get_srid(fixed) == 4326